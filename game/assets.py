@@ -0,0 +1,282 @@
+"""
+에셋 매니페스트와 공용 캐시
+시작 시 텍스처/사운드를 백그라운드에서 미리 읽고, 이후에는 이름으로 캐시에서 꺼내 씀
+"""
+from direct.gui.DirectGui import DirectFrame
+from direct.gui.OnscreenText import OnscreenText
+from panda3d.core import Filename, TexturePool, TextNode, TextureStage
+import json
+import os
+import queue
+import threading
+import time
+
+
+# 게임에서 쓰는 에셋 목록 (이름 -> 경로)
+ASSET_MANIFEST = {
+    'textures': {
+        'bullet': "textures/bullet.png",
+        'bullet2': "textures/bullet2.png",
+        'bullet3': "textures/bullet3.png",
+        'stone': "textures/stone.png",
+        'crate': "textures/crate.png",
+        'brick': "textures/brick.png",
+        'cloud': "textures/cloud.png",
+        'basic_gun': "textures/basicGun.png",
+        'basic_gun2': "textures/basicGun2.png",
+        'sun': "textures/sun.png",
+    },
+    'sounds': {
+        'gun_shot': "sounds/gun_shot.wav",
+        'gun_reload': "sounds/gun_reload.wav",
+        'empty_click': "sounds/empty_click.wav",
+        'target_hit': "sounds/target_hit.wav",
+    },
+}
+
+# 오프라인 빌드 결과 위치 (tools/build_atlas.py)
+CACHE_DIR = "textures/cache"
+
+# 아틀라스 한 장에 묶는 스프라이트 (빌보드/HUD 이미지, 반복 타일링 텍스처는 제외)
+ATLAS_NAME = "sprites"
+ATLAS_SPRITES = ('bullet', 'bullet2', 'bullet3', 'cloud', 'basic_gun', 'basic_gun2', 'sun')
+
+# 텍스처 전체 UV
+FULL_RECT = (0.0, 0.0, 1.0, 1.0)
+
+
+class AssetCache:
+    """이름으로 찾는 텍스처 캐시 (없는 파일도 한 번만 확인하고 기억)"""
+
+    def __init__(self, game):
+        self.game = game
+        self.textures = {}      # 이름 -> Texture (파일이 없으면 None)
+        self.atlas = None       # 스프라이트 아틀라스 텍스처 (빌드하지 않았으면 None)
+        self.sprite_rects = {}  # 스프라이트 이름 -> 아틀라스 UV (u0, v0, u1, v1)
+        self.sounds = {}        # 이름 -> 미리 읽은 AudioSound (오디오 데이터 캐시 예열용)
+        self.load_times = {}    # 이름 -> 로드 시간 (ms)
+        self.hits = 0
+        self.misses = 0
+        self.preload_time = 0.0
+
+        self._results = queue.Queue()  # 백그라운드 스레드 -> 메인 스레드
+        self._pending = 0
+        self._total = 0
+        self._on_done = None
+        self._on_progress = None
+        self._start_time = 0.0
+
+    def texture(self, name):
+        """텍스처 반환 (캐시에 없으면 동기 로드, 파일이 없으면 None)"""
+        if name in self.textures:
+            self.hits += 1
+            return self.textures[name]
+
+        self.misses += 1
+        path = ASSET_MANIFEST['textures'].get(name)
+        if path is None:
+            print(f"[Assets] 매니페스트에 없는 텍스처: {name}")
+            self.textures[name] = None
+            return None
+
+        self._store_texture(name, *self._read_texture(name, path))
+        return self.textures[name]
+
+    def sprite(self, name):
+        """스프라이트의 (텍스처, UV 사각형) - 아틀라스에 있으면 아틀라스, 없으면 개별 텍스처 전체"""
+        rect = self.sprite_rects.get(name)
+        if rect is not None:
+            self.hits += 1
+            return self.atlas, rect
+        return self.texture(name), FULL_RECT
+
+    def apply_uv(self, nodepath, rect):
+        """UV 0~1로 만든 노드(OnscreenImage 등)가 아틀라스의 rect 영역만 보이도록 텍스처 변환"""
+        if rect == FULL_RECT:
+            return
+        u0, v0, u1, v1 = rect
+        stage = TextureStage.getDefault()
+        nodepath.setTexOffset(stage, u0, v0)
+        nodepath.setTexScale(stage, u1 - u0, v1 - v0)
+
+    def _read_texture(self, name, path):
+        """텍스처 파일 읽기 (텍스처, 걸린 시간 ms) - 빌드된 .txo 캐시가 있으면 우선 사용"""
+        start = time.perf_counter()
+        texture = None
+        cached = os.path.join(CACHE_DIR, f"{name}.txo")
+        if os.path.exists(cached):
+            texture = TexturePool.loadTexture(Filename.fromOsSpecific(cached))
+        elif os.path.exists(path):
+            texture = TexturePool.loadTexture(Filename.fromOsSpecific(path))
+        return texture, (time.perf_counter() - start) * 1000.0
+
+    def _read_atlas(self):
+        """아틀라스 읽기 ((텍스처, UV 목록), 걸린 시간 ms) - 빌드하지 않았으면 (None, 0)"""
+        start = time.perf_counter()
+        atlas_path = os.path.join(CACHE_DIR, f"{ATLAS_NAME}.txo")
+        rects_path = os.path.join(CACHE_DIR, f"{ATLAS_NAME}.json")
+        if not (os.path.exists(atlas_path) and os.path.exists(rects_path)):
+            return None, 0.0
+
+        with open(rects_path) as f:
+            rects = {name: tuple(rect) for name, rect in json.load(f)['sprites'].items()}
+        texture = TexturePool.loadTexture(Filename.fromOsSpecific(atlas_path))
+        return (texture, rects), (time.perf_counter() - start) * 1000.0
+
+    def _store_atlas(self, result, elapsed_ms):
+        """아틀라스 로드 결과 기록"""
+        if result is None or result[0] is None:
+            return
+        self.atlas, self.sprite_rects = result
+        self.load_times[ATLAS_NAME] = elapsed_ms
+        print(f"[Assets] 아틀라스 로드: {ATLAS_NAME} (스프라이트 {len(self.sprite_rects)}개)")
+
+    def _store_texture(self, name, texture, elapsed_ms):
+        """로드 결과 기록"""
+        self.textures[name] = texture
+        self.load_times[name] = elapsed_ms
+        if texture is None:
+            print(f"[Assets] 파일 없음: {ASSET_MANIFEST['textures'][name]}")
+
+    def preload(self, on_done, on_progress=None):
+        """매니페스트 전체를 비동기로 미리 읽음 (완료 시 on_done 호출)"""
+        self._on_done = on_done
+        self._on_progress = on_progress
+        self._start_time = time.perf_counter()
+
+        textures = [
+            (name, path) for name, path in ASSET_MANIFEST['textures'].items()
+            if name not in self.textures
+        ]
+        sounds = [
+            (name, path) for name, path in ASSET_MANIFEST['sounds'].items()
+            if os.path.exists(path)
+        ]
+        self._total = len(textures) + len(sounds) + 1  # +1: 아틀라스
+        self._pending = self._total
+
+        # 텍스처: 백그라운드 스레드에서 디스크 읽기/디코딩 (아틀라스 먼저)
+        threading.Thread(
+            target=self._texture_worker, args=(textures,), name="asset-preload", daemon=True
+        ).start()
+
+        # 사운드: Panda3D 비동기 로더
+        if getattr(self.game, 'sfxManagerList', None):
+            for name, path in sounds:
+                self.game.loader.loadSfx(
+                    path, callback=self._on_sound_loaded, extraArgs=[name, time.perf_counter()]
+                )
+        else:
+            self._pending -= len(sounds)
+
+        self.game.taskMgr.add(self._poll_task, 'asset_preload')
+
+    def _texture_worker(self, textures):
+        """백그라운드 스레드: 아틀라스와 텍스처를 읽어 결과 큐에 넣음"""
+        try:
+            result, elapsed_ms = self._read_atlas()
+        except Exception as e:
+            print(f"[Assets] 아틀라스 로드 에러: {e}")
+            result, elapsed_ms = None, 0.0
+        self._results.put((None, result, elapsed_ms))
+
+        for name, path in textures:
+            # 아틀라스에 들어 있는 스프라이트는 개별로 읽지 않음
+            if result is not None and result[0] is not None and name in result[1]:
+                self._results.put((name, False, 0.0))
+                continue
+            try:
+                texture, elapsed_ms = self._read_texture(name, path)
+            except Exception as e:
+                print(f"[Assets] 텍스처 로드 에러 ({path}): {e}")
+                texture, elapsed_ms = None, 0.0
+            self._results.put((name, texture, elapsed_ms))
+
+    def _on_sound_loaded(self, sound, name, start):
+        """사운드 비동기 로드 완료 (메인 스레드)"""
+        self.sounds[name] = sound
+        self.load_times[name] = (time.perf_counter() - start) * 1000.0
+        self._pending -= 1
+        self._report_progress()
+
+    def _poll_task(self, task):
+        """메인 스레드: 완료된 텍스처 반영, 모두 끝나면 on_done 호출"""
+        while True:
+            try:
+                name, texture, elapsed_ms = self._results.get_nowait()
+            except queue.Empty:
+                break
+            if name is None:
+                self._store_atlas(texture, elapsed_ms)
+            elif texture is not False and name not in self.textures:
+                self._store_texture(name, texture, elapsed_ms)
+            self._pending -= 1
+            self._report_progress()
+
+        if self._pending > 0:
+            return task.cont
+
+        self.preload_time = (time.perf_counter() - self._start_time) * 1000.0
+        self.report()
+        if self._on_done:
+            on_done, self._on_done = self._on_done, None
+            on_done()
+        return task.done
+
+    def _report_progress(self):
+        """진행 상황 알림"""
+        if self._on_progress:
+            self._on_progress(self._total - self._pending, self._total)
+
+    def report(self):
+        """로드 시간 요약 출력"""
+        slowest = sorted(self.load_times.items(), key=lambda item: item[1], reverse=True)[:3]
+        slowest_text = ", ".join(f"{name} {ms:.1f}ms" for name, ms in slowest)
+        print(f"[Assets] 미리 읽기 완료: {len(self.load_times)}개, {self.preload_time:.1f}ms (가장 느림: {slowest_text})")
+
+    def get_stats(self):
+        """캐시 통계"""
+        return {
+            'textures': sum(1 for texture in self.textures.values() if texture is not None),
+            'missing': sum(1 for texture in self.textures.values() if texture is None),
+            'atlas_sprites': len(self.sprite_rects),
+            'hits': self.hits,
+            'misses': self.misses,
+            'preload_ms': self.preload_time,
+        }
+
+    def cleanup(self):
+        """정리"""
+        self.game.taskMgr.remove('asset_preload')
+        self.textures.clear()
+        self.sounds.clear()
+
+
+class LoadingScreen:
+    """에셋을 미리 읽는 동안 보이는 로딩 화면"""
+
+    def __init__(self, game):
+        self.game = game
+        self.frame = DirectFrame(
+            frameSize=(-2, 2, -1, 1),
+            frameColor=(0.05, 0.05, 0.08, 1)
+        )
+        self.text = OnscreenText(
+            text="LOADING...",
+            pos=(0, 0),
+            scale=0.08,
+            fg=(1, 0.8, 0.2, 1),
+            align=TextNode.ACenter,
+            parent=self.frame,
+            mayChange=True
+        )
+
+    def set_progress(self, done, total):
+        """진행률 표시"""
+        self.text.setText(f"LOADING... {done}/{total}")
+
+    def destroy(self):
+        """로딩 화면 제거"""
+        if self.frame:
+            self.frame.destroy()
+            self.frame = None
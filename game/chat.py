@@ -1,6 +1,9 @@
 from direct.gui.DirectGui import DirectEntry, DirectLabel, DGG
 from panda3d.core import TextNode, Vec4
 import time
+from game import recipes
+from game.log import set_level
+from game.settings import SETTINGS_SCHEMA
 
 
 class ChatSystem:
@@ -10,8 +13,12 @@ class ChatSystem:
         self.max_messages = 8  # 표시할 최대 메시지 수
         self.is_chat_open = False  # 채팅창 열림 상태
 
-        # 채팅 UI 생성
-        self._create_chat_ui()
+        # 채팅 UI는 처음 열 때 생성 (그 전 메시지는 self.messages에만 쌓임)
+        self.chat_display = None
+        self.chat_entry = None
+
+        # 안내 메시지
+        self._add_system_message("Press T to open chat")
 
         print("[Chat] 채팅 시스템 초기화 완료")
 
@@ -46,8 +53,8 @@ class ChatSystem:
         )
         self.chat_entry.hide()
 
-        # 안내 메시지 표시
-        self._add_system_message("Press T to open chat")
+        # 생성 전에 쌓인 메시지 반영
+        self._update_chat_display()
 
     def _send_message(self, text):
         """메시지 전송 (영어만 허용)"""
@@ -95,18 +102,25 @@ class ChatSystem:
                 "/clear - Clear chat history",
                 "/inv - Show inventory",
                 "/tools - Show all tools",
-                "/craft [item] - Craft item (ladder, wall, furnace, campfire)",
+                f"/craft [item] [count] - Craft item ({', '.join(recipes.CRAFTABLE_ITEMS)})",
                 "/target on - Spawn target in front of you",
                 "/target off - Clear all targets",
                 "/spawn [type] - Spawn enemy (melee, ranged, sprinter, tank, bomber)",
                 "/weapon - Show current weapon info",
                 "/attach [id] - Install attachment (see /attach list)",
                 "/detach [slot] - Remove attachment (scope/grip/muzzle/magazine)",
-                "/repair - Repair current weapon (cost: Wood 5, Stone 3)",
+                f"/repair - Repair current weapon (cost: {recipes.format_cost(recipes.get_cost('repair_weapon'))})",
                 "/equip [slot] - Equip tool from slot (1-6)",
                 "/drop - Drop current tool",
-                "/repair_tool - Repair current tool (cost: Wood 3, Stone 2)",
-                "/debug_tools - Debug: Give tools for testing"
+                f"/repair_tool - Repair current tool (cost: {recipes.format_cost(recipes.get_cost('repair_tool'))})",
+                "/debug_tools - Debug: Give tools for testing",
+                "/hud - Show HUD text rebuild stats",
+                "/stats - Show accuracy, time-to-kill and death hotspots",
+                "/settings - Show settings",
+                "/set [key] [value] - Change setting (saved automatically)",
+                "/save - Save game now (also autosaves)",
+                "/load - Load last save",
+                "/log [subsystem] [level] - Set log level (player, enemy, sound, resource, obstacle, default)"
             ]
             for line in help_text:
                 self._add_system_message(line)
@@ -187,17 +201,14 @@ class ChatSystem:
 
         elif cmd == '/repair_tool':
             # 도구 수리
-            wood_cost = 3
-            stone_cost = 2
+            cost = recipes.format_cost(recipes.get_cost('repair_tool'))
             if self.game.player.current_tool:
-                if (self.game.player.get_resource_count('wood') >= wood_cost and
-                    self.game.player.get_resource_count('stone') >= stone_cost):
-                    self.game.player.use_resources({'wood': wood_cost, 'stone': stone_cost})
-                    new_durability = self.game.player.current_tool.repair()
+                if self.game.player.craft('repair_tool'):
+                    new_durability = self.game.player.current_tool.get_durability_percentage()
                     self._add_system_message(f"Tool repaired! Durability: {new_durability}%")
-                    self._add_system_message(f"Cost: Wood -{wood_cost}, Stone -{stone_cost}")
+                    self._add_system_message(f"Cost: {cost}")
                 else:
-                    self._add_system_message(f"Not enough resources! Need: Wood {wood_cost}, Stone {stone_cost}")
+                    self._add_system_message(f"Not enough resources! Need: {cost}")
             else:
                 self._add_system_message("No tool equipped to repair")
 
@@ -207,33 +218,30 @@ class ChatSystem:
 
             if len(parts) < 2:
                 # 레시피 표시
-                recipes = [
-                    "Crafting Recipes:",
-                    "/craft ladder - Ladder (Wood: 10)",
-                    "/craft wall - Wall (Wood: 15, Stone: 5)",
-                    "/craft furnace - Furnace (Stone: 20)",
-                    "/craft campfire - Campfire (Wood: 5, Stone: 3)"
-                ]
-                for line in recipes:
-                    self._add_system_message(line)
+                self._add_system_message("Crafting Recipes:")
+                for item_type in recipes.CRAFTABLE_ITEMS:
+                    recipe = recipes.get_recipe(item_type)
+                    self._add_system_message(
+                        f"/craft {item_type} - {recipe['name']} ({recipes.format_cost(recipe['cost'])})"
+                    )
             else:
                 item_type = parts[1].lower()
-                valid_items = ['ladder', 'wall', 'furnace', 'campfire']
+                count = int(parts[2]) if len(parts) > 2 and parts[2].isdigit() else 1
 
-                if item_type not in valid_items:
+                if item_type not in recipes.CRAFTABLE_ITEMS:
                     self._add_system_message(f"Unknown item: {item_type}")
-                    self._add_system_message("Valid items: ladder, wall, furnace, campfire")
+                    self._add_system_message(f"Valid items: {', '.join(recipes.CRAFTABLE_ITEMS)}")
                 else:
                     # 조합 시도
-                    if self.game.player.craft_item(item_type):
-                        self._add_system_message(f"Successfully crafted: {item_type}")
+                    if self.game.player.craft(item_type, count):
+                        self._add_system_message(f"Successfully crafted: {item_type} x{count}")
 
                         # 현재 인벤토리도 표시
                         wood = self.game.player.get_resource_count('wood')
                         stone = self.game.player.get_resource_count('stone')
                         self._add_system_message(f"Inventory: Wood: {wood}, Stone: {stone}")
                     else:
-                        self._add_system_message(f"Failed to craft: {item_type} (not enough resources)")
+                        self._add_system_message(f"Failed to craft: {item_type} x{count}")
 
         elif cmd == '/target on':
             self.game.targets.show_targets()
@@ -335,16 +343,86 @@ class ChatSystem:
 
         elif cmd == '/repair':
             # 무기 수리
-            wood_cost = 5
-            stone_cost = 3
-            if (self.game.player.get_resource_count('wood') >= wood_cost and
-                self.game.player.get_resource_count('stone') >= stone_cost):
-                self.game.player.use_resources({'wood': wood_cost, 'stone': stone_cost})
-                new_durability = self.game.player.repair_weapon()
+            cost = recipes.format_cost(recipes.get_cost('repair_weapon'))
+            if self.game.player.craft('repair_weapon'):
+                new_durability = self.game.player.current_weapon.get_durability_percentage()
                 self._add_system_message(f"Weapon repaired! Durability: {new_durability}%")
-                self._add_system_message(f"Cost: Wood -{wood_cost}, Stone -{stone_cost}")
+                self._add_system_message(f"Cost: {cost}")
+            else:
+                self._add_system_message(f"Not enough resources! Need: {cost}")
+
+        elif cmd.startswith('/log'):
+            # 서브시스템 로그 레벨 변경
+            parts = cmd.split()
+            levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR']
+            if len(parts) < 3 or parts[2].upper() not in levels:
+                self._add_system_message(f"Usage: /log [subsystem] [{'/'.join(levels)}]")
+            else:
+                set_level(parts[1], parts[2].upper())
+                self._add_system_message(f"Log level: {parts[1]} -> {parts[2].upper()}")
+
+        elif cmd == '/stats':
+            # 텔레메트리 분석 (전체 세션 누적)
+            telemetry = self.game.telemetry
+            for weapon, shots, hits, accuracy in telemetry.accuracy_per_weapon():
+                self._add_system_message(f"{weapon}: {hits}/{shots} hits ({accuracy * 100:.0f}%)")
+            for enemy_type, kills, avg_ttk in telemetry.time_to_kill():
+                self._add_system_message(f"{enemy_type}: {kills} kills, avg TTK {avg_ttk:.1f}s")
+            hotspots = telemetry.death_heatmap(limit=3)
+            if hotspots:
+                self._add_system_message("Deaths: " + ", ".join(
+                    f"({cx}, {cy}) x{deaths}" for cx, cy, deaths in hotspots
+                ))
+
+        elif cmd == '/settings':
+            # 설정 목록
+            for key in SETTINGS_SCHEMA:
+                self._add_system_message(f"{key} = {self.game.settings.get(key)}")
+
+        elif cmd.startswith('/set '):
+            # 설정 변경
+            parts = cmd.split()
+            if len(parts) != 3 or parts[1] not in SETTINGS_SCHEMA:
+                self._add_system_message(f"Usage: /set [{'/'.join(SETTINGS_SCHEMA)}] [value]")
+            else:
+                try:
+                    self.game.settings.set(parts[1], parts[2])
+                    self._add_system_message(f"{parts[1]} = {self.game.settings.get(parts[1])}")
+                except ValueError:
+                    self._add_system_message(f"Invalid value: {parts[2]}")
+
+        elif cmd == '/save':
+            if self.game.saves.save():
+                self._add_system_message("Saving...")
+            else:
+                self._add_system_message("Save already in progress")
+
+        elif cmd == '/load':
+            if self.game.saves.load():
+                self._add_system_message("Game loaded")
             else:
-                self._add_system_message(f"Not enough resources! Need: Wood {wood_cost}, Stone {stone_cost}")
+                self._add_system_message("No save to load")
+
+        elif cmd == '/hud':
+            # HUD 텍스트 재생성 통계
+            stats = self.game.hud.get_stats()
+            self._add_system_message(
+                f"HUD - Bindings: {stats['bindings']}, "
+                f"Rebuilds/s: {stats['rebuilds_per_second']:.1f}, "
+                f"Total: {stats['total_rebuilds']}"
+            )
+            self._add_system_message(f"Glyph cell UV writes: {self.game.glyphs.uv_writes}")
+            asset_stats = self.game.assets.get_stats()
+            self._add_system_message(
+                f"Assets: {asset_stats['textures']} textures ({asset_stats['missing']} missing), "
+                f"hits {asset_stats['hits']}, misses {asset_stats['misses']}, "
+                f"preload {asset_stats['preload_ms']:.0f}ms"
+            )
+            sound_stats = self.game.sound.get_stats()
+            self._add_system_message(
+                f"Sound voices: {sound_stats['playing']}/{sound_stats['voices']} playing, "
+                f"3D emitters: {sound_stats['emitters']}, culled: {sound_stats['culled']}"
+            )
 
         else:
             self._add_system_message(f"Unknown command: {command}")
@@ -377,7 +455,10 @@ class ChatSystem:
         self._update_chat_display()
 
     def _update_chat_display(self):
-        """채팅 표시 업데이트"""
+        """채팅 표시 업데이트 (UI가 아직 없으면 열 때 반영)"""
+        if self.chat_display is None:
+            return
+
         # 최근 N개 메시지만 표시 (줄바꿈으로 구분)
         display_messages = self.messages[-self.max_messages:]
         full_text = "\n".join(display_messages)
@@ -385,6 +466,9 @@ class ChatSystem:
 
     def open_chat(self):
         """채팅 열기"""
+        if self.chat_display is None:
+            self._create_chat_ui()
+
         self.is_chat_open = True
         self.chat_display.show()  # 메시지 표시 영역도 표시
         self.chat_entry.show()
@@ -400,9 +484,10 @@ class ChatSystem:
     def close_chat(self):
         """채팅 닫기"""
         self.is_chat_open = False
-        self.chat_entry['focus'] = 0
-        self.chat_entry.hide()
-        self.chat_display.hide()  # 메시지 표시 영역도 숨김
+        if self.chat_entry:
+            self.chat_entry['focus'] = 0
+            self.chat_entry.hide()
+            self.chat_display.hide()  # 메시지 표시 영역도 숨김
 
         # 마우스 다시 숨기고 중앙으로
         from panda3d.core import WindowProperties
@@ -7,6 +7,42 @@ WINDOW_TITLE = "ArenaPulse"
 
 # 데이터베이스 설정
 DATABASE_PATH = "data/game.db"
+DB_WRITE_QUEUE_SIZE = 4096    # 쓰기 대기 큐 크기 (가득 차면 게임 스레드가 기다림)
+DB_BATCH_WINDOW = 0.016       # 이 시간(초) 안에 들어온 쓰기는 한 트랜잭션으로 묶음
 
 # 게임 설정
 FPS = 60
+
+# 월드 설정 (청크 단위 스트리밍)
+WORLD_SEED = 1337             # 월드 생성 시드 (같은 시드 = 같은 월드)
+CHUNK_SIZE = 64.0             # 청크 한 변 길이
+VIEW_RADIUS_CHUNKS = 2        # 플레이어 주변 로드 반경 (청크 수)
+MAX_LOADED_CHUNKS = 36        # 동시에 유지할 최대 청크 수 (메모리 예산)
+CHUNK_BUILD_BUDGET_MS = 2.0   # 프레임당 청크 생성에 쓸 최대 시간
+WORLD_RADIUS_CHUNKS = 64      # 월드 경계 (원점에서 청크 수, 벗어나면 게임 오버)
+
+# 로그 설정
+LOG_PROFILE = "development"   # "production"이면 핫 경로 로그(사격, 명중, 재생 등)를 no-op으로 대체
+LOG_LEVELS = {                # 서브시스템별 레벨 ('default'는 나머지 전체)
+    'default': 'INFO',
+    'player': 'INFO',
+    'enemy': 'INFO',
+    'sound': 'WARNING',
+    'resource': 'INFO',
+    'obstacle': 'WARNING',
+}
+LOG_BUFFER_SIZE = 1024        # 출력 대기 링 버퍼 크기 (넘치면 오래된 것부터 버림)
+LOG_RATE_LIMIT = 5            # 같은 메시지의 초당 최대 출력 횟수 (나머지는 개수만 요약)
+
+# 시작 시간 측정
+STARTUP_PROFILE = False       # True면 서브시스템별 import/생성 시간 출력 + 벤치마크 기록
+BENCHMARK_PATH = "data/benchmarks.jsonl"   # 벤치마크 결과 (한 줄에 측정 하나)
+
+# 게임플레이 텔레메트리
+TELEMETRY_ENABLED = True
+TELEMETRY_BUFFER_SIZE = 4096      # 미리 잡아 두는 이벤트 버퍼 크기 (가득 차면 바로 내보냄)
+TELEMETRY_FLUSH_INTERVAL = 5.0    # 버퍼를 DB 쓰기 스레드로 넘기는 간격 (초)
+
+# 세이브
+SAVE_PATH = "data/savegame.bin"   # 스냅샷 파일 (zlib 압축 바이너리)
+AUTOSAVE_INTERVAL = 60.0          # 자동 저장 간격 (초, 0이면 끔)
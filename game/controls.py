@@ -1,5 +1,6 @@
 from panda3d.core import Point3, Vec3, WindowProperties
 from game.pause_menu import PauseMenu
+from game import recipes
 
 
 class Controls:
@@ -8,8 +9,9 @@ class Controls:
         self.player = player
         self.paused = False
 
-        # 마우스 감도
+        # 마우스 감도 (설정 캐시 값을 따름)
         self.mouse_sensitivity = 100.0
+        self.game.settings.add_listener('mouse_sensitivity', self._on_sensitivity_changed)
 
         # 마우스 숨기기
         self._setup_mouse_mode()
@@ -235,17 +237,10 @@ class Controls:
     def _repair_weapon(self):
         """무기 수리"""
         if not self.paused and not self.game.game_over:
-            # 리소스 소모해서 수리
-            wood_cost = 5
-            stone_cost = 3
-
-            if (self.player.get_resource_count('wood') >= wood_cost and
-                self.player.get_resource_count('stone') >= stone_cost):
-                self.player.use_resources({'wood': wood_cost, 'stone': stone_cost})
-                self.player.repair_weapon()
-                print(f"[Player] 무기 수리 완료! (나무 -{wood_cost}, 돌 -{stone_cost})")
-            else:
-                print(f"[Player] 수리에 필요한 리소스 부족! (나무 {wood_cost}, 돌 {stone_cost} 필요)")
+            # 리소스 소모해서 수리 (비용은 레시피 레지스트리 기준)
+            if not self.player.craft('repair_weapon'):
+                cost = recipes.format_cost(recipes.get_cost('repair_weapon'))
+                print(f"[Player] 수리에 필요한 리소스 부족! ({cost} 필요)")
 
     def _toggle_pause(self):
         """일시정지 토글"""
@@ -308,6 +303,10 @@ class Controls:
             # 마우스를 화면 중앙으로 리셋
             self._center_mouse()
 
+    def _on_sensitivity_changed(self, key, value):
+        """마우스 감도 설정 반영"""
+        self.mouse_sensitivity = value
+
     def is_paused(self):
         """일시정지 상태 반환"""
         return self.paused
@@ -319,5 +318,6 @@ class Controls:
         props.setMouseMode(WindowProperties.M_absolute)
         self.game.win.requestProperties(props)
         self.game.ignoreAll()
+        self.game.settings.remove_listener('mouse_sensitivity', self._on_sensitivity_changed)
         if self.pause_menu:
             self.pause_menu.cleanup()
@@ -1,15 +1,126 @@
 import sqlite3
 import os
-from .config import DATABASE_PATH
+import queue
+import threading
+import time
+from .config import DATABASE_PATH, DB_WRITE_QUEUE_SIZE, DB_BATCH_WINDOW
+
+
+# 쓰기 SQL (문자열이 같으면 sqlite3 연결의 문장 캐시에서 준비된 문장을 재사용)
+SQL_INSERT_PLAYER = "INSERT INTO players (id, name, score, created_at) VALUES (?, ?, ?, ?)"
+SQL_UPDATE_SCORE = "UPDATE players SET score = ? WHERE id = ?"
+SQL_SET_SETTING = "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)"
+
+
+class DatabaseWriter:
+    """전용 스레드에서 쓰기를 모아 한 트랜잭션으로 처리 (게임 스레드는 큐에 넣기만 함)"""
+
+    def __init__(self, path, queue_size=DB_WRITE_QUEUE_SIZE, batch_window=DB_BATCH_WINDOW):
+        self.path = path
+        self.batch_window = batch_window
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.batches = 0
+        self.writes = 0
+        self.stalls = 0     # 큐가 가득 차서 게임 스레드가 기다린 횟수
+        self.errors = 0
+        self._thread = threading.Thread(target=self._run, name="db-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, sql, params=()):
+        """쓰기 요청 (큐가 가득 차면 버리지 않고 빌 때까지 기다림)"""
+        self._put((sql, params, False))
+
+    def submit_many(self, sql, rows):
+        """여러 행 쓰기 요청 (rows는 쓰기 스레드에서 순회하므로 지연 생성 가능)"""
+        self._put((sql, rows, True))
+
+    def _put(self, item):
+        """큐에 넣기"""
+        try:
+            self.queue.put_nowait(item)
+        except queue.Full:
+            self.stalls += 1
+            self.queue.put(item)
+
+    def flush(self, timeout=None):
+        """지금까지 넣은 쓰기가 디스크에 반영될 때까지 대기"""
+        done = threading.Event()
+        self.queue.put(done)
+        return done.wait(timeout)
+
+    def close(self):
+        """남은 쓰기를 모두 처리하고 스레드 종료"""
+        self.queue.put(None)
+        self._thread.join()
+
+    def _run(self):
+        """쓰기 스레드 - 첫 요청이 오면 batch_window 동안 더 모아서 한 번에 커밋"""
+        conn = sqlite3.connect(self.path, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+
+        running = True
+        while running:
+            batch = [self.queue.get()]
+            deadline = time.monotonic() + self.batch_window
+            while isinstance(batch[-1], tuple):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self.queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            writes = [item for item in batch if isinstance(item, tuple)]
+            if writes:
+                self._commit(conn, writes)
+
+            for item in batch:
+                if item is None:
+                    running = False
+                elif isinstance(item, threading.Event):
+                    item.set()
+
+        conn.close()
+
+    def _commit(self, conn, writes):
+        """쓰기 묶음을 트랜잭션 하나로 실행"""
+        try:
+            conn.execute("BEGIN")
+            count = 0
+            for sql, params, many in writes:
+                if many:
+                    count += conn.executemany(sql, params).rowcount
+                else:
+                    conn.execute(sql, params)
+                    count += 1
+            conn.execute("COMMIT")
+            self.batches += 1
+            self.writes += count
+        except sqlite3.Error as e:
+            self.errors += 1
+            print(f"[DB] 쓰기 실패 ({len(writes)}개 롤백): {e}")
+            try:
+                conn.execute("ROLLBACK")
+            except sqlite3.Error:
+                pass
 
 
 class Database:
+    """SQLite 저장소 - 읽기는 메모리 캐시, 쓰기는 DatabaseWriter 스레드 (프레임 경로에서 디스크 I/O 없음)"""
+
     def __init__(self):
         # data 디렉토리가 없으면 생성
         os.makedirs(os.path.dirname(DATABASE_PATH), exist_ok=True)
         self.conn = sqlite3.connect(DATABASE_PATH)
+        self.conn.execute("PRAGMA journal_mode=WAL")
         self.cursor = self.conn.cursor()
         self._init_tables()
+        self._load_cache()
+
+        # 이후 쓰기는 전용 스레드에서 (메인 연결은 시작 시 읽기용)
+        self.writer = DatabaseWriter(DATABASE_PATH)
 
     def _init_tables(self):
         """기본 테이블 생성"""
@@ -31,52 +142,100 @@ class Database:
             )
         ''')
 
-        self.conn.commit()
-        print("[DB] 데이터베이스 초기화 완료")
+        # 세션 결과 (게임 오버마다 한 줄, 리더보드는 점수 인덱스로 상위 N 조회)
+        self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS sessions (
+                id INTEGER PRIMARY KEY,
+                player_id INTEGER,
+                score INTEGER NOT NULL,
+                kills INTEGER NOT NULL,
+                wave INTEGER NOT NULL,
+                duration REAL NOT NULL,
+                created_at TIMESTAMP
+            )
+        ''')
+        self.cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_sessions_score ON sessions (score DESC, id)"
+        )
 
-    def add_player(self, name: str) -> int:
-        """새 플레이어 추가"""
+        # 게임플레이 이벤트 로그 (telemetry.py가 모아서 일괄 기록)
+        self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS telemetry_events (
+                session INTEGER NOT NULL,
+                t REAL NOT NULL,
+                event TEXT NOT NULL,
+                subject TEXT,
+                x REAL,
+                y REAL,
+                value REAL
+            )
+        ''')
+        self.cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_telemetry_event ON telemetry_events (event, subject)"
+        )
         self.cursor.execute(
-            "INSERT INTO players (name) VALUES (?)",
-            (name,)
+            "CREATE INDEX IF NOT EXISTS idx_telemetry_session ON telemetry_events (session)"
         )
+
         self.conn.commit()
-        return self.cursor.lastrowid
+        print("[DB] 데이터베이스 초기화 완료")
+
+    def _load_cache(self):
+        """플레이어/설정을 메모리로 읽어 둠 (시작 시 한 번)"""
+        self.players = {row[0]: row for row in self.cursor.execute("SELECT * FROM players")}
+        self.settings = dict(self.cursor.execute("SELECT key, value FROM settings"))
+        self.next_player_id = max(self.players, default=0) + 1
+
+    def add_player(self, name: str) -> int:
+        """새 플레이어 추가 (id는 메모리에서 바로 배정)"""
+        player_id = self.next_player_id
+        self.next_player_id += 1
+        created_at = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime())  # CURRENT_TIMESTAMP 형식
+        row = (player_id, name, 0, created_at)
+        self.players[player_id] = row
+        self.writer.submit(SQL_INSERT_PLAYER, row)
+        return player_id
 
     def get_player(self, player_id: int):
         """플레이어 정보 조회"""
-        self.cursor.execute(
-            "SELECT * FROM players WHERE id = ?",
-            (player_id,)
-        )
-        return self.cursor.fetchone()
+        return self.players.get(player_id)
 
     def update_score(self, player_id: int, score: int):
         """플레이어 점수 업데이트"""
-        self.cursor.execute(
-            "UPDATE players SET score = ? WHERE id = ?",
-            (score, player_id)
-        )
-        self.conn.commit()
+        row = self.players.get(player_id)
+        if row is not None:
+            self.players[player_id] = (row[0], row[1], score, row[3])
+        self.writer.submit(SQL_UPDATE_SCORE, (score, player_id))
 
     def get_setting(self, key: str, default=None):
         """설정 값 조회"""
-        self.cursor.execute(
-            "SELECT value FROM settings WHERE key = ?",
-            (key,)
-        )
-        result = self.cursor.fetchone()
-        return result[0] if result else default
+        return self.settings.get(key, default)
 
     def set_setting(self, key: str, value: str):
         """설정 값 저장"""
-        self.cursor.execute(
-            "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
-            (key, value)
-        )
-        self.conn.commit()
+        self.settings[key] = value
+        self.writer.submit(SQL_SET_SETTING, (key, value))
+
+    def query(self, sql, params=()):
+        """읽기 질의 (메인 연결, 분석/메뉴용 - 프레임 경로에서 호출하지 말 것)"""
+        return self.conn.execute(sql, params).fetchall()
+
+    def flush(self):
+        """대기 중인 쓰기를 디스크에 반영 (프레임 경로에서 호출하지 말 것)"""
+        self.writer.flush()
+
+    def get_stats(self):
+        """쓰기 스레드 통계"""
+        return {
+            'queued': self.writer.queue.qsize(),
+            'writes': self.writer.writes,
+            'batches': self.writer.batches,
+            'stalls': self.writer.stalls,
+            'errors': self.writer.errors,
+        }
 
     def close(self):
-        """데이터베이스 연결 종료"""
+        """남은 쓰기를 모두 반영하고 연결 종료"""
+        self.writer.close()
         self.conn.close()
-        print("[DB] 데이터베이스 연결 종료")
+        print(f"[DB] 데이터베이스 연결 종료 (쓰기 {self.writer.writes}개, 트랜잭션 {self.writer.batches}개)")
@@ -1,8 +1,36 @@
 from panda3d.core import Vec4, AmbientLight, DirectionalLight, Point3
-from direct.gui.OnscreenText import OnscreenText
 from direct.gui.OnscreenImage import OnscreenImage
 from panda3d.core import TransparencyAttrib
-import math
+from game.sky import SkyDome
+
+
+# 조명 테이블 크기 (하루 1440분, 분 단위)
+LUT_SIZE = 1440
+
+# 반영 임계값 (이보다 작게 바뀌면 엔진에 다시 넣지 않음)
+LIGHT_EPSILON = 1.0 / 255   # 색상 (8비트 한 단계)
+HEADING_EPSILON = 0.1       # 방향광 heading (도)
+
+
+def _lerp(a, b, f):
+    """선형 보간"""
+    return a + (b - a) * f
+
+
+def _lerp3(a, b, f):
+    """3성분 선형 보간"""
+    return (a[0] + (b[0] - a[0]) * f,
+            a[1] + (b[1] - a[1]) * f,
+            a[2] + (b[2] - a[2]) * f)
+
+
+def _changed(a, b, epsilon):
+    """3성분 값이 epsilon 이상 바뀌었는지 (b가 None이면 항상 True)"""
+    if b is None:
+        return True
+    return (abs(a[0] - b[0]) >= epsilon or
+            abs(a[1] - b[1]) >= epsilon or
+            abs(a[2] - b[2]) >= epsilon)
 
 
 class DayNightCycle:
@@ -16,7 +44,8 @@ class DayNightCycle:
         self.game_seconds_per_real_second = 24 * 60 / (24 * 60)  # 1초당 1게임 내 분
 
         # 현재 게임 내 시간 (0~1440분, 0 = 자정, 720 = 정오)
-        self.game_time_minutes = 540  # 9:00 AM부터 시작 (아침)
+        self.start_time_minutes = 540  # 9:00 AM부터 시작 (아침)
+        self.game_time_minutes = self.start_time_minutes
 
         # 조명 참조
         self.ambient_light = None
@@ -25,14 +54,22 @@ class DayNightCycle:
         self.directional_light_np = None
         self._find_lights()
 
+        # 하루 조명 곡선 테이블 (시작 시 한 번 계산)
+        self._build_lut()
+
+        # 마지막으로 엔진에 반영한 값 (임계값 비교용)
+        self.pushed_ambient = -1.0
+        self.pushed_directional = None
+        self.pushed_light_h = -1000.0
+        self.shown_minute = -1
+
         # 시간 UI
         self.time_text = None
         self._create_time_ui()
 
-        # 태양/달 노드 (조명 방향을 나타내는 시각적 요소)
-        self.sun_node = None
-        self.moon_node = None
-        self._create_celestial_bodies()
+        # 하늘 돔 (그라데이션, 태양/달, 구름을 셰이더로 그림)
+        self.sky = SkyDome(self.game)
+        self.sky_time = self.game_time_minutes  # 누적 게임 시간 (자정에 되돌아가지 않음)
 
         print("[DayNightCycle] 밤낮 시스템 초기화 완료 (24분 = 1게임 내 하루)")
 
@@ -45,85 +82,87 @@ class DayNightCycle:
         self.directional_light = self.game.directional_light
 
     def _create_time_ui(self):
-        """시간 텍스트 UI 생성"""
-        self.time_text = OnscreenText(
-            text="06:00",
+        """시간 텍스트 UI 생성 (글리프 카운터)"""
+        self.time_text = self.game.glyphs.add_counter(
+            5,
             pos=(0.85, 0.9),
             scale=0.08,
             fg=(1, 1, 1, 1),
             align=TextNode.ALeft,
-            mayChange=True
+            text="06:00"
         )
 
         # 시간 아이콘 (텍스처가 있을 때만 생성)
         self.time_icon = None
-        try:
+        sun_texture, sun_rect = self.game.assets.sprite('sun')
+        if sun_texture:
             self.time_icon = OnscreenImage(
-                image='textures/sun.png',
+                image=sun_texture,
                 pos=(0.92, 0, 0.9),
                 scale=(0.05, 1, 0.05)
             )
+            self.game.assets.apply_uv(self.time_icon, sun_rect)
             self.time_icon.setTransparency(TransparencyAttrib.MAlpha)
-        except:
-            # 텍스처 없으면 아이콘 없이 텍스트만 표시
-            pass
 
         print("[DayNightCycle] 시간 UI 생성 완료")
 
-    def _create_celestial_bodies(self):
-        """태양과 달 생성 (시각적 표현)"""
-        # 태양 (밝은 노란색 구)
-        from panda3d.core import CardMaker
-        cm = CardMaker('sun')
-        cm.setFrame(-5, 5, -5, 5)
-        self.sun_node = self.game.render.attachNewNode(cm.generate())
-        self.sun_node.setBillboardPointEye()
-
-        # 태양 색상과 텍스처
-        try:
-            texture = self.game.loader.loadTexture("textures/sun.png")
-            self.sun_node.setTexture(texture)
-        except:
-            self.sun_node.setColor(1.0, 0.9, 0.3, 1.0)  # 밝은 노란색
-
-        self.sun_node.setTransparency(TransparencyAttrib.MAlpha)
-
-        # 달 (흰색 구)
-        cm = CardMaker('moon')
-        cm.setFrame(-3, 3, -3, 3)
-        self.moon_node = self.game.render.attachNewNode(cm.generate())
-        self.moon_node.setBillboardPointEye()
-
-        # 달 색상과 텍스처
-        try:
-            texture = self.game.loader.loadTexture("textures/moon.png")
-            self.moon_node.setTexture(texture)
-        except:
-            self.moon_node.setColor(0.8, 0.8, 0.9, 1.0)  # 흰빛 회색
-
-        self.moon_node.setTransparency(TransparencyAttrib.MAlpha)
-
-        print("[DayNightCycle] 태양과 달 생성 완료")
+    def _build_lut(self):
+        """하루 조명 곡선을 분 단위 테이블로 미리 계산"""
+        self.lut_ambient = []      # 주변광 밝기
+        self.lut_directional = []  # 방향광 색상 (r, g, b)
+        self.lut_light_h = []      # 방향광 heading (밤이면 None)
+
+        for minute in range(LUT_SIZE):
+            sun_intensity = self._sun_intensity_at(minute)
+
+            # 주변광 (Ambient Light) - 낮: 0.5, 밤: 0.1
+            self.lut_ambient.append(0.1 + (sun_intensity * 0.4))
+
+            # 방향광 (Directional Light) - 낮: 0.8, 밤: 0.05, 새벽/해질녘 붉은 기미
+            directional_intensity = 0.05 + (sun_intensity * 0.75)
+            r, g, b = self._light_tint_at(minute)
+            self.lut_directional.append((
+                r * directional_intensity,
+                g * directional_intensity,
+                b * directional_intensity
+            ))
+
+            if 360 <= minute <= 1080:
+                self.lut_light_h.append((minute - 360) / 720.0 * 180)  # 0 ~ 180도
+            else:
+                self.lut_light_h.append(None)
+
+        print(f"[DayNightCycle] 조명 테이블 생성 완료 ({LUT_SIZE}개)")
 
     def update(self, dt):
-        """매 프레임 업데이트"""
+        """매 프레임 업데이트 (테이블 샘플링, 임계값 이상 바뀐 값만 반영)"""
         # 실제 시간 경과만큼 게임 내 시간 증가
         # 24분(1440초) = 1게임 내 하루(1440분)
         # 실제 1초 = 게임 내 1분
         self.game_time_minutes += dt
+        self.sky_time += dt
 
         # 1440분(24시간)이 지나면 0으로 리셋
         if self.game_time_minutes >= 1440:
             self.game_time_minutes = 0
 
-        # 조명과 배경색 업데이트
+        # 하늘 돔에 시간 전달 (하늘색, 태양/달, 구름은 GPU에서 계산)
+        self.sky.set_time(self.sky_time)
+
+        # 장면 조명 업데이트 (임계값 이상 바뀔 때만)
         self._update_lighting()
+        self._update_light_direction()
 
-        # 태양/달 위치 업데이트
-        self._update_celestial_positions()
+        # UI 업데이트 (분이 바뀔 때만)
+        minute = int(self.game_time_minutes)
+        if minute != self.shown_minute:
+            self.shown_minute = minute
+            self._update_ui()
 
-        # UI 업데이트
-        self._update_ui()
+    def _lut_index(self):
+        """현재 시간의 테이블 위치 (앞 인덱스, 뒤 인덱스, 보간 비율)"""
+        index = int(self.game_time_minutes) % LUT_SIZE
+        return index, (index + 1) % LUT_SIZE, self.game_time_minutes - int(self.game_time_minutes)
 
     def _get_day_progress(self):
         """하루 진행률 반환 (0.0 ~ 1.0, 0 = 자정, 0.5 = 정오)"""
@@ -131,17 +170,19 @@ class DayNightCycle:
 
     def _get_sun_intensity(self):
         """태양 강도 반환 (0.0 ~ 1.0)"""
-        progress = self._get_day_progress()
+        return self._sun_intensity_at(self.game_time_minutes)
 
+    def _sun_intensity_at(self, minute):
+        """minute 시점의 태양 강도 (0.0 ~ 1.0)"""
         # 낮 시간: 6:00 (360분) ~ 18:00 (1080분)
-        if 360 <= self.game_time_minutes <= 1080:
+        if 360 <= minute <= 1080:
             # 정오(720분)에 최대 강도
-            if self.game_time_minutes <= 720:
+            if minute <= 720:
                 # 새벽 6시 ~ 정오: 0 ~ 1
-                return (self.game_time_minutes - 360) / 360.0
+                return (minute - 360) / 360.0
             else:
                 # 정오 ~ 오후 6시: 1 ~ 0
-                return 1.0 - (self.game_time_minutes - 720) / 360.0
+                return 1.0 - (minute - 720) / 360.0
         else:
             # 밤: 0 강도
             return 0.0
@@ -151,98 +192,41 @@ class DayNightCycle:
         # 밤: 0~360분 (0:00~6:00) 또는 1080~1440분 (18:00~24:00)
         return self.game_time_minutes < 360 or self.game_time_minutes > 1080
 
-    def _update_lighting(self):
-        """조명 업데이트 (시간에 따른 밝기 변화)"""
-        sun_intensity = self._get_sun_intensity()
-
-        # 주변광 (Ambient Light) - 태양 강도에 따라 변화
-        # 낮: 0.5, 밤: 0.1
-        ambient_intensity = 0.1 + (sun_intensity * 0.4)
-        if self.ambient_light:
-            self.ambient_light.setColor(Vec4(ambient_intensity, ambient_intensity, ambient_intensity, 1))
-
-        # 방향광 (Directional Light) - 태양 강도와 방향에 따라 변화
-        # 낮: 0.8, 밤: 0.05
-        directional_intensity = 0.05 + (sun_intensity * 0.75)
-
-        # 조명 색상도 시간에 따라 변화
-        # 새벽/해질녁: 붉은 기미, 정오: 흰색
-        if 300 <= self.game_time_minutes <= 480:  # 새벽 5~8시
-            daybreak_progress = (self.game_time_minutes - 300) / 180.0
-            r = 1.0
-            g = 0.5 + (daybreak_progress * 0.3)
-            b = 0.3 + (daybreak_progress * 0.5)
-        elif 960 <= self.game_time_minutes <= 1140:  # 오후 4~7시 (해질녁)
-            sunset_progress = (self.game_time_minutes - 960) / 180.0
-            r = 1.0
-            g = 0.8 - (sunset_progress * 0.3)
-            b = 0.8 - (sunset_progress * 0.5)
-        else:
-            r = g = b = 1.0
-
-        if self.directional_light:
-            self.directional_light.setColor(Vec4(r * directional_intensity, g * directional_intensity, b * directional_intensity, 1))
-
-        # 배경색 (하늘색) 변화
-        self._update_sky_color(sun_intensity)
-
-    def _update_sky_color(self, sun_intensity):
-        """하늘 색상 업데이트"""
-        if sun_intensity > 0:
-            # 낮: 하늘색 (0.5, 0.7, 0.9)
-            self.game.setBackgroundColor(0.5 * sun_intensity + 0.05,
-                                        0.7 * sun_intensity + 0.05,
-                                        0.9 * sun_intensity + 0.05,
-                                        1.0)
-        else:
-            # 밤: 어두운 남색 (0.05, 0.05, 0.1)
-            self.game.setBackgroundColor(0.05, 0.05, 0.1, 1.0)
+    def _light_tint_at(self, minute):
+        """방향광 색조 - 새벽/해질녘: 붉은 기미, 정오: 흰색"""
+        if 300 <= minute <= 480:  # 새벽 5~8시
+            daybreak_progress = (minute - 300) / 180.0
+            return 1.0, 0.5 + (daybreak_progress * 0.3), 0.3 + (daybreak_progress * 0.5)
+        elif 960 <= minute <= 1140:  # 오후 4~7시 (해질녁)
+            sunset_progress = (minute - 960) / 180.0
+            return 1.0, 0.8 - (sunset_progress * 0.3), 0.8 - (sunset_progress * 0.5)
+        return 1.0, 1.0, 1.0
 
-    def _update_celestial_positions(self):
-        """태양과 달 위치 업데이트"""
-        progress = self._get_day_progress()
-
-        # 태양: 동쪽(6시)에서 떠서 서쪽(18시)으로 지는 궤적
-        # 궤적은 반원 형태로, 높이가 정오에 최고점
-        if 360 <= self.game_time_minutes <= 1080:  # 낮
-            sun_progress = (self.game_time_minutes - 360) / 720.0  # 0 ~ 1
-            angle = sun_progress * math.pi  # 0 ~ 180도
-
-            # 반원 궤적: 반경 100
-            radius = 100
-            sun_x = radius * math.cos(angle)
-            sun_y = radius * math.sin(angle) * 0.3  # 앞뒤로는 덜 움직임
-            sun_z = radius * math.sin(angle)  # 높이
-
-            self.sun_node.setPos(sun_x, sun_y, sun_z)
-            self.sun_node.show()
-        else:
-            self.sun_node.hide()
-
-        # 달: 정반대 궤적
-        if self.game_time_minutes < 360 or self.game_time_minutes > 1080:  # 밤
-            if self.game_time_minutes > 1080:
-                moon_progress = (self.game_time_minutes - 1080) / 720.0
-            else:
-                moon_progress = (self.game_time_minutes + 360) / 720.0
-
-            angle = moon_progress * math.pi
-
-            radius = 100
-            moon_x = -radius * math.cos(angle)
-            moon_y = radius * math.sin(angle) * 0.3
-            moon_z = radius * math.sin(angle)
-
-            self.moon_node.setPos(moon_x, moon_y, moon_z)
-            self.moon_node.show()
-        else:
-            self.moon_node.hide()
-
-        # 조명 방향도 태양 위치에 따라 업데이트
-        if self.directional_light_np and 360 <= self.game_time_minutes <= 1080:
-            sun_progress = (self.game_time_minutes - 360) / 720.0
-            angle = sun_progress * 180  # 0 ~ 180도
-            self.directional_light_np.setHpr(angle, -45, 0)
+    def _update_lighting(self):
+        """조명 업데이트 (테이블 값이 임계값 이상 바뀌었을 때만 반영)"""
+        i, j, f = self._lut_index()
+
+        ambient = _lerp(self.lut_ambient[i], self.lut_ambient[j], f)
+        if self.ambient_light and abs(ambient - self.pushed_ambient) >= LIGHT_EPSILON:
+            self.pushed_ambient = ambient
+            self.ambient_light.setColor(Vec4(ambient, ambient, ambient, 1))
+
+        directional = _lerp3(self.lut_directional[i], self.lut_directional[j], f)
+        if self.directional_light and _changed(directional, self.pushed_directional, LIGHT_EPSILON):
+            self.pushed_directional = directional
+            self.directional_light.setColor(Vec4(*directional, 1))
+
+    def _update_light_direction(self):
+        """방향광 방향을 태양 궤적에 맞춤 (밤에는 마지막 방향 유지)"""
+        i, j, f = self._lut_index()
+
+        heading = self.lut_light_h[i]
+        if self.directional_light_np and heading is not None:
+            if self.lut_light_h[j] is not None:
+                heading = _lerp(heading, self.lut_light_h[j], f)
+            if abs(heading - self.pushed_light_h) >= HEADING_EPSILON:
+                self.pushed_light_h = heading
+                self.directional_light_np.setHpr(heading, -45, 0)
 
     def _update_ui(self):
         """시간 UI 업데이트"""
@@ -261,12 +245,29 @@ class DayNightCycle:
             # 달 아이콘 표시
             self.time_text.setFg((0.6, 0.7, 1.0, 1.0))  # 파란빛
 
+    def reset(self):
+        """재시작 - 시작 시각으로 (다음 update에서 조명/UI 갱신)"""
+        self.game_time_minutes = self.start_time_minutes
+        self.sky_time = self.start_time_minutes
+        self.shown_minute = -1
+
+    def save_state(self):
+        """세이브용 상태 (게임 시간)"""
+        return {'time': [(self.game_time_minutes, self.sky_time)]}
+
+    def load_state(self, state):
+        """세이브 상태 적용 (다음 update에서 조명/UI 갱신)"""
+        for game_time_minutes, sky_time in state.get('time', ()):
+            self.game_time_minutes = game_time_minutes
+            self.sky_time = sky_time
+            self.shown_minute = -1
+
     def cleanup(self):
         """정리"""
-        if self.sun_node:
-            self.sun_node.removeNode()
-        if self.moon_node:
-            self.moon_node.removeNode()
+        if self.time_text:
+            self.time_text.destroy()
+        if self.sky:
+            self.sky.cleanup()
 
         print("[DayNightCycle] 밤낮 시스템 정리 완료")
 
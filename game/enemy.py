@@ -6,11 +6,17 @@ from panda3d.core import (
 from direct.gui.OnscreenText import OnscreenText
 from direct.gui.DirectGui import DirectFrame, DGG
 from direct.task import Task
+from game.spatial import LAYER_ENEMY
+from game.log import get_logger
 import math
 import random
 import time
 
 
+# 스폰/명중/공격 로그 (production 프로필에서는 no-op)
+log = get_logger('enemy', hot=True)
+
+
 class Enemy:
     """적 AI 클래스 - 플레이어를 추적하고 공격"""
 
@@ -102,6 +108,7 @@ class Enemy:
         self.scale = props['scale']
         self.score_value = props['score']
         self.explode_on_death = props.get('explode_on_death', False)
+        self.spawn_time = time.time()  # 처치 시간 통계용
 
         # 상태
         self.state = self.STATE_IDLE
@@ -126,7 +133,7 @@ class Enemy:
         self.head_height = self.scale * 0.7  # 몸 크기의 70% 위치
         self.head_radius = self.scale * 0.25  # 머리 반경
 
-        print(f"[Enemy] {enemy_type.upper()} 적 생성 (위치: {position}, 체력: {self.health})")
+        log.debug("%s 적 생성 (위치: %s, 체력: %s)", enemy_type.upper(), position, self.health)
 
     def _create_enemy_model(self):
         """적 3D 모델 생성 (간단한 구형)"""
@@ -230,9 +237,10 @@ class Enemy:
                 0.0
             )
 
-            # 바운드 체크 (-90~90)
-            self.patrol_target.x = max(-90, min(90, self.patrol_target.x))
-            self.patrol_target.y = max(-90, min(90, self.patrol_target.y))
+            # 월드 경계 체크
+            self.patrol_target.x, self.patrol_target.y = self.game.world.clamp_to_bounds(
+                self.patrol_target.x, self.patrol_target.y
+            )
 
             self.patrol_timer = random.uniform(2, 5)  # 2~5초마다 변경
 
@@ -244,7 +252,9 @@ class Enemy:
         if distance > 0.5:
             direction.normalize()
             new_pos = current_pos + direction * (self.speed * 0.3) * dt  # 느리게 순찰
+            new_pos = self.game.obstacles.resolve_move(current_pos, new_pos, self.scale / 2)
             self.node.setPos(new_pos)
+            self.game.spatial.move(LAYER_ENEMY, self, new_pos)
 
     def _chase(self, player_pos, dt):
         """플레이어 추적"""
@@ -257,7 +267,9 @@ class Enemy:
 
         # 이동
         new_pos = current_pos + direction * self.speed * dt
+        new_pos = self.game.obstacles.resolve_move(current_pos, new_pos, self.scale / 2)
         self.node.setPos(new_pos)
+        self.game.spatial.move(LAYER_ENEMY, self, new_pos)
 
     def _attack(self, player_pos, distance):
         """플레이어 공격"""
@@ -273,19 +285,25 @@ class Enemy:
         elif self.enemy_type == "ranged":
             # 원거리 공격 - 투사체 발사
             self._shoot_projectile(player_pos)
-            print(f"[Enemy] 원거리 공격!")
+            log.debug("원거리 공격!")
         else:
             # 근접 공격 - 플레이어에게 직접 데미지
             if distance <= self.attack_range:
                 self.game.player.health -= self.attack_damage
+                self._record_damage(self.attack_damage)
                 # 데미지 인디케이터 표시
                 if hasattr(self.game, 'show_damage_indicator'):
                     self.game.show_damage_indicator()
 
-                print(f"[Enemy] 근접 공격! 플레이어 데미지: {self.attack_damage}")
+                log.debug("근접 공격! 플레이어 데미지: %s", self.attack_damage)
 
-                # 공격 사운드 재생
-                self.game.sound.play('target_hit')
+                # 공격 사운드 재생 (공격한 적 위치에서)
+                self.game.sound.play_at('target_hit', self.node)
+
+    def _record_damage(self, damage):
+        """플레이어가 받은 데미지 텔레메트리 기록"""
+        pos = self.game.player.get_position()
+        self.game.telemetry.record('damage', self.enemy_type, pos.x, pos.y, damage)
 
     def _shoot_projectile(self, target_pos):
         """원거리 적 투사체 발사"""
@@ -341,19 +359,20 @@ class Enemy:
             if distance < 2.0:  # 플레이어 히트박스 크기
                 # 플레이어에게 데미지
                 self.game.player.health -= proj['damage']
+                self._record_damage(proj['damage'])
 
                 # 데미지 인디케이터 표시
                 if hasattr(self.game, 'show_damage_indicator'):
                     self.game.show_damage_indicator()
 
-                print(f"[Enemy] 투사체 명중! 데미지: {proj['damage']}")
+                log.debug("투사체 명중! 데미지: %s", proj['damage'])
+
+                # 명중 사운드 (투사체는 바로 제거되므로 노드가 아닌 현재 위치에서)
+                self.game.sound.play_at('target_hit', proj['node'].getPos(self.game.render))
 
                 # 투사체 제거
                 proj['node'].removeNode()
                 self.projectiles.remove(proj)
-
-                # 명중 사운드
-                self.game.sound.play('target_hit')
                 continue
 
             # 수명 감소
@@ -376,15 +395,19 @@ class Enemy:
         if distance <= self.attack_range * 2:  # 폭발 범위는 공격 범위의 2배
             damage = self.attack_damage
             self.game.player.health -= damage
+            self._record_damage(damage)
 
             # 데미지 인디케이터 표시
             if hasattr(self.game, 'show_damage_indicator'):
                 self.game.show_damage_indicator()
 
-            print(f"[Enemy] 폭발! 플레이어 데미지: {damage}")
+            log.info("폭발! 플레이어 데미지: %s", damage)
+
+        # 폭발 효과
+        self.game.particles.emit('explosion', enemy_pos)
 
         # 사운드 재생
-        self.game.sound.play('target_hit')
+        self.game.sound.play_at('target_hit', enemy_pos)
 
         # 즉시 사망 처리
         self.die()
@@ -403,7 +426,7 @@ class Enemy:
             if abs(height_diff - self.head_height) < self.head_radius:
                 is_headshot = True
                 damage *= 2  # 헤드샷 배율
-                print(f"[Enemy] HEADSHOT! {self.enemy_type} 헤드샷 성공! 데미지 x2")
+                log.debug("HEADSHOT! %s 헤드샷 성공! 데미지 x2", self.enemy_type)
 
         self.health -= damage
 
@@ -442,15 +465,18 @@ class Enemy:
         # 색상 변경 (회색)
         self.node.setColor(0.3, 0.3, 0.3, 1.0)
 
+        # 사망 연기 효과
+        self.game.particles.emit('death_puff', self.node.getPos())
+
         # 색상 복구 태스크 취소
         task_name = f'restore_color_{id(self)}'
         if self.game.taskMgr.hasTaskNamed(task_name):
             self.game.taskMgr.remove(task_name)
 
-        print(f"[Enemy] 적 사망! ({self.enemy_type})")
+        log.debug("적 사망! (%s)", self.enemy_type)
 
-        # 사망 사운드 재생
-        self.game.sound.play('target_hit')
+        # 사망 사운드 재생 (멀리서 죽은 적은 작게 들리거나 생략됨)
+        self.game.sound.play_at('target_hit', self.node)
 
         # 킬 피드에 추가
         if hasattr(self.game, 'add_kill_feed'):
@@ -536,6 +562,7 @@ class Enemy:
         # 적 시스템에서 제거
         if hasattr(self.game, 'enemies') and self in self.game.enemies.enemies:
             self.game.enemies.enemies.remove(self)
+        self.game.spatial.remove(LAYER_ENEMY, self)
 
 
 class EnemySystem:
@@ -544,6 +571,7 @@ class EnemySystem:
     def __init__(self, game):
         self.game = game
         self.enemies = []
+        self.max_enemy_radius = 0.0  # 충돌 질의 반경 (가장 큰 적 기준)
         self.spawn_timer = 0.0
         self.spawn_interval = 10.0  # 초기 스폰 간격
 
@@ -612,9 +640,8 @@ class EnemySystem:
         spawn_y = player_pos.y + math.sin(angle) * distance
         spawn_z = 0.0  # 바닥
 
-        # 바운드 체크 (-100~100)
-        spawn_x = max(-90, min(90, spawn_x))
-        spawn_y = max(-90, min(90, spawn_y))
+        # 월드 경계 체크
+        spawn_x, spawn_y = self.game.world.clamp_to_bounds(spawn_x, spawn_y)
 
         spawn_pos = Point3(spawn_x, spawn_y, spawn_z)
 
@@ -627,10 +654,16 @@ class EnemySystem:
         enemy.max_health = enemy.health
         enemy.attack_damage = int(enemy.attack_damage * multiplier)
 
-        self.enemies.append(enemy)
+        self._add_enemy(enemy)
         self.enemies_in_wave += 1
 
-        print(f"[EnemySystem] 적 스폰 ({enemy_type}, 웨이브 {self.current_wave}, 총 {len(self.enemies)}마리)")
+        log.debug("적 스폰 (%s, 웨이브 %s, 총 %s마리)", enemy_type, self.current_wave, len(self.enemies))
+
+    def _add_enemy(self, enemy):
+        """적 등록 (목록 + 공간 인덱스)"""
+        self.enemies.append(enemy)
+        self.game.spatial.insert(LAYER_ENEMY, enemy, enemy.node.getPos())
+        self.max_enemy_radius = max(self.max_enemy_radius, enemy.scale / 2)
 
     def check_bullet_collisions(self, bullet_pos, bullet_damage=25):
         """
@@ -638,22 +671,24 @@ class EnemySystem:
         bullet_pos: Point3 - 총알 위치
         bullet_damage: int - 총알 데미지
         """
-        for enemy in self.enemies:
+        nearby = self.game.spatial.radius(LAYER_ENEMY, bullet_pos, self.max_enemy_radius)
+        for enemy, distance in nearby:
             if enemy.is_dead:
                 continue
 
-            # 간단한 거리 체크로 충돌 판정
-            distance = (bullet_pos - enemy.node.getPos()).length()
-
             if distance < enemy.scale / 2:
                 # 충돌! 적에게 데미지 (히트 위치 전달하여 헤드샷 판정)
                 killed, is_headshot = enemy.take_damage(bullet_damage, bullet_pos)
 
-                headshot_text = " [HEADSHOT!]" if is_headshot else ""
-                print(f"[EnemySystem] 적 명중! 데미지: {bullet_damage}{headshot_text}, 남은 체력: {enemy.health}")
+                log.debug("적 명중! 데미지: %s%s, 남은 체력: %s",
+                          bullet_damage, " [HEADSHOT!]" if is_headshot else "", enemy.health)
 
                 # 적 사망 시 점수 추가 (헤드샷 보너스)
                 if killed:
+                    self.game.telemetry.record(
+                        'kill', enemy.enemy_type, bullet_pos.x, bullet_pos.y,
+                        time.time() - enemy.spawn_time
+                    )
                     score_bonus = enemy.score_value * 2 if is_headshot else enemy.score_value
                     self.add_score(enemy.enemy_type, int(score_bonus), is_headshot)
 
@@ -670,12 +705,12 @@ class EnemySystem:
         final_score = int(base_score * wave_bonus)
         if is_headshot:
             final_score *= 2
-            print(f"[EnemySystem] HEADSHOT KILL! 점수 2배!")
+            log.debug("HEADSHOT KILL! 점수 2배!")
 
         self.total_score += final_score
         self.kill_count += 1
 
-        print(f"[EnemySystem] 적 처치! +{final_score}점 (총: {self.total_score}점, 킬: {self.kill_count})")
+        log.info("적 처치! +%s점 (총: %s점, 킬: %s)", final_score, self.total_score, self.kill_count)
 
         # UI 업데이트
         if hasattr(self.game, 'update_score_ui'):
@@ -721,6 +756,8 @@ class EnemySystem:
         # 웨이브 알림 표시
         if hasattr(self.game, 'show_wave_notification'):
             self.game.show_wave_notification(self.current_wave)
+        if hasattr(self.game, 'update_score_ui'):
+            self.game.update_score_ui()
 
     def get_stats(self):
         """현재 통계 반환"""
@@ -731,9 +768,63 @@ class EnemySystem:
             'enemies': len(self.enemies)
         }
 
-    def cleanup(self):
-        """정리"""
+    def save_state(self):
+        """세이브용 상태 (살아 있는 적 + 웨이브/점수)"""
+        enemies = []
         for enemy in self.enemies:
+            if enemy.is_dead:
+                continue
+            pos = enemy.node.getPos()
+            enemies.append((
+                enemy.enemy_type, pos.x, pos.y, pos.z,
+                enemy.health, enemy.max_health, enemy.attack_damage
+            ))
+        wave = (
+            self.current_wave, self.wave_timer, self.spawn_timer,
+            self.enemies_in_wave, self.total_score, self.kill_count
+        )
+        return {'enemies': enemies, 'wave': [wave]}
+
+    def load_state(self, state):
+        """세이브 상태 적용 (현재 적은 모두 제거 후 저장된 적 생성)"""
+        self._remove_all()
+
+        for enemy_type, x, y, z, health, max_health, attack_damage in state.get('enemies', ()):
+            enemy = Enemy(self.game, Point3(x, y, z), enemy_type)
+            enemy.health = health
+            enemy.max_health = max_health
+            enemy.attack_damage = attack_damage
+            self._add_enemy(enemy)
+
+        for wave in state.get('wave', ()):
+            (self.current_wave, self.wave_timer, self.spawn_timer,
+             self.enemies_in_wave, self.total_score, self.kill_count) = wave
+
+        if hasattr(self.game, 'update_score_ui'):
+            self.game.update_score_ui()
+
+    def _remove_all(self):
+        """모든 적 제거 (적 노드, 체력바, 투사체 포함)"""
+        for enemy in self.enemies[:]:
             enemy.cleanup()
         self.enemies.clear()
+        self.game.spatial.clear(LAYER_ENEMY)
+        self.max_enemy_radius = 0.0
+
+    def reset(self):
+        """재시작 - 모든 적 제거, 웨이브/점수 초기화"""
+        self._remove_all()
+        self.spawn_timer = 0.0
+        self.current_wave = 1
+        self.wave_timer = 0.0
+        self.enemies_in_wave = 0
+        self.total_score = 0
+        self.kill_count = 0
+
+        if hasattr(self.game, 'update_score_ui'):
+            self.game.update_score_ui()
+
+    def cleanup(self):
+        """정리"""
+        self._remove_all()
         print("[EnemySystem] 적 시스템 정리 완료")
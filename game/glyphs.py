@@ -0,0 +1,326 @@
+"""
+글리프 아틀라스 HUD
+미리 래스터화한 글자를 아틀라스 텍스처 하나에 담고, 고정 칸 쿼드의 UV만 바꿔 숫자 HUD를 그림
+"""
+from panda3d.core import (
+    Geom, GeomNode, GeomTriangles, GeomVertexData, GeomVertexFormat,
+    GeomVertexWriter, GeomVertexReader, NodePath, PNMImage, Texture,
+    SamplerState, TextNode, TransparencyAttrib, DynamicTextFont
+)
+import math
+
+
+# 아틀라스에 담을 글자 (숫자 + HUD 라벨에 쓰는 글자)
+GLYPH_CHARSET = " 0123456789/:%()-.ACDEFHIKLOPRSTVW"
+
+# 글리프 래스터화 해상도 (폰트 1단위당 픽셀, 동적 폰트일 때만 적용)
+GLYPH_PIXELS_PER_UNIT = 48
+
+# 칸 사이 여백 (픽셀, 선형 필터링 번짐 방지)
+GLYPH_PADDING = 2
+
+
+class GlyphAtlas:
+    """기본 폰트 글리프를 균일한 칸으로 재배치한 아틀라스 텍스처"""
+
+    def __init__(self, charset=GLYPH_CHARSET, font=None):
+        self.charset = charset
+        self.font = font or self._make_font()
+        self.line_height = self.font.getLineHeight()
+
+        # 칸 크기 (폰트 단위) - 고정 폭 레이아웃
+        self.cell_width = 0.0
+        self.cell_bottom = 0.0
+        self.cell_top = 0.0
+
+        self.uv_rects = {}  # 글자 -> (u0, v0, u1, v1)
+        self.texture = self._build()
+
+    def _make_font(self):
+        """기본 폰트 복사본 (동적 폰트면 해상도를 높여 래스터화)"""
+        font = TextNode.getDefaultFont()
+        if isinstance(font, DynamicTextFont):
+            font = font.makeCopy()
+            font.setPixelsPerUnit(GLYPH_PIXELS_PER_UNIT)
+        return font
+
+    def _read_glyph(self, char):
+        """TextNode로 글자 하나를 생성해 쿼드 좌표, UV, 페이지 텍스처, 전진 폭을 읽음"""
+        text_node = TextNode('glyph')
+        text_node.setFont(self.font)
+        text_node.setText(char)
+        advance = text_node.calcWidth(char)
+
+        glyph_np = NodePath(text_node.generate())
+        texture = glyph_np.findTexture('*')
+        if texture is None:
+            return None, advance  # 공백 등 그릴 것이 없는 글자
+
+        xs, zs, us, vs = [], [], [], []
+        for geom_np in glyph_np.findAllMatches('**/+GeomNode'):
+            geom_node = geom_np.node()
+            for i in range(geom_node.getNumGeoms()):
+                vdata = geom_node.getGeom(i).getVertexData()
+                vertex = GeomVertexReader(vdata, 'vertex')
+                texcoord = GeomVertexReader(vdata, 'texcoord')
+                while not vertex.isAtEnd():
+                    pos = vertex.getData3()
+                    uv = texcoord.getData2()
+                    xs.append(pos.x)
+                    zs.append(pos.z)
+                    us.append(uv.x)
+                    vs.append(uv.y)
+
+        if not xs:
+            return None, advance
+
+        quad = (min(xs), min(zs), max(xs), max(zs))
+        uvs = (min(us), min(vs), max(us), max(vs))
+        return (quad, uvs, texture), advance
+
+    def _build(self):
+        """글리프를 읽어 한 줄짜리 아틀라스 이미지로 합침"""
+        glyphs = {}
+        pages = {}
+        ppu = 0.0
+        for char in self.charset:
+            glyph, advance = self._read_glyph(char)
+            glyphs[char] = glyph
+            self.cell_width = max(self.cell_width, advance)
+            if glyph is None:
+                continue
+
+            (left, bottom, right, top), (u0, v0, u1, v1), texture = glyph
+            self.cell_bottom = min(self.cell_bottom, bottom)
+            self.cell_top = max(self.cell_top, top)
+
+            page = pages.get(texture)
+            if page is None:
+                page = PNMImage()
+                texture.store(page)
+                pages[texture] = page
+
+            # 페이지 픽셀 / 폰트 단위 비율 (글리프를 1:1로 복사하므로 아틀라스도 같은 비율)
+            if right > left:
+                ppu = max(ppu, (u1 - u0) * page.getXSize() / (right - left))
+
+        ppu = ppu or GLYPH_PIXELS_PER_UNIT
+        cell_w_px = int(math.ceil(self.cell_width * ppu)) + GLYPH_PADDING * 2
+        cell_h_px = int(math.ceil((self.cell_top - self.cell_bottom) * ppu)) + GLYPH_PADDING * 2
+        atlas_w = cell_w_px * len(self.charset)
+        atlas_h = cell_h_px
+
+        # 흰색 RGBA, 알파 0으로 시작 (색은 정점 색상으로 입힘)
+        atlas = PNMImage(atlas_w, atlas_h, 4)
+        atlas.fill(1, 1, 1)
+        atlas.alphaFill(0)
+
+        for index, char in enumerate(self.charset):
+            cell_x = index * cell_w_px
+            self.uv_rects[char] = (
+                (cell_x + GLYPH_PADDING) / atlas_w,
+                GLYPH_PADDING / atlas_h,
+                (cell_x + cell_w_px - GLYPH_PADDING) / atlas_w,
+                (atlas_h - GLYPH_PADDING) / atlas_h,
+            )
+
+            glyph = glyphs[char]
+            if glyph is None:
+                continue
+
+            (left, bottom, right, top), (u0, v0, u1, v1), texture = glyph
+            page = pages[texture]
+
+            # 페이지에서 글리프 영역 (PNMImage는 위에서 아래로)
+            page_w, page_h = page.getXSize(), page.getYSize()
+            src_x0 = int(round(u0 * page_w))
+            src_x1 = int(round(u1 * page_w))
+            src_y0 = int(round((1.0 - v1) * page_h))
+            src_y1 = int(round((1.0 - v0) * page_h))
+
+            # 칸 안 위치 (가운데 정렬, 기준선 공통)
+            glyph_w_px = src_x1 - src_x0
+            dst_x = cell_x + GLYPH_PADDING + max(0, (cell_w_px - GLYPH_PADDING * 2 - glyph_w_px) // 2)
+            dst_y = GLYPH_PADDING + int(round((self.cell_top - top) * ppu))
+
+            use_alpha = page.hasAlpha()
+            for sy in range(src_y0, src_y1):
+                ty = dst_y + sy - src_y0
+                if not 0 <= ty < atlas_h:
+                    continue
+                for sx in range(src_x0, src_x1):
+                    tx = dst_x + sx - src_x0
+                    if not 0 <= tx < atlas_w:
+                        continue
+                    alpha = page.getAlpha(sx, sy) if use_alpha else page.getGray(sx, sy)
+                    atlas.setAlpha(tx, ty, alpha)
+
+        texture = Texture('glyph_atlas')
+        texture.load(atlas)
+        texture.setMinfilter(SamplerState.FT_linear)
+        texture.setMagfilter(SamplerState.FT_linear)
+        texture.setWrapU(SamplerState.WM_clamp)
+        texture.setWrapV(SamplerState.WM_clamp)
+
+        print(f"[Glyphs] 글리프 아틀라스 생성 ({len(self.charset)}자, {atlas_w}x{atlas_h})")
+        return texture
+
+    def uv_rect(self, char):
+        """글자의 UV 영역 (없는 글자는 공백)"""
+        return self.uv_rects.get(char, self.uv_rects[' '])
+
+
+class GlyphCounter:
+    """고정 칸 수의 글리프 텍스트 (GlyphBatch 정점 버퍼의 일부 구간)"""
+
+    def __init__(self, batch, base_row, width, align):
+        self.batch = batch
+        self.base_row = base_row  # 첫 정점 행
+        self.width = width        # 칸 수
+        self.align = align
+        self.text = ""
+        self.cells = [' '] * width
+        self.fg = None
+        self.hidden = False
+
+    def _layout(self, text):
+        """정렬에 맞춰 칸 배열 생성 (넘치면 잘라냄)"""
+        text = text[:self.width]
+        pad = self.width - len(text)
+        if self.align == TextNode.ARight:
+            return [' '] * pad + list(text)
+        if self.align == TextNode.ACenter:
+            left = pad // 2
+            return [' '] * left + list(text) + [' '] * (pad - left)
+        return list(text) + [' '] * pad
+
+    def setText(self, text):
+        """텍스트 변경 (바뀐 칸의 UV만 다시 씀)"""
+        self.text = text
+        if not self.hidden:
+            self._write_cells(self._layout(text))
+
+    def getText(self):
+        """현재 텍스트"""
+        return self.text
+
+    def setFg(self, color):
+        """글자 색 변경 (바뀐 경우에만 정점 색상 다시 씀)"""
+        color = tuple(color)
+        if color == self.fg:
+            return
+        self.fg = color
+        self.batch.write_colors(self.base_row, self.width, color)
+
+    def _write_cells(self, cells):
+        """이전과 다른 칸만 UV 갱신"""
+        for i, char in enumerate(cells):
+            if char != self.cells[i]:
+                self.batch.write_uvs(self.base_row + i * 4, char)
+        self.cells = cells
+
+    def hide(self):
+        """숨김 (모든 칸을 공백으로)"""
+        self._write_cells([' '] * self.width)
+        self.hidden = True
+
+    def show(self):
+        """다시 표시"""
+        self.hidden = False
+        self._write_cells(self._layout(self.text))
+
+    def destroy(self):
+        """제거 (칸은 공백으로 남음)"""
+        self.hide()
+
+
+class GlyphBatch:
+    """모든 글리프 카운터를 Geom 하나로 묶어 그리는 배치"""
+
+    def __init__(self, game, parent=None, atlas=None):
+        self.game = game
+        self.atlas = atlas or GlyphAtlas()
+        self.counters = []
+        self.uv_writes = 0  # 누적 UV 갱신 칸 수
+
+        self.vdata = GeomVertexData('glyph_hud', GeomVertexFormat.getV3c4t2(), Geom.UH_dynamic)
+        self.vdata.setNumRows(0)
+        self.triangles = GeomTriangles(Geom.UH_static)
+        geom = Geom(self.vdata)
+        geom.addPrimitive(self.triangles)
+        geom_node = GeomNode('glyph_hud')
+        geom_node.addGeom(geom)
+
+        parent = parent if parent is not None else self.game.aspect2d
+        self.node = parent.attachNewNode(geom_node)
+        self.node.setTexture(self.atlas.texture)
+        self.node.setTransparency(TransparencyAttrib.MAlpha)
+        self.node.setTwoSided(True)
+
+    def add_counter(self, width, pos, scale, fg=(1, 1, 1, 1), align=TextNode.ALeft, text=""):
+        """
+        카운터 추가 (OnscreenText와 같은 pos/scale/align 의미)
+        width: 최대 글자 수 (칸 수 고정)
+        """
+        atlas = self.atlas
+        base_row = self.vdata.getNumRows()
+        self.vdata.setNumRows(base_row + width * 4)
+
+        # 정렬 기준점에서 첫 칸의 왼쪽 x
+        total_w = width * atlas.cell_width * scale
+        if align == TextNode.ARight:
+            start_x = pos[0] - total_w
+        elif align == TextNode.ACenter:
+            start_x = pos[0] - total_w / 2
+        else:
+            start_x = pos[0]
+        z0 = pos[1] + atlas.cell_bottom * scale
+        z1 = pos[1] + atlas.cell_top * scale
+
+        # 칸 위치는 한 번만 기록
+        vertex = GeomVertexWriter(self.vdata, 'vertex')
+        vertex.setRow(base_row)
+        for i in range(width):
+            x0 = start_x + i * atlas.cell_width * scale
+            x1 = x0 + atlas.cell_width * scale
+            vertex.setData3(x0, 0, z0)
+            vertex.setData3(x1, 0, z0)
+            vertex.setData3(x1, 0, z1)
+            vertex.setData3(x0, 0, z1)
+
+            row = base_row + i * 4
+            self.triangles.addVertices(row, row + 1, row + 2)
+            self.triangles.addVertices(row, row + 2, row + 3)
+
+        counter = GlyphCounter(self, base_row, width, align)
+        for i in range(width):
+            self.write_uvs(base_row + i * 4, ' ')
+        counter.setFg(fg)
+        counter.setText(text)
+        self.counters.append(counter)
+        return counter
+
+    def write_uvs(self, row, char):
+        """칸 하나(정점 4개)의 UV를 글자에 맞게 기록"""
+        u0, v0, u1, v1 = self.atlas.uv_rect(char)
+        texcoord = GeomVertexWriter(self.vdata, 'texcoord')
+        texcoord.setRow(row)
+        texcoord.setData2(u0, v0)
+        texcoord.setData2(u1, v0)
+        texcoord.setData2(u1, v1)
+        texcoord.setData2(u0, v1)
+        self.uv_writes += 1
+
+    def write_colors(self, row, width, color):
+        """칸 구간의 정점 색상 기록"""
+        writer = GeomVertexWriter(self.vdata, 'color')
+        writer.setRow(row)
+        for _ in range(width * 4):
+            writer.setData4(*color)
+
+    def cleanup(self):
+        """정리"""
+        self.counters.clear()
+        if self.node:
+            self.node.removeNode()
+            self.node = None
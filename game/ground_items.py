@@ -3,6 +3,8 @@
 드롭된 아이템의 시각화와 줍기 처리
 """
 from panda3d.core import CardMaker, Vec3, TransparencyAttrib
+from game.spatial import LAYER_GROUND_ITEM
+from game.tool import create_tool
 
 
 class GroundItem:
@@ -86,6 +88,7 @@ class GroundItemSystem:
         """위치에 아이템 드롭"""
         ground_item = GroundItem(self.game, position, item_type, item_data)
         self.ground_items.append(ground_item)
+        self.game.spatial.insert(LAYER_GROUND_ITEM, ground_item, position)
         print(f"[GroundItem] Dropped {item_type} at {position}")
 
     def try_pickup(self, player_pos):
@@ -93,24 +96,20 @@ class GroundItemSystem:
         if self.pickup_cooldown > 0:
             return None, None
 
-        for item in self.ground_items[:]:
-            if item.can_pickup(player_pos, self.pickup_range):
-                item_type, item_data = item.pickup()
-                self.ground_items.remove(item)
-                self.pickup_cooldown = self.pickup_cooldown_time
-                print(f"[GroundItem] Picked up {item_type}")
-                return item_type, item_data
+        item, _ = self.game.spatial.nearest(LAYER_GROUND_ITEM, player_pos, self.pickup_range)
+        if item:
+            item_type, item_data = item.pickup()
+            self.ground_items.remove(item)
+            self.game.spatial.remove(LAYER_GROUND_ITEM, item)
+            self.pickup_cooldown = self.pickup_cooldown_time
+            print(f"[GroundItem] Picked up {item_type}")
+            return item_type, item_data
 
         return None, None
 
     def get_nearby_items(self, player_pos, max_distance=10.0):
-        """가까운 아이템 목록 반환 (UI용)"""
-        nearby = []
-        for item in self.ground_items:
-            distance = (item.position - player_pos).length()
-            if distance <= max_distance:
-                nearby.append((item, distance))
-        return nearby
+        """가까운 아이템 목록 반환 (UI용, 가까운 순)"""
+        return self.game.spatial.radius(LAYER_GROUND_ITEM, player_pos, max_distance)
 
     def update(self, dt):
         """모든 바닥 아이템 업데이트"""
@@ -124,11 +123,48 @@ class GroundItemSystem:
                 if item.node:
                     item.node.removeNode()
                 self.ground_items.remove(item)
+                self.game.spatial.remove(LAYER_GROUND_ITEM, item)
                 print(f"[GroundItem] Item expired and removed")
 
+    def save_state(self):
+        """세이브용 상태 (도구는 타입/내구도, 리소스는 타입/개수)"""
+        items = []
+        for item in self.ground_items:
+            if item.item_type == 'tool':
+                subtype, value = item.item_data.tool_type, item.item_data.durability
+            else:
+                subtype, value = item.item_data.get('type', ''), item.item_data.get('amount', 0)
+            pos = item.position
+            items.append((item.item_type, subtype, value, pos.x, pos.y, pos.z, item.age))
+        return {'ground_items': items}
+
+    def load_state(self, state):
+        """세이브 상태 적용 (현재 아이템은 모두 제거)"""
+        self.cleanup()
+        for item_type, subtype, value, x, y, z, age in state.get('ground_items', ()):
+            if item_type == 'tool':
+                item_data = create_tool(subtype)
+                if item_data is None:
+                    continue
+                item_data.durability = value
+                item_data.broken = value <= 0
+            else:
+                item_data = {'type': subtype, 'amount': int(value)}
+            position = Vec3(x, y, z)
+            ground_item = GroundItem(self.game, position, item_type, item_data)
+            ground_item.age = age
+            self.ground_items.append(ground_item)
+            self.game.spatial.insert(LAYER_GROUND_ITEM, ground_item, position)
+
+    def reset(self):
+        """재시작 - 모든 바닥 아이템 제거"""
+        self.cleanup()
+        self.pickup_cooldown = 0.0
+
     def cleanup(self):
         """모든 바닥 아이템 정리"""
         for item in self.ground_items:
             if item.node:
                 item.node.removeNode()
         self.ground_items.clear()
+        self.game.spatial.clear(LAYER_GROUND_ITEM)
@@ -0,0 +1,106 @@
+"""
+HUD 바인딩 레이어
+위젯을 Player/Weapon 값에 연결하고, 값이 실제로 바뀐 경우에만 텍스트를 다시 만듦
+매 프레임 읽지 않음 - 값을 바꾼 쪽의 변경 알림(Observable, 인벤토리 리스너)에서 refresh(name) 호출
+"""
+
+
+# 아직 그려진 적 없는 바인딩 표시
+_UNSET = object()
+
+
+class HudBinding:
+    """위젯 하나와 관찰 값 하나의 연결"""
+
+    def __init__(self, name, widget, value_fn, format_fn):
+        self.name = name
+        self.widget = widget
+        self.value_fn = value_fn    # () -> 비교 가능한 값 (보통 튜플)
+        self.format_fn = format_fn  # (값) -> 표시 문자열
+        self.last_value = _UNSET
+
+    def refresh(self):
+        """값이 바뀌었으면 텍스트 재생성 (재생성했으면 True)"""
+        value = self.value_fn()
+        if value == self.last_value:
+            return False
+
+        self.last_value = value
+        self.widget.setText(self.format_fn(value))
+        return True
+
+    def invalidate(self):
+        """다음 갱신 때 무조건 다시 그림"""
+        self.last_value = _UNSET
+
+
+class HudLayer:
+    """HUD 바인딩 관리자 (텍스트 재생성 횟수 집계)"""
+
+    def __init__(self, game):
+        self.game = game
+        self.bindings = {}
+
+        # 재생성 카운터 (1초 단위 집계)
+        self.total_rebuilds = 0
+        self.rebuilds_per_second = 0
+        self._window_rebuilds = 0
+        self._window_time = 0.0
+
+    def bind(self, name, widget, value_fn, format_fn):
+        """위젯을 값에 연결하고 즉시 한 번 그림"""
+        binding = HudBinding(name, widget, value_fn, format_fn)
+        self.bindings[name] = binding
+        if binding.refresh():
+            self._count_rebuild()
+        return binding
+
+    def unbind(self, name):
+        """바인딩 해제"""
+        self.bindings.pop(name, None)
+
+    def invalidate(self, name=None):
+        """바인딩 강제 갱신 예약 (name이 None이면 전체)"""
+        if name is None:
+            for binding in self.bindings.values():
+                binding.invalidate()
+        elif name in self.bindings:
+            self.bindings[name].invalidate()
+
+    def refresh(self, name=None):
+        """바인딩 즉시 갱신 (값이 바뀐 경우에만 다시 그림)"""
+        if name is None:
+            targets = self.bindings.values()
+        elif name in self.bindings:
+            targets = (self.bindings[name],)
+        else:
+            return
+
+        for binding in targets:
+            if binding.refresh():
+                self._count_rebuild()
+
+    def _count_rebuild(self):
+        """텍스트 재생성 1회 기록"""
+        self.total_rebuilds += 1
+        self._window_rebuilds += 1
+
+    def update(self, dt):
+        """초당 재생성 수 집계"""
+        self._window_time += dt
+        if self._window_time >= 1.0:
+            self.rebuilds_per_second = self._window_rebuilds / self._window_time
+            self._window_rebuilds = 0
+            self._window_time = 0.0
+
+    def get_stats(self):
+        """HUD 통계"""
+        return {
+            'bindings': len(self.bindings),
+            'rebuilds_per_second': self.rebuilds_per_second,
+            'total_rebuilds': self.total_rebuilds,
+        }
+
+    def cleanup(self):
+        """정리"""
+        self.bindings.clear()
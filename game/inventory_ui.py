@@ -7,31 +7,11 @@ from direct.gui.DirectGui import (
     DGG
 )
 from panda3d.core import TextNode, Vec4, WindowProperties
+from game import recipes
 
 
-# 조합 레시피 정의
-CRAFTING_RECIPES = {
-    'axe': {
-        'name': 'Axe',
-        'cost': {'wood': 15, 'stone': 5},
-        'description': '나무 채집 도구'
-    },
-    'pickaxe': {
-        'name': 'Pickaxe',
-        'cost': {'wood': 10, 'stone': 15},
-        'description': '돌 채집 도구'
-    },
-    'campfire': {
-        'name': 'Campfire',
-        'cost': {'wood': 10, 'stone': 5},
-        'description': '모닥불'
-    },
-    'wall': {
-        'name': 'Wall',
-        'cost': {'wood': 20, 'stone': 10},
-        'description': '방어벽'
-    },
-}
+# 도구 수리 가능 비트 (수리 버튼 색상용)
+REPAIR_BIT = recipes.RECIPE_BITS['repair_tool']
 
 
 class InventoryUI:
@@ -55,7 +35,14 @@ class InventoryUI:
         self.tooltip_frame = None
         self.tooltip_label = None
 
-        self._create_ui()
+        # 변경 추적 (숨겨져 있는 동안 쌓아 두었다가 표시할 때 반영)
+        self.dirty_slots = set(range(6))
+        self.dirty_resources = set(self.game.player.inventory)
+        self.shown_mask = None   # 버튼 색상에 마지막으로 반영한 비트마스크 (None = 아직 없음)
+        self.widget_cache = {}   # (위젯 id, 속성) -> 마지막으로 설정한 값
+
+        # 위젯은 처음 열 때 생성 (그 전까지는 변경 추적만)
+        self.game.player.add_inventory_listener(self._on_inventory_changed)
 
     def _create_ui(self):
         """인벤토리 UI 요소 생성"""
@@ -292,6 +279,12 @@ class InventoryUI:
             self.tools_tab_btn['frameColor'] = (0.3, 0.3, 0.3, 0.8)
             self.crafting_tab_btn['frameColor'] = (0.3, 0.5, 0.7, 0.8)
 
+        # 드롭 버튼은 도구 탭에서만 표시
+        if tab_name == 'tools':
+            self.drop_btn.show()
+        else:
+            self.drop_btn.hide()
+
         # 메시지 숨기기
         self.message_label.hide()
 
@@ -308,28 +301,26 @@ class InventoryUI:
             frameColor=(0, 0, 0, 0)
         )
 
-        # 조합 버튼 생성
-        y_pos = 0.15
-        for item_id, recipe in CRAFTING_RECIPES.items():
+        # 조합 버튼 생성 (레지스트리의 조합 가능 아이템, 2열)
+        for i, item_id in enumerate(recipes.CRAFTABLE_ITEMS):
+            recipe = recipes.get_recipe(item_id)
             # 비용 텍스트 생성
             cost_text = ", ".join([f"{v} {k}" for k, v in recipe['cost'].items()])
 
             btn = DirectButton(
                 parent=self.crafting_frame,
-                pos=(-0.35, 0, y_pos),
-                frameSize=(-0.45, 0.45, -0.06, 0.06),
+                pos=(-0.27 + (i % 2) * 0.54, 0, 0.15 - (i // 2) * 0.14),
+                frameSize=(-0.26, 0.26, -0.06, 0.06),
                 frameColor=(0.2, 0.4, 0.2, 0.8),
                 text=f"{recipe['name']}\n{cost_text}",
                 text_scale=0.04,
-                text_align=TextNode.ALeft,
+                text_align=TextNode.ACenter,
                 text_fg=(1, 1, 1, 1),
                 command=self._on_craft_item,
                 extraArgs=[item_id]
             )
             self.crafting_buttons.append(btn)
 
-            y_pos -= 0.12
-
     def _create_repair_section(self):
         """수리 섹션"""
         # 수리 타이틀
@@ -347,7 +338,7 @@ class InventoryUI:
         cost_label = DirectLabel(
             parent=self.repair_frame,
             pos=(-0.45, 0, 0.18),
-            text="Cost: Wood 3, Stone 2 per tool",
+            text=f"Cost: {recipes.format_cost(recipes.get_cost('repair_tool'))} per tool",
             text_scale=0.04,
             text_align=TextNode.ALeft,
             text_fg=(0.8, 0.6, 0.3, 1),
@@ -399,53 +390,29 @@ class InventoryUI:
 
     def _on_craft_item(self, item_id):
         """조합 버튼 클릭 처리"""
-        if item_id not in CRAFTING_RECIPES:
+        recipe = recipes.get_recipe(item_id)
+        if recipe is None:
             self._show_message("알 수 없는 조합 아이템!", (1, 0.3, 0.3, 1))
             return
 
-        recipe = CRAFTING_RECIPES[item_id]
-        cost = recipe['cost']
+        player = self.game.player
 
         # 리소스 확인
-        can_craft = True
-        missing = []
-        for res_type, amount in cost.items():
-            count = self.game.player.get_resource_count(res_type)
-            if count < amount:
-                can_craft = False
-                missing.append(f"{res_type} {amount - count}부족")
-
-        if not can_craft:
-            self._show_message(f"리소스 부족! {', '.join(missing)}", (1, 0.3, 0.3, 1))
+        if not player.can_craft(item_id):
+            missing = recipes.missing_resources(player.inventory, recipe['cost'])
+            missing_text = ", ".join(f"{res_type} {amount}부족" for res_type, amount in missing.items())
+            self._show_message(f"리소스 부족! {missing_text}", (1, 0.3, 0.3, 1))
             return
 
-        # 리소스 사용
-        self.game.player.use_resources(cost)
-
-        # 도구 생성
-        if item_id in ['axe', 'pickaxe']:
-            from game.tool import create_tool
-            tool = create_tool(item_id)
-            if tool:
-                success = self.game.player.add_tool(tool)
-                if success:
-                    self._show_message(f"{recipe['name']} 조합 성공!", (0.3, 1, 0.3, 1))
-                else:
-                    # 인벤토리 꽉 찼음 - 리소스 반환
-                    for res_type, amount in cost.items():
-                        self.game.player.add_resource(res_type, amount)
-                    self._show_message("인벤토리가 가득 찼습니다!", (1, 0.3, 0.3, 1))
-            else:
-                # 도구 생성 실패 - 리소스 반환
-                for res_type, amount in cost.items():
-                    self.game.player.add_resource(res_type, amount)
-                self._show_message("조합 실패!", (1, 0.3, 0.3, 1))
-        else:
-            # 기타 아이템 (campfire, wall 등)
-            # TODO: 나중에 구현
-            self._show_message(f"{recipe['name']} 조합 성공! (구현 예정)", (0.3, 1, 0.3, 1))
+        if recipe['kind'] == 'tool' and None not in player.tool_slots:
+            self._show_message("인벤토리가 가득 찼습니다!", (1, 0.3, 0.3, 1))
+            return
 
-        self.update()
+        # 검증 + 리소스 차감 + 도구 생성을 한 번에
+        if player.craft(item_id):
+            self._show_message(f"{recipe['name']} 조합 성공!", (0.3, 1, 0.3, 1))
+        else:
+            self._show_message("조합 실패!", (1, 0.3, 0.3, 1))
 
     def _show_message(self, message, color=(1, 1, 1, 1)):
         """메시지 표시"""
@@ -467,7 +434,6 @@ class InventoryUI:
             # 도구 장착
             if not tool.broken:
                 self.game.player.equip_tool(slot_index)
-                self.update()
                 print(f"[InventoryUI] Equipped {tool.name}")
             else:
                 print("[InventoryUI] Cannot equip broken tool")
@@ -479,7 +445,6 @@ class InventoryUI:
         current_tool = self.game.player.current_tool
         if current_tool:
             self.game.player.drop_current_tool()
-            self.update()
             print("[InventoryUI] Dropped tool")
         else:
             print("[InventoryUI] No tool to drop")
@@ -495,23 +460,18 @@ class InventoryUI:
             self._show_message("이미 최대 내구도입니다!", (1, 0.8, 0.3, 1))
             return
 
-        # 수리 비용
-        wood_cost = 3
-        stone_cost = 2
-
         # 리소스 확인
-        if (self.game.player.get_resource_count('wood') < wood_cost or
-            self.game.player.get_resource_count('stone') < stone_cost):
-            self._show_message(f"리소스 부족! 나무 {wood_cost}, 돌 {stone_cost} 필요", (1, 0.3, 0.3, 1))
+        if not self.game.player.can_craft('repair_tool'):
+            cost = recipes.format_cost(recipes.get_cost('repair_tool'))
+            self._show_message(f"리소스 부족! {cost} 필요", (1, 0.3, 0.3, 1))
             return
 
         # 수리 수행
         old_durability = tool.get_durability_percentage()
-        self.game.player.use_resources({'wood': wood_cost, 'stone': stone_cost})
-        new_durability = tool.repair()
+        self.game.player.repair_tool_at(slot_index)
+        new_durability = tool.get_durability_percentage()
 
         self._show_message(f"{tool.name} 수리: {old_durability}% -> {new_durability}%", (0.3, 1, 0.3, 1))
-        self.update()
 
     def _show_tool_tooltip(self, slot_index, event):
         """도구 툴팁 표시"""
@@ -545,14 +505,19 @@ class InventoryUI:
             self.show()
 
     def show(self):
-        """인벤토리 표시"""
+        """인벤토리 표시 (처음이면 UI 생성)"""
+        if self.main_frame is None:
+            self._create_ui()
+
         self.is_visible = True
         self.main_frame.show()
 
         # 탭 초기화 (도구 탭으로)
         self._switch_tab('tools')
 
-        self.update()
+        # 숨겨져 있는 동안 쌓인 변경 반영
+        self._flush()
+        self.tooltip_frame.hide()
 
         # 마우스 커서 표시
         props = WindowProperties()
@@ -563,8 +528,9 @@ class InventoryUI:
     def hide(self):
         """인벤토리 숨김"""
         self.is_visible = False
-        self.main_frame.hide()
-        self.tooltip_frame.hide()  # 툴팁도 숨기기
+        if self.main_frame:
+            self.main_frame.hide()
+            self.tooltip_frame.hide()  # 툴팁도 숨기기
 
         # 마우스 커서 숨김
         props = WindowProperties()
@@ -577,84 +543,100 @@ class InventoryUI:
         center_y = self.game.win.getYSize() // 2
         self.game.win.movePointer(0, center_x, center_y)
 
-    def update(self):
-        """인벤토리 표시 업데이트"""
-        # 도구 슬롯 업데이트
-        for i, btn in enumerate(self.tool_buttons):
-            tool = self.game.player.get_tool_at_slot(i)
-            if tool:
-                is_equipped = self.game.player.current_tool == tool
-                equipped_mark = " > " if is_equipped else ""
-                durability = tool.get_durability_percentage()
-                status = f"{equipped_mark}{tool.name}\n{durability}%"
-                btn['text'] = status
-
-                if tool.broken:
-                    btn['text_fg'] = (0.8, 0.2, 0.2, 1)  # 빨간색
-                elif is_equipped:
-                    btn['text_fg'] = (0.2, 0.8, 0.2, 1)  # 초록색
-                else:
-                    btn['text_fg'] = (0.8, 0.8, 0.2, 1)  # 노란색
-            else:
-                btn['text'] = f"[Empty {i+1}]"
-                btn['text_fg'] = (0.5, 0.5, 0.5, 1)  # 회색
+    def _on_inventory_changed(self, kind, changed):
+        """Player 인벤토리 변경 이벤트 처리 (조합 가능 비트는 Player가 미리 계산)"""
+        if kind == 'resources':
+            self.dirty_resources |= changed
+        elif kind == 'tools':
+            self.dirty_slots |= changed
 
-        # 리소스 업데이트
-        wood_count = self.game.player.get_resource_count('wood')
-        stone_count = self.game.player.get_resource_count('stone')
-        self.resource_labels['wood']['text'] = f"Wood: {wood_count}"
-        self.resource_labels['stone']['text'] = f"Stone: {stone_count}"
+        # 보이는 동안에만 위젯 갱신
+        if self.is_visible:
+            self._flush()
 
-        # 조합 버튼 업데이트 (리소스 충분한지 확인)
+    def _set(self, widget, option, value):
+        """DirectGui 속성 설정 (값이 같으면 재배치를 피하기 위해 건너뜀)"""
+        key = (id(widget), option)
+        if self.widget_cache.get(key) == value:
+            return
+        self.widget_cache[key] = value
+        widget[option] = value
+
+    def _flush(self):
+        """쌓인 변경이 있는 위젯만 갱신"""
+        mask = self.game.player.craft_mask
+        flipped = ~0 if self.shown_mask is None else mask ^ self.shown_mask
+        self.shown_mask = mask
+
+        # 수리 가능 여부가 바뀌면 모든 수리 버튼 색상이 바뀜
+        if flipped & REPAIR_BIT:
+            self.dirty_slots |= set(range(len(self.tool_buttons)))
+
+        for i in self.dirty_slots:
+            self._refresh_slot(i, mask & REPAIR_BIT)
+        self.dirty_slots.clear()
+
+        for res_type in self.dirty_resources:
+            label = self.resource_labels.get(res_type)
+            if label:
+                count = self.game.player.get_resource_count(res_type)
+                self._set(label, 'text', f"{res_type.capitalize()}: {count}")
+        self.dirty_resources.clear()
+
+        # 조합 가능 여부가 뒤집힌 버튼만 색상 변경
         for btn in self.crafting_buttons:
-            # extraArgs에서 item_id 가져오기
-            item_id = btn['extraArgs'][0]
-            recipe = CRAFTING_RECIPES[item_id]
-            cost = recipe['cost']
-
-            # 리소스 확인
-            can_craft = True
-            for res_type, amount in cost.items():
-                if self.game.player.get_resource_count(res_type) < amount:
-                    can_craft = False
-                    break
-
-            if can_craft:
-                btn['frameColor'] = (0.2, 0.5, 0.2, 0.8)  # 초록색 (조합 가능)
-            else:
-                btn['frameColor'] = (0.5, 0.2, 0.2, 0.8)  # 빨간색 (리소스 부족)
-
-        # 수리 버튼 업데이트
-        wood_count = self.game.player.get_resource_count('wood')
-        stone_count = self.game.player.get_resource_count('stone')
-        can_repair = wood_count >= 3 and stone_count >= 2
-
-        for i, btn in enumerate(self.repair_buttons):
-            tool = self.game.player.get_tool_at_slot(i)
-            if tool:
-                durability = tool.get_durability_percentage()
-                btn['text'] = f"Repair {tool.name}\n({durability}%)"
-
-                if tool.broken:
-                    btn['frameColor'] = (0.8, 0.2, 0.2, 0.9) if can_repair else (0.5, 0.2, 0.2, 0.6)
-                elif durability >= 100:
-                    btn['frameColor'] = (0.3, 0.3, 0.3, 0.6)  # 회색 (수리 불필요)
+            bit = recipes.RECIPE_BITS[btn['extraArgs'][0]]
+            if flipped & bit:
+                if mask & bit:
+                    self._set(btn, 'frameColor', (0.2, 0.5, 0.2, 0.8))  # 초록색 (조합 가능)
                 else:
-                    btn['frameColor'] = (0.5, 0.3, 0.1, 0.9) if can_repair else (0.4, 0.2, 0.1, 0.6)
-            else:
-                btn['text'] = f"Empty Slot {i+1}"
-                btn['frameColor'] = (0.2, 0.2, 0.2, 0.4)
+                    self._set(btn, 'frameColor', (0.5, 0.2, 0.2, 0.8))  # 빨간색 (리소스 부족)
 
-        # 드롭 버튼 표시 제어 (도구 탭에서만 표시)
-        if self.current_tab == 'tools':
-            self.drop_btn.show()
+    def _refresh_slot(self, i, can_repair):
+        """도구 슬롯 하나의 도구/수리 버튼 갱신"""
+        btn = self.tool_buttons[i]
+        repair_btn = self.repair_buttons[i]
+        tool = self.game.player.get_tool_at_slot(i)
+
+        if not tool:
+            self._set(btn, 'text', f"[Empty {i+1}]")
+            self._set(btn, 'text_fg', (0.5, 0.5, 0.5, 1))  # 회색
+            self._set(repair_btn, 'text', f"Empty Slot {i+1}")
+            self._set(repair_btn, 'frameColor', (0.2, 0.2, 0.2, 0.4))
+            return
+
+        is_equipped = self.game.player.current_tool == tool
+        equipped_mark = " > " if is_equipped else ""
+        durability = tool.get_durability_percentage()
+        self._set(btn, 'text', f"{equipped_mark}{tool.name}\n{durability}%")
+
+        if tool.broken:
+            self._set(btn, 'text_fg', (0.8, 0.2, 0.2, 1))  # 빨간색
+        elif is_equipped:
+            self._set(btn, 'text_fg', (0.2, 0.8, 0.2, 1))  # 초록색
         else:
-            self.drop_btn.hide()
+            self._set(btn, 'text_fg', (0.8, 0.8, 0.2, 1))  # 노란색
 
-        # 툴팁 숨기기
-        self.tooltip_frame.hide()
+        self._set(repair_btn, 'text', f"Repair {tool.name}\n({durability}%)")
+        if tool.broken:
+            color = (0.8, 0.2, 0.2, 0.9) if can_repair else (0.5, 0.2, 0.2, 0.6)
+        elif durability >= 100:
+            color = (0.3, 0.3, 0.3, 0.6)  # 회색 (수리 불필요)
+        else:
+            color = (0.5, 0.3, 0.1, 0.9) if can_repair else (0.4, 0.2, 0.1, 0.6)
+        self._set(repair_btn, 'frameColor', color)
+
+    def update(self):
+        """인벤토리 전체 다시 그리기 (변경 이벤트 밖에서 상태가 바뀐 경우)"""
+        self.dirty_slots = set(range(len(self.game.player.tool_slots)))
+        self.dirty_resources = set(self.game.player.inventory)
+        self.shown_mask = None
+        if self.is_visible:
+            self._flush()
 
     def cleanup(self):
         """정리"""
+        self.game.player.remove_inventory_listener(self._on_inventory_changed)
         if self.main_frame:
             self.main_frame.destroy()
+            self.main_frame = None
@@ -0,0 +1,190 @@
+"""
+킬 피드
+미리 만들어 둔 고정 개수의 텍스트 슬롯을 링 버퍼로 재사용
+"""
+from direct.gui.OnscreenText import OnscreenText
+from panda3d.core import TextNode
+
+
+# 적 타입별 색상
+KILL_FEED_COLORS = {
+    'melee': (0.9, 0.2, 0.2, 1),     # 빨간색
+    'ranged': (0.8, 0.2, 0.8, 1),    # 보라색
+    'sprinter': (1.0, 0.8, 0.0, 1),  # 노란색
+    'tank': (0.3, 0.3, 0.3, 1),      # 검은색
+    'bomber': (1.0, 0.5, 0.0, 1)     # 주황색
+}
+
+# 페이드 알파 단계 (이 단위로 바뀔 때만 색상 스케일 갱신)
+_FADE_STEPS = 32
+
+
+class KillFeedSlot:
+    """킬 피드 한 줄 (텍스트 노드는 재사용)"""
+
+    def __init__(self, parent):
+        self.text = OnscreenText(
+            text="",
+            pos=(0, 0),
+            scale=0.05,
+            fg=(1, 1, 1, 1),
+            align=TextNode.ACenter,
+            parent=parent,
+            mayChange=True
+        )
+        self.text.hide()
+        self.active = False
+        self.enemy_type = None
+        self.count = 0
+        self.score = 0
+        self.time = 0.0
+        self.fade_step = -1
+
+    def assign(self, enemy_type, count, score):
+        """슬롯에 새 킬 기록"""
+        self.active = True
+        self.enemy_type = enemy_type
+        self.count = count
+        self.score = score
+        self.time = 0.0
+        self.fade_step = -1
+        self.text.setFg(KILL_FEED_COLORS.get(enemy_type, (1, 1, 1, 1)))
+        self._refresh_text()
+        self.text.show()
+
+    def merge(self, count, score):
+        """같은 타입 킬을 합침 (x3 MELEE)"""
+        self.count += count
+        self.score += score
+        self.time = 0.0
+        self.fade_step = -1
+        self._refresh_text()
+
+    def _refresh_text(self):
+        """표시 문자열 갱신"""
+        name = self.enemy_type.upper()
+        if self.count > 1:
+            self.text.setText(f"Killed x{self.count} {name} (+{self.score})")
+        else:
+            self.text.setText(f"Killed {name} (+{self.score})")
+
+    def release(self):
+        """슬롯 비우기"""
+        self.active = False
+        self.text.hide()
+
+    def destroy(self):
+        """정리"""
+        self.text.destroy()
+
+
+class KillFeed:
+    """링 버퍼 킬 피드 (같은 프레임/짧은 간격의 같은 타입 킬은 한 줄로 합침)"""
+
+    def __init__(self, game, capacity=5, duration=3.0, merge_window=0.5):
+        self.game = game
+        self.capacity = capacity
+        self.duration = duration          # 3초 후 제거
+        self.merge_window = merge_window  # 이 시간 안의 같은 타입 킬은 합침
+        self.top = 0.3                    # 첫 줄 위치
+        self.line_spacing = 0.05
+
+        self.root = self.game.aspect2d.attachNewNode('kill_feed')
+        self.root.setPos(0.5, 0, 0)
+        self.slots = [KillFeedSlot(self.root) for _ in range(capacity)]
+        self.head = 0    # 가장 오래된 슬롯
+        self.count = 0   # 사용 중인 슬롯 수
+        self.pending = {}  # 이번 프레임에 들어온 킬 (enemy_type -> [count, score])
+
+    def add(self, enemy_type, score):
+        """킬 기록 (프레임 끝 update에서 타입별로 모아 표시)"""
+        entry = self.pending.get(enemy_type)
+        if entry is None:
+            self.pending[enemy_type] = [1, score]
+        else:
+            entry[0] += 1
+            entry[1] += score
+
+    def _newest(self):
+        """가장 최근 슬롯 (없으면 None)"""
+        if self.count == 0:
+            return None
+        return self.slots[(self.head + self.count - 1) % self.capacity]
+
+    def _push(self, enemy_type, count, score):
+        """새 줄 추가 (가득 차면 가장 오래된 줄을 재사용)"""
+        newest = self._newest()
+        if newest and newest.enemy_type == enemy_type and newest.time < self.merge_window:
+            newest.merge(count, score)
+            return
+
+        if self.count == self.capacity:
+            self.slots[self.head].release()
+            self.head = (self.head + 1) % self.capacity
+            self.count -= 1
+
+        slot = self.slots[(self.head + self.count) % self.capacity]
+        self.count += 1
+        slot.assign(enemy_type, count, score)
+        self._layout()
+
+    def _layout(self):
+        """오래된 줄부터 위에서 아래로 배치 (추가/만료 시에만)"""
+        for i in range(self.count):
+            slot = self.slots[(self.head + i) % self.capacity]
+            slot.text.setPos(0, self.top - i * self.line_spacing)
+
+    def update(self, dt):
+        """대기 중인 킬 반영 + 페이드/만료 처리"""
+        if self.pending:
+            for enemy_type, (count, score) in self.pending.items():
+                self._push(enemy_type, count, score)
+            self.pending.clear()
+
+        if self.count == 0:
+            return
+
+        expired = 0
+        for i in range(self.count):
+            slot = self.slots[(self.head + i) % self.capacity]
+            slot.time += dt
+
+            if slot.time >= self.duration:
+                # 오래된 줄부터 만료되므로 앞쪽만 잘라내면 됨
+                if i == expired:
+                    expired += 1
+                continue
+
+            # 페이드 아웃 (알파 단계가 바뀔 때만 색상 스케일 갱신)
+            step = int((1.0 - slot.time / self.duration) * _FADE_STEPS)
+            if step != slot.fade_step:
+                slot.fade_step = step
+                slot.text.setColorScale(1, 1, 1, step / _FADE_STEPS)
+
+        if expired:
+            for _ in range(expired):
+                self.slots[self.head].release()
+                self.head = (self.head + 1) % self.capacity
+                self.count -= 1
+            self._layout()
+
+    def clear(self):
+        """모든 줄 비우기"""
+        for slot in self.slots:
+            slot.release()
+        self.head = 0
+        self.count = 0
+        self.pending.clear()
+
+    def reset(self):
+        """재시작 - 모든 줄 비우기 (슬롯은 유지)"""
+        self.clear()
+
+    def cleanup(self):
+        """정리"""
+        for slot in self.slots:
+            slot.destroy()
+        self.slots = []
+        if self.root:
+            self.root.removeNode()
+            self.root = None
@@ -0,0 +1,188 @@
+"""
+최고 점수 리더보드
+게임 오버마다 세션 결과(점수, 처치 수, 도달 웨이브, 플레이 시간)를 기록
+상위 N개는 시작 시 인덱스로 한 번 읽어 메모리에 정렬해 두고, 새 기록이 들어오면 그 자리에 끼워 넣음
+"""
+from bisect import bisect_left, insort
+import time
+
+from direct.gui.DirectGui import DirectFrame, DirectButton
+from direct.gui.OnscreenText import OnscreenText
+from panda3d.core import TextNode
+
+
+# 메모리에 유지하는 상위 기록 수 / 한 페이지 줄 수
+LEADERBOARD_CACHE_SIZE = 100
+LEADERBOARD_PAGE_SIZE = 10
+
+SQL_INSERT_SESSION = (
+    "INSERT INTO sessions (id, player_id, score, kills, wave, duration, created_at) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+class Leaderboard:
+    """세션 기록 + 상위 N 캐시"""
+
+    def __init__(self, game):
+        self.game = game
+        db = game.db
+
+        # 상위 기록 (정렬 키 (-점수, id) 순) - 점수 인덱스를 타는 질의 한 번
+        self.top = [
+            (-score, session_id, kills, wave, duration)
+            for session_id, score, kills, wave, duration in db.query(
+                "SELECT id, score, kills, wave, duration FROM sessions "
+                "ORDER BY score DESC, id LIMIT ?",
+                (LEADERBOARD_CACHE_SIZE,)
+            )
+        ]
+        self.total, last_id = db.query("SELECT COUNT(*), MAX(id) FROM sessions")[0]
+        self.next_session_id = (last_id or 0) + 1
+
+        # 이 PC의 플레이어 (처음 실행이면 생성)
+        player_id = db.get_setting('player_id')
+        if player_id is None or db.get_player(int(player_id)) is None:
+            player_id = db.add_player("Player")
+            db.set_setting('player_id', str(player_id))
+        self.player_id = int(player_id)
+        player = db.get_player(self.player_id)
+        self.best_score = player[2] if player else 0
+
+        print(f"[Leaderboard] 기록 {self.total}개 (상위 {len(self.top)}개 캐시)")
+
+    def record_session(self, score, kills, wave, duration):
+        """세션 결과 기록 - 순위 반환 (캐시 밖이면 None)"""
+        session_id = self.next_session_id
+        self.next_session_id += 1
+        self.total += 1
+
+        created_at = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime())
+        self.game.db.writer.submit(
+            SQL_INSERT_SESSION,
+            (session_id, self.player_id, score, kills, wave, duration, created_at)
+        )
+
+        if score > self.best_score:
+            self.best_score = score
+            self.game.db.update_score(self.player_id, score)
+
+        # 상위 캐시에 끼워 넣기 (들어갈 자리가 없으면 건너뜀)
+        entry = (-score, session_id, kills, wave, duration)
+        if len(self.top) < LEADERBOARD_CACHE_SIZE or entry < self.top[-1]:
+            insort(self.top, entry)
+            del self.top[LEADERBOARD_CACHE_SIZE:]
+            rank = bisect_left(self.top, entry) + 1
+        else:
+            rank = None
+
+        print(f"[Leaderboard] 세션 기록: {score}점, {kills}킬, 웨이브 {wave}, "
+              f"{duration:.0f}초 (순위: {rank or f'>{LEADERBOARD_CACHE_SIZE}'})")
+        return session_id, rank
+
+    def page_count(self):
+        """페이지 수 (캐시 기준)"""
+        return max(1, (len(self.top) + LEADERBOARD_PAGE_SIZE - 1) // LEADERBOARD_PAGE_SIZE)
+
+    def page(self, index):
+        """한 페이지 [(순위, 세션 id, 점수, 처치 수, 웨이브, 플레이 시간)]"""
+        start = index * LEADERBOARD_PAGE_SIZE
+        return [
+            (start + i + 1, session_id, -neg_score, kills, wave, duration)
+            for i, (neg_score, session_id, kills, wave, duration)
+            in enumerate(self.top[start:start + LEADERBOARD_PAGE_SIZE])
+        ]
+
+
+class LeaderboardPanel:
+    """게임 오버 화면의 리더보드 (페이지 넘김)"""
+
+    def __init__(self, game, leaderboard, parent=None):
+        self.game = game
+        self.leaderboard = leaderboard
+        self.current_page = 0
+        self.highlight_id = None  # 방금 기록한 세션 (강조 표시)
+
+        self.frame = DirectFrame(
+            parent=parent,
+            pos=(1.05, 0, 0),
+            frameSize=(-0.5, 0.5, -0.5, 0.5),
+            frameColor=(0.1, 0.1, 0.1, 0.9)
+        )
+
+        OnscreenText(
+            text="LEADERBOARD",
+            pos=(0, 0.4),
+            scale=0.07,
+            fg=(1, 0.8, 0.2, 1),
+            align=TextNode.ACenter,
+            parent=self.frame
+        )
+
+        self.rows_text = OnscreenText(
+            text="",
+            pos=(-0.45, 0.3),
+            scale=0.045,
+            fg=(1, 1, 1, 1),
+            align=TextNode.ALeft,
+            parent=self.frame,
+            mayChange=True
+        )
+
+        self.page_text = OnscreenText(
+            text="",
+            pos=(0, -0.44),
+            scale=0.045,
+            fg=(0.8, 0.8, 0.8, 1),
+            align=TextNode.ACenter,
+            parent=self.frame,
+            mayChange=True
+        )
+
+        for text, x, step in (("<", -0.35, -1), (">", 0.35, 1)):
+            DirectButton(
+                parent=self.frame,
+                pos=(x, 0, -0.43),
+                scale=0.06,
+                text=text,
+                text_fg=(1, 1, 1, 1),
+                frameColor=(0.3, 0.3, 0.3, 1),
+                frameSize=(-1, 1, -0.5, 0.9),
+                command=self._turn_page,
+                extraArgs=[step]
+            )
+
+    def show(self, highlight_id=None, rank=None):
+        """리더보드 표시 (방금 기록이 있는 페이지부터)"""
+        self.highlight_id = highlight_id
+        self.current_page = (rank - 1) // LEADERBOARD_PAGE_SIZE if rank else 0
+        self._refresh()
+        self.frame.show()
+
+    def hide(self):
+        """리더보드 숨김"""
+        self.frame.hide()
+
+    def _turn_page(self, step):
+        """페이지 넘김"""
+        page = self.current_page + step
+        if 0 <= page < self.leaderboard.page_count():
+            self.current_page = page
+            self._refresh()
+
+    def _refresh(self):
+        """현재 페이지 텍스트 갱신 (캐시된 목록에서 슬라이스만)"""
+        lines = []
+        for rank, session_id, score, kills, wave, duration in self.leaderboard.page(self.current_page):
+            marker = ">" if session_id == self.highlight_id else " "
+            minutes, seconds = divmod(int(duration), 60)
+            lines.append(f"{marker}{rank:3d}. {score:7d}  K{kills:<4d} W{wave:<3d} {minutes}:{seconds:02d}")
+        self.rows_text.setText("\n".join(lines) if lines else "No records yet")
+        self.page_text.setText(
+            f"{self.current_page + 1} / {self.leaderboard.page_count()}  "
+            f"({self.leaderboard.total} games)"
+        )
+
+    def destroy(self):
+        """정리"""
+        self.frame.destroy()
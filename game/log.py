@@ -0,0 +1,182 @@
+"""
+게임 로거
+서브시스템별 레벨, 링 버퍼 비동기 출력, 반복 메시지 속도 제한
+production 프로필에서는 핫 경로 로거가 아무 일도 하지 않는 함수로 바뀜
+
+사용법:
+    log = get_logger('enemy', hot=True)
+    log.debug("적 명중! 데미지: %s", damage)   # 포맷은 출력 스레드에서 지연 수행
+"""
+import logging
+import sys
+import threading
+import time
+from collections import deque
+
+from game.config import LOG_PROFILE, LOG_LEVELS, LOG_BUFFER_SIZE, LOG_RATE_LIMIT
+
+
+ROOT_LOGGER_NAME = "arenapulse"
+
+
+class RingBufferHandler(logging.Handler):
+    """레코드를 고정 크기 링 버퍼에 넣고 별도 스레드에서 모아 출력 (가득 차면 오래된 것부터 버림)"""
+
+    def __init__(self, capacity=1024, stream=None, flush_interval=0.1):
+        super().__init__()
+        self.buffer = deque(maxlen=capacity)
+        self.stream = stream or sys.stdout
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._wakeup = threading.Event()
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+
+    def emit(self, record):
+        """게임 스레드: 버퍼에 넣기만 함 (포맷/출력 없음)"""
+        if len(self.buffer) == self.buffer.maxlen:
+            self.dropped += 1
+        self.buffer.append(record)
+
+    def _run(self):
+        """출력 스레드"""
+        while self._running:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self._drain()
+        self._drain()
+
+    def _drain(self):
+        """버퍼에 쌓인 레코드를 한 번에 출력"""
+        if not self.buffer:
+            return
+
+        lines = []
+        while self.buffer:
+            try:
+                record = self.buffer.popleft()
+            except IndexError:
+                break
+            try:
+                lines.append(self.format(record))
+            except Exception:
+                self.handleError(record)
+
+        if self.dropped:
+            lines.append(f"[Log] 버퍼 초과로 {self.dropped}개 메시지 버림")
+            self.dropped = 0
+
+        try:
+            self.stream.write("\n".join(lines) + "\n")
+            self.stream.flush()
+        except Exception:
+            pass
+
+    def flush(self):
+        """즉시 출력 요청"""
+        self._wakeup.set()
+
+    def close(self):
+        """출력 스레드 종료 (남은 레코드 모두 출력)"""
+        self._running = False
+        self._wakeup.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout=1.0)
+        super().close()
+
+
+class RateLimitFilter(logging.Filter):
+    """같은 메시지(포맷 문자열 기준)가 구간마다 limit번을 넘으면 생략하고 다음 구간에 개수만 알림"""
+
+    def __init__(self, limit=5, interval=1.0):
+        super().__init__()
+        self.limit = limit
+        self.interval = interval
+        self.window_start = time.monotonic()
+        self.counts = {}  # (로거 이름, 포맷 문자열) -> 이번 구간 횟수
+
+    def filter(self, record):
+        key = (record.name, record.msg)
+
+        now = time.monotonic()
+        if now - self.window_start >= self.interval:
+            self._report_suppressed(record)
+            self.counts.clear()
+            self.window_start = now
+
+        count = self.counts.get(key, 0) + 1
+        self.counts[key] = count
+        return count <= self.limit
+
+    def _report_suppressed(self, record):
+        """지난 구간에 생략한 메시지 요약을 레코드 앞에 붙임"""
+        suppressed = [
+            f"{msg!s} x{count - self.limit}".replace("%", "%%")
+            for (name, msg), count in self.counts.items()
+            if count > self.limit
+        ]
+        if suppressed:
+            record.msg = f"(생략: {'; '.join(suppressed)}) {record.msg}"
+
+
+class _NullLogger:
+    """아무 일도 하지 않는 로거 (production 핫 경로용)"""
+
+    def _noop(self, *args, **kwargs):
+        pass
+
+    debug = info = warning = error = exception = log = _noop
+
+    def isEnabledFor(self, level):
+        return False
+
+
+NULL_LOGGER = _NullLogger()
+
+_handler = None
+
+
+def _setup():
+    """루트 로거 구성 (처음 get_logger 호출 시 한 번)"""
+    global _handler
+    if _handler is not None:
+        return
+
+    root = logging.getLogger(ROOT_LOGGER_NAME)
+    root.setLevel(LOG_LEVELS.get('default', 'INFO'))
+    root.propagate = False
+
+    _handler = RingBufferHandler(capacity=LOG_BUFFER_SIZE)
+    _handler.setFormatter(logging.Formatter("[%(module)s] %(message)s"))
+    _handler.addFilter(RateLimitFilter(limit=LOG_RATE_LIMIT))
+    root.addHandler(_handler)
+
+
+def get_logger(subsystem, hot=False):
+    """서브시스템 로거 (hot=True면 production 프로필에서 no-op 로거 반환)"""
+    if hot and LOG_PROFILE == 'production':
+        return NULL_LOGGER
+
+    _setup()
+    logger = logging.getLogger(f"{ROOT_LOGGER_NAME}.{subsystem}")
+    if subsystem in LOG_LEVELS:
+        logger.setLevel(LOG_LEVELS[subsystem])
+    return logger
+
+
+def set_level(subsystem, level):
+    """실행 중 서브시스템 레벨 변경 ('default'면 전체 기본값)"""
+    if subsystem == 'default':
+        logging.getLogger(ROOT_LOGGER_NAME).setLevel(level)
+    else:
+        logging.getLogger(f"{ROOT_LOGGER_NAME}.{subsystem}").setLevel(level)
+
+
+def shutdown():
+    """남은 로그 출력 후 종료"""
+    global _handler
+    if _handler is not None:
+        logging.getLogger(ROOT_LOGGER_NAME).removeHandler(_handler)
+        _handler.close()
+        _handler = None
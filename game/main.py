@@ -1,3 +1,19 @@
+import sys
+import os
+import time
+
+# 프로세스 시작 시각 (첫 프레임까지 걸린 시간의 기준점이라 다른 import보다 먼저)
+PROCESS_START = time.perf_counter()
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game.startup import StartupProfiler, STARTUP_MODULES
+
+# 프로필 모드면 모듈별 import 시간 측정 (아래 import는 이미 읽은 모듈을 그대로 씀)
+startup_profiler = StartupProfiler(PROCESS_START)
+startup_profiler.profile_imports(STARTUP_MODULES)
+
 from direct.showbase.ShowBase import ShowBase
 from direct.task import Task
 from direct.gui.OnscreenText import OnscreenText
@@ -10,124 +26,234 @@ from panda3d.core import (
     Point3,
     Vec4,
     TransparencyAttrib,
-    CardMaker,
     TextNode,
-    Texture,
-    TextureStage,
     ColorAttrib
 )
-import sys
-import os
-
-# 프로젝트 루트를 path에 추가
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from game.config import SCREEN_WIDTH, SCREEN_HEIGHT, WINDOW_TITLE
 from game.database import Database
+from game.settings import Settings
+from game.telemetry import Telemetry
+from game.leaderboard import Leaderboard, LeaderboardPanel
 from game.player import Player
 from game.controls import Controls
 from game.chat import ChatSystem
 from game.target import TargetSystem
 from game.sound import SoundManager
 from game.obstacle import ObstacleSystem
+from game.structures import StructureSystem
+from game.log import shutdown as shutdown_logging
 from game.daynight import DayNightCycle
 from game.enemy import EnemySystem
 from game.resources import ResourceSystem
 from game.ground_items import GroundItemSystem
 from game.inventory_ui import InventoryUI
+from game.spatial import SpatialIndex
+from game.world import World
+from game.particles import ParticleSystem
+from game.hud import HudLayer
+from game.glyphs import GlyphBatch
+from game.kill_feed import KillFeed
+from game.assets import AssetCache, LoadingScreen
+from game.savegame import SaveSystem
+
+
+# 플레이어(현재 무기 포함) 속성 -> HUD 바인딩
+HUD_FIELDS = {
+    'current_weapon': ('weapon', 'ammo'),
+    'current_fire_mode': ('weapon',),
+    'durability': ('weapon',),
+    'broken': ('weapon',),
+    'magazine_size': ('ammo',),
+    'current_ammo': ('ammo',),
+    'total_ammo': ('ammo',),
+    'health': ('health',),
+    'defense': ('defense',),
+    'stamina': ('stamina',),
+}
 
 
 class ArenaPulseGame(ShowBase):
     def __init__(self):
-        ShowBase.__init__(self)
+        # 시작 단계별 시간 기록 (STARTUP_PROFILE이면 표로 출력)
+        self.startup = startup_profiler
+
+        with self.startup.measure('showbase'):
+            ShowBase.__init__(self)
 
         # 창 설정 (Full HD 1920x1080)
         self._setup_window()
 
         # 데이터베이스 초기화
-        self.db = Database()
+        with self.startup.measure('database'):
+            self.db = Database()
+
+        # /exit, 창 닫기, 메뉴 종료 모두 userExit()에서 exitFunc를 부름 - 남은 쓰기를 반영하고 DB를 닫음
+        self.saves = None
+        self.exitFunc = self._shutdown
+
+        # 설정 캐시 (DB 설정을 한 번 읽어 두고 바뀐 값만 모아서 저장)
+        with self.startup.measure('settings'):
+            self.settings = Settings(self)
+
+        # 게임플레이 이벤트 로그 (몇 초마다 DB에 일괄 기록)
+        self.telemetry = Telemetry(self)
+
+        # 리더보드 (상위 기록은 시작 시 한 번 읽어 캐시)
+        with self.startup.measure('leaderboard'):
+            self.leaderboard = Leaderboard(self)
+
+        # 에셋 캐시 (매니페스트의 텍스처/사운드를 로딩 화면 뒤에서 미리 읽음)
+        self.assets = AssetCache(self)
+        self.loading_screen = LoadingScreen(self)
+        self.assets.preload(self._start_game, self.loading_screen.set_progress)
+
+    def _start_game(self):
+        """에셋 미리 읽기가 끝난 뒤 게임 시스템 구성"""
+        self.loading_screen.destroy()
+        self.loading_screen = None
+        self.startup.record('assets (preload)', self.assets.preload_time)
 
         # 사운드 매니저 초기화
-        self.sound = SoundManager(self)
+        with self.startup.measure('sound'):
+            self.sound = SoundManager(self)
+
+        # 공간 인덱스 (리소스, 바닥 아이템, 표적, 적 근접 질의)
+        with self.startup.measure('spatial'):
+            self.spatial = SpatialIndex()
+
+        # 파티클 시스템 (채집, 피격, 폭발 효과)
+        with self.startup.measure('particles'):
+            self.particles = ParticleSystem(self)
+
+        # HUD 바인딩 레이어 (값이 바뀔 때만 텍스트 갱신)
+        with self.startup.measure('hud'):
+            self.hud = HudLayer(self)
+
+        # 숫자 HUD 글리프 배치 (아틀라스 한 장, Geom 하나)
+        with self.startup.measure('glyphs'):
+            self.glyphs = GlyphBatch(self)
 
         # 조명 설정
-        self._setup_lights()
+        with self.startup.measure('lights'):
+            self._setup_lights()
 
         # 기본 씬 생성
-        self._create_scene()
-
-        # 구름 생성
-        self._create_clouds()
+        with self.startup.measure('world'):
+            self._create_scene()
 
         # 플레이어 생성
-        self.player = Player(self)
+        with self.startup.measure('player'):
+            self.player = Player(self)
 
         # 카메라를 플레이어에 연결 (FPS)
         self._setup_fps_camera()
+        self.settings.add_listener('fov', self._on_fov_changed)
 
         # 컨트롤 설정
-        self.controls = Controls(self, self.player)
+        with self.startup.measure('controls'):
+            self.controls = Controls(self, self.player)
 
         # 조준점 UI 생성
-        self._create_crosshair()
+        with self.startup.measure('hud_widgets'):
+            self._create_crosshair()
 
         # 총알 UI 생성
-        self._create_ammo_ui()
+        with self.startup.measure('hud_widgets'):
+            self._create_ammo_ui()
 
         # 총기 이미지 UI 생성
-        self._create_gun_ui()
+        with self.startup.measure('hud_widgets'):
+            self._create_gun_ui()
 
         # 채팅 시스템 생성
-        self.chat = ChatSystem(self)
+        with self.startup.measure('chat'):
+            self.chat = ChatSystem(self)
 
         # 표적 시스템 생성
-        self.targets = TargetSystem(self)
+        with self.startup.measure('targets'):
+            self.targets = TargetSystem(self)
 
         # 장애물 시스템 생성
-        self.obstacles = ObstacleSystem(self)
+        with self.startup.measure('obstacles'):
+            self.obstacles = ObstacleSystem(self)
+
+        # 구조물 설치 시스템 생성
+        with self.startup.measure('structures'):
+            self.structures = StructureSystem(self)
 
         # 밤낮 시스템 생성
-        self.daynight = DayNightCycle(self)
+        with self.startup.measure('daynight'):
+            self.daynight = DayNightCycle(self)
 
         # 적 시스템 생성
-        self.enemies = EnemySystem(self)
+        with self.startup.measure('enemies'):
+            self.enemies = EnemySystem(self)
 
         # 리소스 시스템 생성
-        self.resources = ResourceSystem(self)
+        with self.startup.measure('resources'):
+            self.resources = ResourceSystem(self)
+
+        # 시작 지점 주변 청크 즉시 생성 (나머지는 스트리밍)
+        with self.startup.measure('world (first chunks)'):
+            self.world.load_around(self.player.node.getPos())
 
         # 바닥 아이템 시스템 생성
-        self.ground_items = GroundItemSystem(self)
+        with self.startup.measure('ground_items'):
+            self.ground_items = GroundItemSystem(self)
 
         # 인벤토리 UI 생성
-        self.inventory_ui = InventoryUI(self)
+        with self.startup.measure('inventory_ui'):
+            self.inventory_ui = InventoryUI(self)
+
+        # 세이브 시스템 생성 (자동 저장)
+        with self.startup.measure('saves'):
+            self.saves = SaveSystem(self)
 
         # 체력과 방어력 UI 생성
-        self._create_stats_ui()
+        with self.startup.measure('hud_widgets'):
+            self._create_stats_ui()
 
         # 스코어 UI 생성
-        self._create_score_ui()
+        with self.startup.measure('hud_widgets'):
+            self._create_score_ui()
 
         # 킬 피드 UI 생성
-        self._create_kill_feed_ui()
+        with self.startup.measure('hud_widgets'):
+            self._create_kill_feed_ui()
 
         # 데미지 인디케이터 생성
-        self._create_damage_indicator()
+        with self.startup.measure('hud_widgets'):
+            self._create_damage_indicator()
 
         # 웨이브 알림 생성
-        self._create_wave_notification()
+        with self.startup.measure('hud_widgets'):
+            self._create_wave_notification()
 
         # 인벤토리 UI 생성
-        self._create_inventory_ui()
+        with self.startup.measure('hud_widgets'):
+            self._create_inventory_ui()
+
+        # 게임 오버 화면은 처음 게임 오버될 때 생성
+        self.game_over_frame = None
 
-        # 게임 오버 화면 생성
-        self._create_game_over_screen()
+        # HUD 위젯을 플레이어/무기 값에 연결
+        with self.startup.measure('hud_bindings'):
+            self._bind_hud()
 
         # 게임 상태
         self.game_over = False
+        self.session_start = globalClock.getFrameTime()
+
+        # 시작 직후 장면 노드 수 (재시작 누수 검사 기준)
+        self.scene_nodes = self.render.countNumDescendants()
 
         # 메인 업데이트 태스크
         self.taskMgr.add(self._update_task, "UpdateTask")
 
+        # 첫 프레임 렌더링 직후 시간 기록 (igLoop 다음 순서)
+        self.taskMgr.add(self._first_frame_task, "FirstFrameTask", sort=51)
+
         print("[Game] ArenaPulse game started! (DOOM style FPS)")
         print("[Game] WASD: Move | Mouse: Aim | L-Click: Shoot | R-Click: Zoom | Space: Jump | Shift: Sprint | Ctrl: Crouch | R: Reload | E: Gather | ESC: Pause")
         print("[Game] I: Inventory | G: Drop Tool | E (near item): Pickup")
@@ -163,87 +289,10 @@ class ArenaPulseGame(ShowBase):
         print("[Game] 조명 설정 완료")
 
     def _create_scene(self):
-        """기본 씬 생성 - 흰색 돌 질감 바닥"""
-        # CardMaker로 바닥 평면 생성 (정점 색상 문제 해결)
-        cm = CardMaker('floor')
-        cm.setFrame(-100, 100, -100, 100)  # 200x200 크기
-        self.floor = self.render.attachNewNode(cm.generate())
-
-        # 바닥을 수평으로 회전
-        self.floor.setP(-90)
-        self.floor.setPos(0, 0, -0.1)
-
-        # 돌 질감 텍스처 로드
-        try:
-            stone_texture = self.loader.loadTexture("textures/stone.png")
-        except:
-            stone_texture = None
-
-        if stone_texture:
-            # 텍스처 반복 설정
-            stone_texture.setWrapU(Texture.WMRepeat)
-            stone_texture.setWrapV(Texture.WMRepeat)
-
-            # 텍스처 적용
-            self.floor.setTexture(stone_texture)
-            self.floor.setTexScale(TextureStage.getDefault(), 20, 20)
-
-            print("[Game] 돌 질감 텍스처 적용 완료 (20x20 타일링)")
-        else:
-            print("[Game] 텍스처 로드 실패 (textures/stone.png)")
-
-        print("[Game] 씬 생성 완료 (돌 질감 바닥)")
-
-    def _create_clouds(self):
-        """하늘에 구름 생성"""
-        self.clouds = []
-
-        # 구름 텍스처 로드
-        try:
-            cloud_texture = self.loader.loadTexture("textures/cloud.png")
-        except:
-            cloud_texture = None
-
-        if cloud_texture:
-            # 여러 개의 구름 생성
-            cloud_positions = [
-                (-50, -80, 40, 15),
-                (30, -90, 50, 18),
-                (70, -70, 35, 12),
-                (-30, -60, 45, 20),
-                (60, -85, 55, 16),
-                (0, -100, 38, 14),
-                (-70, -75, 48, 17),
-                (40, -65, 42, 13),
-            ]
-
-            for x, y, z, scale in cloud_positions:
-                # CardMaker로 구름 평면 생성
-                cm = CardMaker(f'cloud_{len(self.clouds)}')
-                cm.setFrame(-scale, scale, -scale * 0.6, scale * 0.6)
-                cloud = self.render.attachNewNode(cm.generate())
-
-                # 위치 설정
-                cloud.setPos(x, y, z)
-
-                # 항상 카메라를 향하도록 (Billboarding)
-                cloud.setBillboardPointEye()
-
-                # 투명도 설정
-                cloud.setTransparency(TransparencyAttrib.MAlpha)
-
-                # 텍스처 적용
-                cloud.setTexture(cloud_texture)
-
-                self.clouds.append({
-                    'node': cloud,
-                    'speed': 0.5 + (len(self.clouds) * 0.1),  # 각기 다른 속도
-                    'original_y': y
-                })
-
-            print(f"[Game] 구름 {len(self.clouds)}개 생성 완료")
-        else:
-            print("[Game] 구름 텍스처 로드 실패 (textures/cloud.png)")
+        """기본 씬 생성 - 청크 스트리밍 월드 (바닥, 리소스, 장애물은 청크 단위로 생성)"""
+        self.world = World(self)
+
+        print("[Game] 씬 생성 완료 (청크 월드)")
 
     def _setup_fps_camera(self):
         """FPS 카메라 설정"""
@@ -252,6 +301,12 @@ class ArenaPulseGame(ShowBase):
         self.player.setup_camera(self.camera)
         print("[Game] FPS 카메라 설정 완료")
 
+    def _on_fov_changed(self, key, value):
+        """시야각 설정 반영 (줌 중이면 줌 배율 유지)"""
+        if self.player.is_zoomed:
+            value *= self.player.current_weapon.zoom_fov_reduction
+        self.camLens.setFov(value)
+
     def _create_crosshair(self):
         """Create crosshair UI"""
         # Crosshair (+)
@@ -271,7 +326,7 @@ class ArenaPulseGame(ShowBase):
         print("[Game] Crosshair UI created")
 
     def _create_ammo_ui(self):
-        """총알 UI 생성"""
+        """총알 UI 생성 - 무기 이름/내구도는 텍스트, 탄약 수는 글리프 카운터 (가운데 줄)"""
         self.ammo_text = OnscreenText(
             text="",
             pos=(0, -0.85),
@@ -281,6 +336,14 @@ class ArenaPulseGame(ShowBase):
             mayChange=True
         )
 
+        self.ammo_counter = self.glyphs.add_counter(
+            18,
+            pos=(0, -0.85 - self.glyphs.atlas.line_height * 0.1),
+            scale=0.1,
+            fg=(1, 1, 1, 1),
+            align=TextNode.ACenter
+        )
+
         print("[Game] Ammo UI created")
 
     def _update_task(self, task):
@@ -292,12 +355,17 @@ class ArenaPulseGame(ShowBase):
             if not self.controls.is_paused() and not self.chat.is_open():
                 self.player.update(dt)
                 self.controls.update()
-                self._update_clouds(dt)
 
                 # 바운드 체크
                 if self._check_bounds():
                     self.show_game_over()
 
+            # 월드 청크 스트리밍
+            self.world.update(dt)
+
+            # 정적 배치 갱신 (구조물 철거가 있었을 때만)
+            self.obstacles.update(dt)
+
             # 표적 시스템 업데이트
             self.targets.update(dt)
 
@@ -314,14 +382,11 @@ class ArenaPulseGame(ShowBase):
             if not self.controls.is_paused():
                 self.daynight.update(dt)
 
-            # 총알 UI 업데이트
-            self._update_ammo_ui()
-
-            # 인벤토리 UI 업데이트
-            self._update_inventory_ui()
+                # 파티클 업데이트
+                self.particles.update(dt)
 
-            # 체력과 방어력 UI 업데이트
-            self._update_stats_ui()
+            # HUD 업데이트 (탄약, 체력, 인벤토리 등 - 바뀐 값만 다시 그림)
+            self.hud.update(dt)
 
             # 조준선 반동 복구
             self._update_crosshair_recoil(dt)
@@ -337,22 +402,82 @@ class ArenaPulseGame(ShowBase):
 
         return Task.cont
 
-    def _update_clouds(self, dt):
-        """구름 움직임 업데이트"""
-        for cloud in self.clouds:
-            # 구름을 천천히 이동
-            cloud['node'].setY(cloud['node'].getY() + cloud['speed'] * dt)
+    def _first_frame_task(self, task):
+        """첫 프레임이 그려진 뒤 한 번만 실행 - time-to-first-frame 기록"""
+        self.startup.mark_first_frame()
+        return Task.done
 
-            # 너무 멀어지면 반대편으로 이동
-            if cloud['node'].getY() > 50:
-                cloud['node'].setY(cloud['original_y'])
+    def _bind_hud(self):
+        """HUD 텍스트 위젯과 Player/Weapon 값 연결 (값이 바뀔 때 알림을 받아 갱신)"""
+        player = self.player
 
-    def _update_ammo_ui(self):
-        """총알 UI 업데이트 - 현재 무기 정보 표시"""
-        weapon = self.player.current_weapon
+        def weapon_value():
+            weapon = player.current_weapon
+            return (
+                weapon.name, weapon.get_fire_mode_name(), weapon.broken,
+                weapon.get_durability_percentage()
+            )
+
+        def ammo_value():
+            weapon = player.current_weapon
+            return (weapon.current_ammo, weapon.magazine_size, weapon.total_ammo)
+
+        self.hud.bind('weapon', self.ammo_text, weapon_value, self._format_weapon)
+        self.hud.bind(
+            'ammo', self.ammo_counter, ammo_value,
+            lambda v: f"{v[0]} / {v[1]}  ({v[2]})"
+        )
+        self.hud.bind(
+            'health', self.health_text,
+            lambda: (player.health, player.max_health),
+            lambda v: f"HP: {v[0]}/{v[1]}"
+        )
+        self.hud.bind(
+            'defense', self.defense_text,
+            lambda: (player.defense, player.max_defense),
+            lambda v: f"DEF: {v[0]}/{v[1]}"
+        )
+        self.hud.bind(
+            'stamina', self.stamina_text,
+            lambda: (int(player.stamina), player.max_stamina),
+            lambda v: f"STA: {v[0]}/{v[1]}"
+        )
+        self.hud.bind(
+            'wood', self.wood_text,
+            lambda: player.get_resource_count('wood'),
+            lambda v: f"Wood: {v}"
+        )
+        self.hud.bind(
+            'stone', self.stone_text,
+            lambda: player.get_resource_count('stone'),
+            lambda v: f"Stone: {v}"
+        )
+
+        enemies = self.enemies
+        self.hud.bind('score', self.score_text, lambda: enemies.total_score, lambda v: f"SCORE: {v}")
+        self.hud.bind('kills', self.kill_text, lambda: enemies.kill_count, lambda v: f"KILLS: {v}")
+        self.hud.bind('wave', self.wave_text, lambda: enemies.current_wave, lambda v: f"WAVE: {v}")
+
+        # 값이 바뀔 때만 해당 바인딩 갱신 (점수/처치/웨이브는 update_score_ui에서)
+        player.add_observer(self._on_player_changed)
+        player.add_inventory_listener(self._on_inventory_changed)
+
+    def _on_player_changed(self, player, name):
+        """플레이어 값 변경 -> 연결된 HUD만 갱신"""
+        for binding in HUD_FIELDS.get(name, ()):
+            self.hud.refresh(binding)
+
+    def _on_inventory_changed(self, kind, changed):
+        """리소스 변경 -> 나무/돌 HUD 갱신"""
+        if kind == 'resources':
+            for resource_type in changed:
+                self.hud.refresh(resource_type)
+
+    def _format_weapon(self, value):
+        """무기 UI 문자열 - 현재 무기 정보 표시 (가운데 줄은 탄약 카운터 자리)"""
+        name, mode_name, broken, dur_pct = value
 
         # 내구도 색상 (낮을수록 빨간색)
-        dur_pct = weapon.get_durability_percentage()
         if dur_pct > 60:
             dur_color = "(좋음)"
         elif dur_pct > 30:
@@ -361,23 +486,14 @@ class ArenaPulseGame(ShowBase):
             dur_color = "(위험)"
 
         # 무기 고장 상태
-        broken_text = " [BROKEN]" if weapon.broken else ""
+        broken_text = " [BROKEN]" if broken else ""
 
-        self.ammo_text.setText(
-            f"{weapon.name} [{weapon.get_fire_mode_name()}]{broken_text}\n"
-            f"{weapon.current_ammo} / {weapon.magazine_size}  ({weapon.total_ammo})\n"
+        return (
+            f"{name} [{mode_name}]{broken_text}\n"
+            f"\n"
             f"내구도: {dur_pct}% {dur_color}"
         )
 
-    def _update_stats_ui(self):
-        """체력과 방어력 UI 업데이트"""
-        self.health_text.setText(f"HP: {self.player.health}/{self.player.max_health}")
-        self.defense_text.setText(f"DEF: {self.player.defense}/{self.player.max_defense}")
-
-        # 스태미나 UI 업데이트
-        stamina_value = int(self.player.stamina)
-        self.stamina_text.setText(f"STA: {stamina_value}/{self.player.max_stamina}")
-
     def _update_crosshair_recoil(self, dt):
         """조준선 반동 복구"""
         # 오프셋 감소 (복구)
@@ -405,61 +521,61 @@ class ArenaPulseGame(ShowBase):
 
     def _create_gun_ui(self):
         """총기 이미지 UI 생성"""
-        try:
-            # 기본 총기 이미지
+        # 기본 총기 이미지
+        self.gun_image = None
+        gun_texture, gun_rect = self.assets.sprite('basic_gun')
+        if gun_texture:
             self.gun_image = OnscreenImage(
-                image='textures/basicGun.png',
+                image=gun_texture,
                 pos=(0.7, 0, -0.6),
                 scale=(0.5, 1, 0.3)
             )
+            self.assets.apply_uv(self.gun_image, gun_rect)
             self.gun_image.setTransparency(TransparencyAttrib.MAlpha)
-        except:
-            self.gun_image = None
-            print("[Game] 텍스처 로드 실패 (textures/basicGun.png)")
 
-        try:
-            # 줌 상태 총기 이미지 (숨김 상태로 시작)
+        # 줌 상태 총기 이미지 (숨김 상태로 시작)
+        self.gun_zoom_image = None
+        gun_zoom_texture, gun_zoom_rect = self.assets.sprite('basic_gun2')
+        if gun_zoom_texture:
             self.gun_zoom_image = OnscreenImage(
-                image='textures/basicGun2.png',
+                image=gun_zoom_texture,
                 pos=(0, 0, -0.4),
                 scale=(0.8, 1, 0.4)
             )
+            self.assets.apply_uv(self.gun_zoom_image, gun_zoom_rect)
             self.gun_zoom_image.setTransparency(TransparencyAttrib.MAlpha)
             self.gun_zoom_image.hide()
-        except:
-            self.gun_zoom_image = None
-            print("[Game] 텍스처 로드 실패 (textures/basicGun2.png)")
 
         print("[Game] Gun UI created")
 
     def _create_stats_ui(self):
         """체력과 방어력 UI 생성"""
-        self.health_text = OnscreenText(
-            text="HP: 100",
+        self.health_text = self.glyphs.add_counter(
+            12,
             pos=(-0.85, -0.85),
             scale=0.08,
             fg=(1, 0.3, 0.3, 1),
             align=TextNode.ALeft,
-            mayChange=True
+            text="HP: 100"
         )
 
-        self.defense_text = OnscreenText(
-            text="DEF: 100",
+        self.defense_text = self.glyphs.add_counter(
+            12,
             pos=(-0.85, -0.92),
             scale=0.08,
             fg=(0.3, 0.6, 1, 1),
             align=TextNode.ALeft,
-            mayChange=True
+            text="DEF: 100"
         )
 
         # 스태미나 UI 추가
-        self.stamina_text = OnscreenText(
-            text="STA: 100",
+        self.stamina_text = self.glyphs.add_counter(
+            12,
             pos=(-0.85, -0.99),
             scale=0.08,
             fg=(0.3, 1, 0.5, 1),
             align=TextNode.ALeft,
-            mayChange=True
+            text="STA: 100"
         )
 
         print("[Game] Stats UI created")
@@ -486,13 +602,6 @@ class ArenaPulseGame(ShowBase):
 
         print("[Game] Inventory UI created")
 
-    def _update_inventory_ui(self):
-        """인벤토리 UI 업데이트"""
-        wood_count = self.player.get_resource_count('wood')
-        stone_count = self.player.get_resource_count('stone')
-        self.wood_text.setText(f"Wood: {wood_count}")
-        self.stone_text.setText(f"Stone: {stone_count}")
-
     def _create_game_over_screen(self):
         """게임 오버 화면 생성"""
         from direct.gui.DirectGui import DirectFrame, DirectButton, DGG
@@ -541,14 +650,34 @@ class ArenaPulseGame(ShowBase):
             command=self._exit_game
         )
 
+        # 리더보드 패널 (게임 오버 프레임 오른쪽)
+        self.leaderboard_panel = LeaderboardPanel(self, self.leaderboard, parent=self.game_over_frame)
+
         print("[Game] Game Over screen created")
 
     def show_game_over(self):
-        """게임 오버 화면 표시"""
+        """게임 오버 화면 표시 (처음이면 생성)"""
+        if self.game_over_frame is None:
+            self._create_game_over_screen()
+
         self.game_over = True
         self.game_over_frame.show()
         self.game_over_text.show()
 
+        # 사망 위치 기록 후 바로 내보냄
+        pos = self.player.node.getPos()
+        self.telemetry.record('death', 'player', pos.x, pos.y, self.enemies.current_wave)
+        self.telemetry.flush()
+
+        # 세션 결과 기록 후 리더보드 표시
+        session_id, rank = self.leaderboard.record_session(
+            self.enemies.total_score,
+            self.enemies.kill_count,
+            self.enemies.current_wave,
+            globalClock.getFrameTime() - self.session_start
+        )
+        self.leaderboard_panel.show(session_id, rank)
+
         # 마우스 커서 표시
         props = WindowProperties()
         props.setCursorHidden(False)
@@ -558,38 +687,44 @@ class ArenaPulseGame(ShowBase):
         print("[Game] Game Over!")
 
     def _restart_game(self):
-        """게임 재시작"""
+        """게임 재시작 - 각 시스템을 reset()으로 초기 상태로 (풀과 지형은 재사용)"""
         print("[Game] Restarting game...")
+        start = time.perf_counter()
 
         # 게임 오버 상태 해제
         self.game_over = False
+        self.session_start = globalClock.getFrameTime()
         self.game_over_frame.hide()
         self.game_over_text.hide()
 
-        # 플레이어 상태 초기화
-        self.player.node.setPos(0, 0, 0)
-        self.player.health = self.player.max_health
-        self.player.defense = self.player.max_defense
-        self.player.gun_current_ammo = self.player.gun_magazine_size
-        self.player.gun_total_ammo = 300
-        self.player.heading = 0
-        self.player.pitch = 10
-        self.player.node.setH(0)
-        self.player.camera_node.setP(10)
-        self.player.velocity_z = 0.0
+        # 시스템 초기화 (순서: 플레이어 위치가 먼저 정해져야 월드가 그 주변을 남김,
+        # 사운드가 적보다 먼저 적/투사체에 붙은 음원 노드를 회수,
+        # 구조물/장애물을 치운 뒤 월드가 청크를 다시 만들고, 남은 리소스는 그 다음에 회복)
+        for system in (
+            self.player, self.targets, self.particles, self.kill_feed, self.sound,
+            self.enemies, self.ground_items, self.structures, self.obstacles,
+            self.world, self.resources, self.daynight,
+        ):
+            system.reset()
 
         # 카메라 리셋
         lens = self.camLens
-        lens.setFov(60)  # 기본 FOV로 리셋
+        lens.setFov(self.settings.get('fov'))  # 설정 FOV로 리셋
         self.update_gun_ui(False)
+        self.crosshair_offset = [0.0, 0.0]
+        self.crosshair.setPos(0, 0)
 
-        # 표적 시스템 리셋
-        self.targets.hide_targets()
+        # 화면 효과 리셋
+        self.damage_alpha = 0.0
+        self.damage_frame.hide()
+        self.wave_notification_alpha = 0.0
+        self.wave_notification_text.hide()
+        self.hud.refresh()
 
-        # 적 시스템 리셋
-        for enemy in self.enemies.enemies[:]:
-            enemy.cleanup()
-        self.enemies.enemies.clear()
+        # 새로 만든 노드가 시작 직후와 같아야 함 (남은 총알/적/아이템이 있으면 누수)
+        nodes = self.render.countNumDescendants()
+        assert nodes == self.scene_nodes, f"재시작 후 장면 노드 {nodes}개 (시작 직후 {self.scene_nodes}개)"
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
 
         # 마우스 다시 숨기고 중앙으로
         props = WindowProperties()
@@ -600,110 +735,61 @@ class ArenaPulseGame(ShowBase):
         center_y = self.win.getYSize() // 2
         self.win.movePointer(0, center_x, center_y)
 
-        print("[Game] Game restarted!")
+        print(f"[Game] Game restarted! ({elapsed_ms:.1f}ms, 장면 노드 {nodes}개)")
 
     def _create_score_ui(self):
         """스코어 및 웨이브 UI 생성"""
         # 스코어 텍스트
-        self.score_text = OnscreenText(
-            text="SCORE: 0",
+        self.score_text = self.glyphs.add_counter(
+            16,
             pos=(0.85, -0.85),
             scale=0.08,
             fg=(1, 1, 1, 1),
             align=TextNode.ARight,
-            mayChange=True
+            text="SCORE: 0"
         )
 
         # 킬 카운트 텍스트
-        self.kill_text = OnscreenText(
-            text="KILLS: 0",
+        self.kill_text = self.glyphs.add_counter(
+            12,
             pos=(0.85, -0.92),
             scale=0.08,
             fg=(1, 0.6, 0.2, 1),
             align=TextNode.ARight,
-            mayChange=True
+            text="KILLS: 0"
         )
 
         # 웨이브 텍스트
-        self.wave_text = OnscreenText(
-            text="WAVE: 1",
+        self.wave_text = self.glyphs.add_counter(
+            10,
             pos=(0.85, -0.99),
             scale=0.08,
             fg=(0.5, 0.8, 1, 1),
             align=TextNode.ARight,
-            mayChange=True
+            text="WAVE: 1"
         )
 
         print("[Game] Score UI created")
 
     def update_score_ui(self):
-        """스코어 UI 업데이트"""
-        stats = self.enemies.get_stats()
-        self.score_text.setText(f"SCORE: {stats['score']}")
-        self.kill_text.setText(f"KILLS: {stats['kills']}")
-        self.wave_text.setText(f"WAVE: {stats['wave']}")
+        """스코어 UI 업데이트 (바뀐 항목만 다시 그림)"""
+        self.hud.refresh('score')
+        self.hud.refresh('kills')
+        self.hud.refresh('wave')
 
     def _create_kill_feed_ui(self):
-        """킬 피드 UI 생성"""
-        self.kill_feed_entries = []
-        self.max_kill_feed_entries = 5
-        self.kill_feed_duration = 3.0  # 3초 후 제거
+        """킬 피드 UI 생성 (미리 할당한 슬롯 링 버퍼)"""
+        self.kill_feed = KillFeed(self, capacity=5, duration=3.0)
 
         print("[Game] Kill Feed UI created")
 
     def add_kill_feed(self, enemy_type, score):
-        """킬 피드에 추가"""
-        # 적 타입별 색상
-        colors = {
-            'melee': (0.9, 0.2, 0.2, 1),    # 빨간색
-            'ranged': (0.8, 0.2, 0.8, 1),   # 보라색
-            'sprinter': (1.0, 0.8, 0.0, 1),  # 노란색
-            'tank': (0.3, 0.3, 0.3, 1),     # 검은색
-            'bomber': (1.0, 0.5, 0.0, 1)    # 주황색
-        }
-
-        color = colors.get(enemy_type, (1, 1, 1, 1))
-
-        # 킬 메시지 생성
-        entry = OnscreenText(
-            text=f"Killed {enemy_type.upper()} (+{score})",
-            pos=(0.5, 0.3 - len(self.kill_feed_entries) * 0.05),
-            scale=0.05,
-            fg=color,
-            align=TextNode.ACenter,
-            mayChange=True
-        )
-
-        self.kill_feed_entries.append({
-            'node': entry,
-            'time': 0.0,
-            'base_color': color
-        })
-
-        # 최대 개수 초과시 가장 오래된 것 제거
-        if len(self.kill_feed_entries) > self.max_kill_feed_entries:
-            oldest = self.kill_feed_entries.pop(0)
-            oldest['node'].destroy()
+        """킬 피드에 추가 (같은 프레임의 같은 타입 킬은 한 줄로 합쳐짐)"""
+        self.kill_feed.add(enemy_type, score)
 
     def update_kill_feed(self, dt):
         """킬 피드 업데이트"""
-        for entry in self.kill_feed_entries[:]:
-            entry['time'] += dt
-
-            # 시간 초과시 제거
-            if entry['time'] >= self.kill_feed_duration:
-                entry['node'].destroy()
-                self.kill_feed_entries.remove(entry)
-            else:
-                # 페이드 아웃 효과
-                alpha = 1.0 - (entry['time'] / self.kill_feed_duration)
-                base_color = entry['base_color']
-                entry['node'].setFg((
-                    base_color[0],
-                    base_color[1],
-                    base_color[2],
-                    alpha
-                ))
+        self.kill_feed.update(dt)
 
     def _create_damage_indicator(self):
         """데미지 인디케이터 생성 (빨간 화면 효과)"""
@@ -788,14 +874,8 @@ class ArenaPulseGame(ShowBase):
             self.wave_notification_text.setPos(current_pos.x, current_pos.y + 0.05 * dt)
 
     def _check_bounds(self):
-        """플레이어가 바운드를 벗어났는지 체크"""
-        pos = self.player.node.getPos()
-        x, y = pos.x, pos.y
-
-        # 바닥 범위는 -100~100
-        if x < -100 or x > 100 or y < -100 or y > 100:
-            return True
-        return False
+        """플레이어가 월드 경계를 벗어났는지 체크"""
+        return self.world.is_out_of_bounds(self.player.node.getPos())
 
     def update_gun_ui(self, is_zoomed):
         """줌 상태에 따른 총기 이미지 변경"""
@@ -810,10 +890,8 @@ class ArenaPulseGame(ShowBase):
     def update_weapon_ui(self):
         """무기 전환 시 UI 업데이트"""
         # 현재 무기의 탄약 정보 즉시 업데이트
-        weapon = self.player.current_weapon
-        self.ammo_text.setText(
-            f"{weapon.name}\n{weapon.current_ammo} / {weapon.magazine_size}  ({weapon.total_ammo})"
-        )
+        self.hud.refresh('weapon')
+        self.hud.refresh('ammo')
 
     def _exit_game(self):
         """게임 종료"""
@@ -822,15 +900,31 @@ class ArenaPulseGame(ShowBase):
         self.controls.cleanup()
         self.chat.cleanup()
         self.targets.cleanup()
+        self.world.cleanup()
+        self.structures.cleanup()
         self.obstacles.cleanup()
         self.daynight.cleanup()
         self.enemies.cleanup()
         self.resources.cleanup()
         self.ground_items.cleanup()
+        self.particles.cleanup()
+        self.hud.cleanup()
+        self.glyphs.cleanup()
+        self.kill_feed.cleanup()
         self.inventory_ui.cleanup()
         self.sound.cleanup()
+        self.assets.cleanup()
+        self.userExit()
+
+    def _shutdown(self):
+        """종료 시 저장 정리 (ShowBase.exitFunc - 모든 종료 경로에서 sys.exit 직전에 호출)"""
+        self.exitFunc = None
+        if self.saves is not None:
+            self.saves.cleanup()
+        self.settings.cleanup()
+        self.telemetry.cleanup()
         self.db.close()
-        sys.exit()
+        shutdown_logging()
 
 
 def main():
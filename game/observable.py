@@ -0,0 +1,55 @@
+"""
+관찰 가능한 속성
+값이 실제로 바뀔 때만 소유 객체의 관찰자에게 (객체, 속성 이름)으로 알림
+HUD처럼 값이 바뀔 때만 다시 그리면 되는 쪽이 매 프레임 값을 읽지 않아도 됨
+
+사용법:
+    class Player(Observed):
+        health = Observable()
+
+    player.add_observer(callback)   # player.health가 바뀌면 callback(player, 'health')
+"""
+
+
+class Observable:
+    """값이 바뀌면 관찰자에게 알리는 속성 (값은 인스턴스 __dict__에 같은 이름으로 저장)"""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        try:
+            return obj.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+
+    def __set__(self, obj, value):
+        values = obj.__dict__
+        if self.name in values and values[self.name] == value:
+            return
+        values[self.name] = value
+        for observer in values.get('observers', ()):
+            observer(obj, self.name)
+
+
+class Observed:
+    """Observable 속성을 가진 객체의 관찰자 목록"""
+
+    def add_observer(self, observer):
+        """관찰자 등록 - observer(객체, 속성 이름)"""
+        observers = self.__dict__.setdefault('observers', [])
+        if observer not in observers:
+            observers.append(observer)
+
+    def remove_observer(self, observer):
+        """관찰자 해제"""
+        observers = self.__dict__.get('observers', [])
+        if observer in observers:
+            observers.remove(observer)
+
+    def notify_observers(self, name):
+        """속성 이름으로 직접 알림 (하위 객체의 변경을 전달할 때)"""
+        for observer in self.__dict__.get('observers', ()):
+            observer(self, name)
@@ -1,19 +1,164 @@
 from panda3d.core import Vec3, Point3, BitMask32, Texture, TransparencyAttrib, CardMaker
 from panda3d.core import CollisionTraverser, CollisionHandlerQueue, CollisionNode, CollisionBox
+from panda3d.core import (
+    Geom, GeomNode, GeomTriangles, GeomVertexData, GeomVertexFormat, GeomVertexWriter
+)
+from game.spatial import LAYER_OBSTACLE
+from game.log import get_logger
+import math
 import random
 
 
+# 장애물 추가 로그 (청크를 만들 때마다 여러 번 호출됨)
+log = get_logger('obstacle', hot=True)
+
+
+# 재질 (에셋 텍스처 이름, 텍스처 없을 때 색상)
+STATIC_MATERIALS = {
+    'wood': ('crate', (0.6, 0.4, 0.2, 1.0)),
+    'brick': ('brick', (0.5, 0.5, 0.5, 1.0)),
+    'stone': ('stone', (0.7, 0.7, 0.7, 1.0)),
+}
+
+# 장애물 타입별 재질
+OBSTACLE_MATERIALS = {
+    'crate': 'wood',
+    'wall': 'brick',
+    'pillar': 'stone',
+}
+
+# 박스 6면 (법선, 네 모서리의 (x, y, z) 부호, z는 0 = 바닥 / 1 = 윗면)
+_BOX_FACES = (
+    ((0, 1, 0), ((1, 1, 0), (-1, 1, 0), (-1, 1, 1), (1, 1, 1))),       # 앞 (Y+)
+    ((0, -1, 0), ((-1, -1, 0), (1, -1, 0), (1, -1, 1), (-1, -1, 1))),  # 뒤 (Y-)
+    ((-1, 0, 0), ((-1, 1, 0), (-1, -1, 0), (-1, -1, 1), (-1, 1, 1))),  # 좌 (X-)
+    ((1, 0, 0), ((1, -1, 0), (1, 1, 0), (1, 1, 1), (1, -1, 1))),       # 우 (X+)
+    ((0, 0, 1), ((-1, -1, 1), (1, -1, 1), (1, 1, 1), (-1, 1, 1))),     # 상 (Z+)
+    ((0, 0, -1), ((-1, 1, 0), (1, 1, 0), (1, -1, 0), (-1, -1, 0))),    # 하 (Z-)
+)
+
+
+class StaticBatch:
+    """재질 하나의 정적 박스들을 Geom 하나로 합친 배치 (배치당 드로우 콜 1회)"""
+
+    def __init__(self, game, material):
+        self.game = game
+        self.material = material
+        self.obstacles = []
+        self.dirty = False  # 제거가 있어 다시 만들어야 하는지
+
+        self.root = self.game.render.attachNewNode(f'static_{material}')
+        self.geom_node = GeomNode(f'static_{material}_geom')
+        self.root.attachNewNode(self.geom_node)
+        self.vdata = None
+        self.triangles = None
+
+        # 텍스처 적용 (파일 없을 시 기본 색상 사용)
+        texture_name, color = STATIC_MATERIALS.get(material, (None, (0.6, 0.6, 0.6, 1.0)))
+        texture = self.game.assets.texture(texture_name) if texture_name else None
+        if texture:
+            texture.setWrapU(Texture.WMRepeat)
+            texture.setWrapV(Texture.WMRepeat)
+            self.root.setTexture(texture)
+        else:
+            self.root.setColor(*color)
+
+        self._reset_geom()
+
+    def _reset_geom(self):
+        """빈 Geom으로 초기화"""
+        self.vdata = GeomVertexData(f'static_{self.material}', GeomVertexFormat.getV3n3t2(), Geom.UH_static)
+        self.triangles = GeomTriangles(Geom.UH_static)
+        geom = Geom(self.vdata)
+        geom.addPrimitive(self.triangles)
+        self.geom_node.removeAllGeoms()
+        self.geom_node.addGeom(geom)
+
+        # Geom이 들고 있는 실제 데이터로 다시 잡음 (이후 추가는 제자리 수정)
+        geom = self.geom_node.modifyGeom(0)
+        self.vdata = geom.modifyVertexData()
+        self.triangles = geom.modifyPrimitive(0)
+
+    def add(self, obstacle):
+        """박스 추가 (기존 정점 뒤에 이어 씀)"""
+        self.obstacles.append(obstacle)
+        if not self.dirty:
+            self._write_box(obstacle)
+
+    def remove(self, obstacle):
+        """박스 제거 (다음 flush에서 다시 만듦)"""
+        if obstacle in self.obstacles:
+            self.obstacles.remove(obstacle)
+            self.dirty = True
+
+    def flush(self):
+        """제거된 박스가 있으면 배치 재생성"""
+        if not self.dirty:
+            return
+        self.dirty = False
+        self._reset_geom()
+        for obstacle in self.obstacles:
+            self._write_box(obstacle)
+
+    def _write_box(self, obstacle):
+        """박스 24정점/12삼각형 기록 (UV는 월드 크기 기준으로 타일링)"""
+        start = self.vdata.getNumRows()
+        self.vdata.setNumRows(start + 24)
+        vertex = GeomVertexWriter(self.vdata, 'vertex')
+        normal = GeomVertexWriter(self.vdata, 'normal')
+        texcoord = GeomVertexWriter(self.vdata, 'texcoord')
+        vertex.setRow(start)
+        normal.setRow(start)
+        texcoord.setRow(start)
+
+        px, py, pz = obstacle.position
+        w, h, d = obstacle.size
+        hw, hd = w / 2, d / 2
+        for n, corners in _BOX_FACES:
+            # 면의 가로/세로 길이 (텍스처 반복 횟수)
+            if n[0]:
+                span_u, span_v = d, h
+            elif n[1]:
+                span_u, span_v = w, h
+            else:
+                span_u, span_v = w, d
+            for i, (sx, sy, sz) in enumerate(corners):
+                vertex.addData3(px + sx * hw, py + sy * hd, pz + sz * h)
+                normal.addData3(*n)
+                u = span_u if i in (1, 2) else 0.0
+                v = span_v if i in (2, 3) else 0.0
+                texcoord.addData2(u / 2.0, v / 2.0)
+
+        base = start
+        for _ in range(6):
+            self.triangles.addVertices(base, base + 1, base + 2)
+            self.triangles.addVertices(base, base + 2, base + 3)
+            base += 4
+
+    def cleanup(self):
+        """정리"""
+        self.obstacles = []
+        if self.root:
+            self.root.removeNode()
+            self.root = None
+
+
 class Obstacle:
     """장애물 클래스"""
 
-    def __init__(self, game, position, size, obstacle_type="crate"):
+    def __init__(self, game, position, size, obstacle_type="crate", batch=None):
         self.game = game
         self.position = position  # Vec3
         self.size = size  # (width, height, depth)
         self.type = obstacle_type
+        self.batch = batch  # 정적 배치 (None이면 개별 노드)
 
-        # 시각적 노드 생성
-        self._create_visual_node()
+        # 시각적 노드 생성 (배치 장애물은 배치 Geom에 박스만 추가)
+        if batch is None:
+            self._create_visual_node()
+        else:
+            self.node = batch.root.attachNewNode(f'obstacle_node_{id(self)}')
+            batch.add(self)
 
         # 충돌 박스 생성
         self._create_collision_box()
@@ -77,28 +222,17 @@ class Obstacle:
         for face in faces:
             face.reparentTo(self.node)
 
-        # 텍스처 로드 (예외 처리로 파일 없을 시 기본 색상 사용)
-        if self.type == "crate":
-            try:
-                texture = self.game.loader.loadTexture("textures/crate.png")
-                self.node.setTexture(texture)
+        # 텍스처 적용 (파일 없을 시 재질 기본 색상 사용)
+        material = OBSTACLE_MATERIALS.get(self.type)
+        if material:
+            texture_name, color = STATIC_MATERIALS[material]
+            texture = self.game.assets.texture(texture_name)
+            if texture:
                 texture.setWrapU(Texture.WMRepeat)
                 texture.setWrapV(Texture.WMRepeat)
-            except:
-                # 텍스처 없으면 기본 색상 (나무색)
-                self.node.setColor(0.6, 0.4, 0.2, 1.0)
-        elif self.type == "wall":
-            try:
-                texture = self.game.loader.loadTexture("textures/brick.png")
                 self.node.setTexture(texture)
-            except:
-                self.node.setColor(0.5, 0.5, 0.5, 1.0)
-        elif self.type == "pillar":
-            try:
-                texture = self.game.loader.loadTexture("textures/stone.png")
-                self.node.setTexture(texture)
-            except:
-                self.node.setColor(0.7, 0.7, 0.7, 1.0)
+            else:
+                self.node.setColor(*color)
 
     def _create_collision_box(self):
         """충돌 박스 생성"""
@@ -114,10 +248,21 @@ class Obstacle:
         self.collision_node = self.node.attachNewNode(collision_node)
         self.collision_node.setPos(self.position)
 
+    def blocks(self, x, y, radius):
+        """XY 평면에서 반경 radius 원이 박스와 겹치는지"""
+        w, h, d = self.size
+        dx = max(abs(x - self.position.x) - w / 2, 0.0)
+        dy = max(abs(y - self.position.y) - d / 2, 0.0)
+        return dx * dx + dy * dy < radius * radius
+
     def remove(self):
         """장애물 제거"""
+        if self.batch:
+            self.batch.remove(self)
+            self.batch = None
         if self.node:
             self.node.removeNode()
+            self.node = None
 
 
 class ObstacleSystem:
@@ -126,6 +271,9 @@ class ObstacleSystem:
     def __init__(self, game):
         self.game = game
         self.obstacles = []
+        self.batches = {}  # 재질 -> StaticBatch
+        self.random_obstacles = []  # 키 입력으로 추가한 장애물 (재시작 시 제거)
+        self.max_half_extent = 0.0  # 공간 질의 반경 (가장 큰 장애물 기준)
 
         # 플레이어 충돌 트래버설
         self.collision_traverser = CollisionTraverser()
@@ -183,13 +331,66 @@ class ObstacleSystem:
 
         print(f"[ObstacleSystem] 초기 장애물 {len(self.obstacles)}개 생성 완료")
 
-    def add_obstacle(self, position, size, obstacle_type="crate"):
-        """장애물 추가"""
-        obstacle = Obstacle(self.game, position, size, obstacle_type)
+    def add_obstacle(self, position, size, obstacle_type="crate", material=None):
+        """장애물 추가 (material을 주면 재질별 정적 배치에 합침)"""
+        batch = None
+        if material is not None:
+            batch = self.batches.get(material)
+            if batch is None:
+                batch = StaticBatch(self.game, material)
+                self.batches[material] = batch
+
+        obstacle = Obstacle(self.game, position, size, obstacle_type, batch)
         self.obstacles.append(obstacle)
-        print(f"[ObstacleSystem] 장애물 추가: {obstacle_type} at {position}")
+
+        # 이동 차단 판정용 공간 인덱스 등록
+        self.game.spatial.insert(LAYER_OBSTACLE, obstacle, position)
+        half_extent = max(size[0], size[2]) / 2
+        self.max_half_extent = max(self.max_half_extent, half_extent * 1.415)
+
+        log.debug("장애물 추가: %s at %s", obstacle_type, position)
         return obstacle
 
+    def remove_obstacle(self, obstacle):
+        """장애물 제거 (청크 언로드 등)"""
+        if obstacle in self.obstacles:
+            self.obstacles.remove(obstacle)
+        self.game.spatial.remove(LAYER_OBSTACLE, obstacle)
+        obstacle.remove()
+
+    def is_blocked(self, x, y, radius):
+        """XY 위치의 반경 radius 원이 장애물과 겹치는지"""
+        nearby = self.game.spatial.radius(
+            LAYER_OBSTACLE, (x, y, 0.0), self.max_half_extent + radius
+        )
+        for obstacle, _ in nearby:
+            if obstacle.blocks(x, y, radius):
+                return True
+        return False
+
+    def overlaps_box(self, pos, size):
+        """XY 평면에서 박스가 기존 장애물과 겹치는지 (맞닿는 것은 허용)"""
+        half_w, half_d = size[0] / 2, size[2] / 2
+        nearby = self.game.spatial.radius(
+            LAYER_OBSTACLE, (pos[0], pos[1], 0.0), self.max_half_extent + math.hypot(half_w, half_d)
+        )
+        for obstacle, _ in nearby:
+            w, h, d = obstacle.size
+            if (abs(obstacle.position.x - pos[0]) < half_w + w / 2 - 0.01 and
+                    abs(obstacle.position.y - pos[1]) < half_d + d / 2 - 0.01):
+                return True
+        return False
+
+    def resolve_move(self, current_pos, new_pos, radius=0.5):
+        """장애물에 막히면 축 하나로 미끄러지게 보정한 위치 반환"""
+        if not self.is_blocked(new_pos.x, new_pos.y, radius):
+            return new_pos
+        if not self.is_blocked(new_pos.x, current_pos.y, radius):
+            return Point3(new_pos.x, current_pos.y, new_pos.z)
+        if not self.is_blocked(current_pos.x, new_pos.y, radius):
+            return Point3(current_pos.x, new_pos.y, new_pos.z)
+        return Point3(current_pos.x, current_pos.y, new_pos.z)
+
     def add_random_obstacle(self, player_pos):
         """플레이어 근처에 랜덤 장애물 추가"""
         # 플레이어 앞쪽 5~10단위 거리
@@ -206,8 +407,8 @@ class ObstacleSystem:
         y = player_pos.y + offset_y
         z = 0  # 바닥에
 
-        # 맵 범위 체크 (-100 ~ 100)
-        if not (-100 < x < 100 and -100 < y < 100):
+        # 월드 범위 체크
+        if self.game.world.is_out_of_bounds(Vec3(x, y, z)):
             print("[ObstacleSystem] 맵 범위를 벗어남")
             return None
 
@@ -220,7 +421,9 @@ class ObstacleSystem:
 
         size, obs_type = random.choice(size_types)
 
-        return self.add_obstacle(Vec3(x, y, z), size, obs_type)
+        obstacle = self.add_obstacle(Vec3(x, y, z), size, obs_type)
+        self.random_obstacles.append(obstacle)
+        return obstacle
 
     def check_player_collision(self, player_pos, new_pos):
         """플레이어 이동 시 충돌 체크"""
@@ -241,15 +444,39 @@ class ObstacleSystem:
         return self.collision_handler.getNumEntries() > 0
 
     def update(self, dt):
-        """업데이트"""
-        # 필요한 경우 추가 업데이트 로직
-        pass
+        """업데이트 (제거가 있었던 정적 배치만 다시 만듦)"""
+        for batch in self.batches.values():
+            batch.flush()
+
+    def get_stats(self):
+        """장애물 통계"""
+        return {
+            'obstacles': len(self.obstacles),
+            'batched': sum(len(batch.obstacles) for batch in self.batches.values()),
+            'batches': len(self.batches),
+        }
+
+    def reset(self):
+        """재시작 - 키 입력으로 추가한 장애물 제거, 비어 있는 재질 배치 해제 (구조물 철거 후 호출)"""
+        for obstacle in self.random_obstacles:
+            self.remove_obstacle(obstacle)
+        self.random_obstacles.clear()
+
+        for material, batch in list(self.batches.items()):
+            if not batch.obstacles:
+                batch.cleanup()
+                del self.batches[material]
 
     def cleanup(self):
         """정리"""
         for obstacle in self.obstacles:
             obstacle.remove()
         self.obstacles.clear()
+        self.game.spatial.clear(LAYER_OBSTACLE)
+
+        for batch in self.batches.values():
+            batch.cleanup()
+        self.batches.clear()
 
         if self.player_collision_node:
             self.player_collision_node.removeNode()
@@ -0,0 +1,310 @@
+"""
+파티클 시스템
+이미터별 고정 크기 풀 + 포인트 스프라이트 Geom 하나로 채집 조각, 피격, 폭발 효과를 그림
+"""
+from panda3d.core import (
+    Geom, GeomNode, GeomPoints, GeomVertexData, GeomVertexFormat,
+    GeomVertexArrayFormat, TransparencyAttrib, InternalName
+)
+from array import array
+import math
+import random
+
+
+# 이미터 프리셋
+# budget: 동시에 살아있을 수 있는 최대 파티클 수 (초과분은 버림)
+# count: 한 번 방출 시 기본 개수, life/speed/up: (최소, 최대)
+# height: 방출 높이 오프셋 범위, gravity: Z 가속도, drag: 속도 감쇠 (초당)
+EMITTER_PRESETS = {
+    'wood_chip': {
+        'budget': 64,
+        'count': 3,
+        'color': (0.5, 0.4, 0.3, 1.0),
+        'size': 0.25,
+        'life': (0.5, 0.8),
+        'speed': (1.0, 2.5),
+        'up': (2.0, 4.0),
+        'height': (1.0, 3.0),
+        'gravity': -15.0,
+        'drag': 0.5,
+    },
+    'stone_dust': {
+        'budget': 96,
+        'count': 5,
+        'color': (0.6, 0.6, 0.6, 0.7),
+        'size': 0.2,
+        'life': (0.3, 0.5),
+        'speed': (0.5, 2.0),
+        'up': (0.5, 1.5),
+        'height': (0.5, 1.5),
+        'gravity': -3.0,
+        'drag': 2.0,
+    },
+    'bullet_impact': {
+        'budget': 128,
+        'count': 6,
+        'color': (1.0, 0.85, 0.4, 1.0),
+        'size': 0.1,
+        'life': (0.15, 0.3),
+        'speed': (3.0, 6.0),
+        'up': (0.0, 3.0),
+        'height': (0.0, 0.0),
+        'gravity': -20.0,
+        'drag': 1.0,
+    },
+    'explosion': {
+        'budget': 160,
+        'count': 40,
+        'color': (1.0, 0.5, 0.1, 1.0),
+        'size': 0.5,
+        'life': (0.4, 0.8),
+        'speed': (4.0, 9.0),
+        'up': (2.0, 6.0),
+        'height': (0.5, 1.5),
+        'gravity': -6.0,
+        'drag': 1.5,
+    },
+    'death_puff': {
+        'budget': 96,
+        'count': 16,
+        'color': (0.35, 0.35, 0.35, 0.8),
+        'size': 0.6,
+        'life': (0.6, 1.0),
+        'speed': (0.5, 1.5),
+        'up': (1.0, 2.0),
+        'height': (0.5, 2.0),
+        'gravity': 1.0,  # 연기는 천천히 올라감
+        'drag': 1.0,
+    },
+}
+
+# 정점 한 개 = 위치 3 + 색상 4 (float32)
+_FLOATS_PER_VERTEX = 7
+
+
+def _make_vertex_format():
+    """위치/색상 모두 float32인 정점 포맷 (배열 그대로 복사할 수 있도록)"""
+    array_format = GeomVertexArrayFormat()
+    array_format.addColumn(InternalName.getVertex(), 3, Geom.NT_float32, Geom.C_point)
+    array_format.addColumn(InternalName.getColor(), 4, Geom.NT_float32, Geom.C_color)
+    return GeomVertexFormat.registerFormat(GeomVertexFormat(array_format))
+
+
+class ParticleEmitter:
+    """이미터 하나 - 살아있는 파티클을 배열 앞쪽 [0, count)에 빽빽하게 유지"""
+
+    def __init__(self, game, name, preset, vertex_format, parent):
+        self.game = game
+        self.name = name
+        self.preset = preset
+        self.budget = preset['budget']
+        self.count = 0
+        self.dropped = 0  # 예산 초과로 버린 파티클 수
+
+        # 파티클 상태 (필드별 고정 크기 배열)
+        zeros = [0.0] * self.budget
+        self.px = array('f', zeros)
+        self.py = array('f', zeros)
+        self.pz = array('f', zeros)
+        self.vx = array('f', zeros)
+        self.vy = array('f', zeros)
+        self.vz = array('f', zeros)
+        self.age = array('f', zeros)
+        self.life = array('f', zeros)
+        self.r = array('f', zeros)
+        self.g = array('f', zeros)
+        self.b = array('f', zeros)
+        self.a = array('f', zeros)
+
+        # 정점 버퍼 (매 프레임 한 번에 복사)
+        self.vertex_buffer = array('f', [0.0] * (self.budget * _FLOATS_PER_VERTEX))
+
+        # 포인트 스프라이트 Geom (이미터당 노드 1개)
+        self.vdata = GeomVertexData(f'particles_{name}', vertex_format, Geom.UH_dynamic)
+        self.vdata.uncleanSetNumRows(0)
+        self.points = GeomPoints(Geom.UH_dynamic)
+        geom = Geom(self.vdata)
+        geom.addPrimitive(self.points)
+        geom_node = GeomNode(f'particles_{name}')
+        geom_node.addGeom(geom)
+
+        self.node = parent.attachNewNode(geom_node)
+        self.node.setRenderModeThickness(preset['size'])
+        self.node.setRenderModePerspective(True)
+        self.node.setTransparency(TransparencyAttrib.MAlpha)
+        self.node.setDepthWrite(False)
+        self.node.setLightOff()
+        self.node.setBin('fixed', 0)
+        self.node.hide()
+
+    def emit(self, pos, count=None, color=None):
+        """pos에서 파티클 방출 (예산을 넘는 만큼은 버림)"""
+        preset = self.preset
+        count = preset['count'] if count is None else count
+        free = self.budget - self.count
+        if count > free:
+            self.dropped += count - free
+            count = free
+        if count <= 0:
+            return 0
+
+        cr, cg, cb, ca = color or preset['color']
+        life_min, life_max = preset['life']
+        speed_min, speed_max = preset['speed']
+        up_min, up_max = preset['up']
+        height_min, height_max = preset['height']
+        uniform = random.uniform
+        x, y, z = pos[0], pos[1], pos[2]
+
+        for i in range(self.count, self.count + count):
+            angle = uniform(0.0, 2.0 * math.pi)
+            speed = uniform(speed_min, speed_max)
+            self.px[i] = x
+            self.py[i] = y
+            self.pz[i] = z + uniform(height_min, height_max)
+            self.vx[i] = math.cos(angle) * speed
+            self.vy[i] = math.sin(angle) * speed
+            self.vz[i] = uniform(up_min, up_max)
+            self.age[i] = 0.0
+            self.life[i] = uniform(life_min, life_max)
+            self.r[i] = cr
+            self.g[i] = cg
+            self.b[i] = cb
+            self.a[i] = ca
+
+        self.count += count
+        return count
+
+    def _kill(self, i, last):
+        """i번 파티클 제거 (마지막 파티클을 그 자리로 옮김)"""
+        for field in (self.px, self.py, self.pz, self.vx, self.vy, self.vz,
+                      self.age, self.life, self.r, self.g, self.b, self.a):
+            field[i] = field[last]
+
+    def update(self, dt):
+        """속도, 중력, 감쇠, 페이드를 한 번의 루프로 계산하고 정점 버퍼에 기록"""
+        if self.count == 0:
+            return
+
+        px, py, pz = self.px, self.py, self.pz
+        vx, vy, vz = self.vx, self.vy, self.vz
+        age, life = self.age, self.life
+        out = self.vertex_buffer
+        gravity_dt = self.preset['gravity'] * dt
+        damping = max(0.0, 1.0 - self.preset['drag'] * dt)
+
+        n = self.count
+        i = 0
+        while i < n:
+            t = age[i] + dt
+            if t >= life[i]:
+                n -= 1
+                self._kill(i, n)
+                continue
+            age[i] = t
+
+            vx[i] *= damping
+            vy[i] *= damping
+            vz[i] = vz[i] * damping + gravity_dt
+            px[i] += vx[i] * dt
+            py[i] += vy[i] * dt
+            z = pz[i] + vz[i] * dt
+            if z < 0.0:
+                # 바닥에 닿으면 튕김 없이 미끄러짐
+                z = 0.0
+                vz[i] = 0.0
+                vx[i] *= 0.5
+                vy[i] *= 0.5
+            pz[i] = z
+
+            o = i * _FLOATS_PER_VERTEX
+            out[o] = px[i]
+            out[o + 1] = py[i]
+            out[o + 2] = z
+            out[o + 3] = self.r[i]
+            out[o + 4] = self.g[i]
+            out[o + 5] = self.b[i]
+            out[o + 6] = self.a[i] * (1.0 - t / life[i])
+            i += 1
+
+        self.count = n
+        self._upload()
+
+    def _upload(self):
+        """살아있는 파티클 정점만 GPU 버퍼로 복사"""
+        n = self.count
+        self.vdata.modifyArrayHandle(0).copyDataFrom(
+            memoryview(self.vertex_buffer)[:n * _FLOATS_PER_VERTEX]
+        )
+        self.points.clearVertices()
+        if n > 0:
+            self.points.addConsecutiveVertices(0, n)
+            self.node.show()
+        else:
+            self.node.hide()
+
+    def clear(self):
+        """모든 파티클 제거"""
+        self.count = 0
+        self._upload()
+
+    def cleanup(self):
+        """정리"""
+        if self.node:
+            self.node.removeNode()
+            self.node = None
+
+
+class ParticleSystem:
+    """파티클 시스템 관리자 (프리셋별 이미터 풀)"""
+
+    def __init__(self, game):
+        self.game = game
+        self.root = self.game.render.attachNewNode('particles')
+
+        vertex_format = _make_vertex_format()
+        self.emitters = {
+            name: ParticleEmitter(game, name, preset, vertex_format, self.root)
+            for name, preset in EMITTER_PRESETS.items()
+        }
+
+        budget = sum(preset['budget'] for preset in EMITTER_PRESETS.values())
+        print(f"[Particles] 파티클 시스템 초기화 (이미터 {len(self.emitters)}개, 최대 {budget}개)")
+
+    def emit(self, name, pos, count=None, color=None):
+        """프리셋 이름으로 방출 (방출된 개수 반환)"""
+        emitter = self.emitters.get(name)
+        if emitter is None:
+            return 0
+        return emitter.emit(pos, count, color)
+
+    def update(self, dt):
+        """모든 이미터 시뮬레이션"""
+        for emitter in self.emitters.values():
+            emitter.update(dt)
+
+    def get_stats(self):
+        """이미터별 (살아있는 수, 예산, 버린 수)"""
+        return {
+            name: (emitter.count, emitter.budget, emitter.dropped)
+            for name, emitter in self.emitters.items()
+        }
+
+    def clear(self):
+        """모든 파티클 제거"""
+        for emitter in self.emitters.values():
+            emitter.clear()
+
+    def reset(self):
+        """재시작 - 살아 있는 파티클만 비움 (이미터 버퍼는 유지)"""
+        self.clear()
+
+    def cleanup(self):
+        """정리"""
+        for emitter in self.emitters.values():
+            emitter.cleanup()
+        self.emitters.clear()
+        if self.root:
+            self.root.removeNode()
+            self.root = None
+        print("[Particles] 파티클 시스템 정리 완료")
@@ -11,9 +11,7 @@ class PauseMenu:
         self.game = game
         self.resume_callback = resume_callback
         self.quit_callback = quit_callback
-        self.menu_frame = None
-
-        self._create_menu()
+        self.menu_frame = None  # 처음 일시정지할 때 생성
 
     def _create_menu(self):
         """일시정지 메뉴 UI 생성"""
@@ -65,18 +63,22 @@ class PauseMenu:
         print("[PauseMenu] Pause menu created")
 
     def show(self):
-        """메뉴 표시"""
+        """메뉴 표시 (처음이면 생성)"""
+        if self.menu_frame is None:
+            self._create_menu()
         self.menu_frame.show()
 
     def hide(self):
         """메뉴 숨김"""
-        self.menu_frame.hide()
+        if self.menu_frame:
+            self.menu_frame.hide()
 
     def is_visible(self):
         """메뉴 표시 상태 반환"""
-        return self.menu_frame.isHidden() == False
+        return self.menu_frame is not None and self.menu_frame.isHidden() == False
 
     def cleanup(self):
         """메뉴 정리"""
         if self.menu_frame:
             self.menu_frame.destroy()
+            self.menu_frame = None
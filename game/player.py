@@ -3,10 +3,28 @@ from direct.actor.Actor import Actor
 from direct.interval.IntervalGlobal import Sequence, Func, Wait
 import math
 import random
-from game.weapon import create_weapon, WEAPON_TYPES
+from logging import DEBUG
+from game.weapon import create_weapon, Attachment, WEAPON_TYPES
+from game.tool import create_tool
+from game import recipes
+from game.log import get_logger
+from game.observable import Observable, Observed
 
 
-class Player:
+# 사격/명중 로그 (production 프로필에서는 no-op)
+log = get_logger('player', hot=True)
+
+# 세이브 파일의 부착물 슬롯 순서
+ATTACHMENT_SLOTS = ('scope', 'grip', 'muzzle', 'magazine')
+
+
+class Player(Observed):
+    # HUD에 표시되는 값 (바뀌면 관찰자에게 알림, 현재 무기의 값 변경도 같은 이름으로 전달)
+    current_weapon = Observable()
+    health = Observable()
+    defense = Observable()
+    stamina = Observable()
+
     def __init__(self, game):
         self.game = game
         self.walk_speed = 15.0
@@ -104,11 +122,19 @@ class Player:
         self.current_tool = None  # 현재 장착 도구
         self.current_tool_index = -1  # 현재 도구 인덱스
 
+        # 조합 가능 비트마스크 (리소스가 바뀔 때 해당 레시피 비트만 다시 계산)
+        self.craft_mask = recipes.compute_mask(self.inventory)
+
+        # 인벤토리 변경 리스너 (kind, changed) -> None
+        # kind: 'resources' (changed = 리소스 이름 집합) 또는 'tools' (changed = 슬롯 번호 집합)
+        self.inventory_listeners = []
+
     def _initialize_weapons(self):
         """무기 초기화 - 모든 무기를 생성하고 Rifle 장착"""
         # 모든 무기 생성
         for weapon_type in WEAPON_TYPES:
             self.weapons[weapon_type] = create_weapon(weapon_type)
+            self.weapons[weapon_type].add_observer(self._on_weapon_changed)
 
         # Rifle 먼저 장착 (기본 무기)
         self.current_weapon_index = WEAPON_TYPES.index('rifle')
@@ -116,6 +142,11 @@ class Player:
 
         print(f"[Player] 무기 시스템 초기화 완료 (현재: {self.current_weapon.name})")
 
+    def _on_weapon_changed(self, weapon, name):
+        """현재 무기의 값 변경을 플레이어 관찰자에게 전달"""
+        if weapon is self.current_weapon:
+            self.notify_observers(name)
+
     def switch_weapon(self, slot):
         """
         무기 전환
@@ -334,18 +365,24 @@ class Player:
             bullets, recoil_amount = result
             for bullet_data in bullets:
                 self.projectiles.append(bullet_data)
+            shot_count = len(bullets)
         else:
             bullet_data, recoil_amount, is_crit = result
             self.projectiles.append(bullet_data)
+            shot_count = 1
 
             # 크리티컬 효과
             if is_crit:
-                print(f"[Player] CRITICAL HIT! {bullet_data['damage']} 데미지!")
+                log.debug("CRITICAL HIT! %s 데미지!", bullet_data['damage'])
 
         # 반동 적용
         self._apply_recoil(recoil_amount)
 
-        print(f"[Player] Shot! Ammo: {self.current_weapon.get_ammo_display()} | Durability: {self.current_weapon.get_durability_percentage()}%")
+        self.game.telemetry.record('shot', self.current_weapon.name, start_pos.x, start_pos.y, shot_count)
+
+        if log.isEnabledFor(DEBUG):
+            log.debug("Shot! Ammo: %s | Durability: %s%%",
+                      self.current_weapon.get_ammo_display(), self.current_weapon.get_durability_percentage())
 
     def start_firing(self):
         """발사 시작 (마우스 버튼 다운)"""
@@ -519,6 +556,9 @@ class Player:
             hit_target = self.game.targets.check_bullet_collisions(proj['node'].getPos())
             if hit_target:
                 # 표적에 맞으면 총알 제거
+                hit_pos = proj['node'].getPos()
+                self.game.telemetry.record('hit', proj.get('weapon', ''), hit_pos.x, hit_pos.y, bullet_damage)
+                self.game.particles.emit('bullet_impact', hit_pos)
                 proj['node'].removeNode()
                 self.projectiles.remove(proj)
                 continue
@@ -531,11 +571,14 @@ class Player:
                 # 크리티컬/헤드샷 효과 로그
                 is_crit = proj.get('is_crit', False)
                 if is_crit:
-                    print(f"[Player] CRITICAL HIT on {hit_enemy.enemy_type}!")
+                    log.debug("CRITICAL HIT on %s!", hit_enemy.enemy_type)
                 if is_headshot:
-                    print(f"[Player] HEADSHOT on {hit_enemy.enemy_type}!")
+                    log.debug("HEADSHOT on %s!", hit_enemy.enemy_type)
 
                 # 적에 맞으면 총알 제거
+                hit_pos = proj['node'].getPos()
+                self.game.telemetry.record('hit', proj.get('weapon', ''), hit_pos.x, hit_pos.y, bullet_damage)
+                self.game.particles.emit('bullet_impact', hit_pos)
                 proj['node'].removeNode()
                 self.projectiles.remove(proj)
                 continue
@@ -610,11 +653,172 @@ class Player:
         self.projectiles.clear()
         self.node.removeNode()
 
+    def reset(self):
+        """재시작 - 초기 상태로 되돌림 (플레이어/카메라 노드는 그대로, 날아가는 총알만 제거)"""
+        self.game.taskMgr.remove('reload_weapon')
+        for proj in self.projectiles:
+            proj['node'].removeNode()
+        self.projectiles.clear()
+
+        # 위치/시선
+        self.heading = 0
+        self.pitch = 10
+        self.recoil_pitch = 0.0
+        self.node.setPos(0, 0, self.ground_level)
+        self.node.setH(self.heading)
+        self.camera_node.setP(self.pitch)
+
+        # 이동 상태
+        for direction in self.moving:
+            self.moving[direction] = False
+        self.velocity_z = 0.0
+        self.is_grounded = True
+        self.is_running = False
+        self.is_crouching = False
+        self.speed = self.walk_speed
+        self.current_eye_height = self.eye_height
+        self.camera_node.setZ(self.eye_height)
+
+        # 전투 상태 (줌 FOV는 게임이 설정 값으로 되돌림)
+        self.is_firing = False
+        self.fire_cooldown = 0.0
+        self.is_reloading = False
+        self.is_zoomed = False
+
+        # 스탯
+        self.health = self.max_health
+        self.defense = self.max_defense
+        self.stamina = self.max_stamina
+        self.stamina_regen_timer = 0.0
+        self.hunger = self.max_hunger
+
+        # 인벤토리/도구
+        for resource_type in self.inventory:
+            self.inventory[resource_type] = 0
+        self.tool_slots = [None] * len(self.tool_slots)
+        self.current_tool = None
+        self.current_tool_index = -1
+
+        # 무기 (탄약/내구도/부착물/발사 모드 초기값으로 새로 생성)
+        self._initialize_weapons()
+        self.zoom_fov_reduction = self.current_weapon.zoom_fov_reduction
+        self.gun_recoil_zoom_multiplier = self.current_weapon.recoil_zoom_multiplier
+
+        self._notify_inventory('resources', set(self.inventory))
+        self._notify_inventory('tools', set(range(len(self.tool_slots))))
+        self.game.update_weapon_ui()
+
+    def save_state(self):
+        """세이브용 상태 (위치/스탯, 인벤토리, 도구 슬롯, 무기)"""
+        pos = self.node.getPos()
+        player = (
+            pos.x, pos.y, pos.z, self.heading, self.pitch,
+            self.health, self.defense, self.stamina, self.hunger,
+            self.current_weapon_index, self.current_tool_index
+        )
+        tools = [
+            (slot, tool.tool_type, tool.durability)
+            for slot, tool in enumerate(self.tool_slots) if tool is not None
+        ]
+        weapons = []
+        for weapon_type, weapon in self.weapons.items():
+            attachments = weapon.attachments
+            weapons.append((
+                weapon_type, weapon.durability, weapon.current_ammo, weapon.total_ammo,
+                weapon.current_fire_mode,
+                *(attachments[slot].id if attachments[slot] else '' for slot in ATTACHMENT_SLOTS)
+            ))
+        return {
+            'player': [player],
+            'inventory': list(self.inventory.items()),
+            'tools': tools,
+            'weapons': weapons,
+        }
+
+    def load_state(self, state):
+        """세이브 상태 적용"""
+        for record in state.get('player', ()):
+            (x, y, z, self.heading, self.pitch, self.health, self.defense,
+             self.stamina, self.hunger, weapon_index, tool_index) = record
+            self.node.setPos(x, y, z)
+            self.node.setH(self.heading)
+            self.camera_node.setP(self.pitch)
+            self.velocity_z = 0.0
+
+        for resource_type, amount in state.get('inventory', ()):
+            if resource_type in self.inventory:
+                self.inventory[resource_type] = amount
+
+        self.tool_slots = [None] * len(self.tool_slots)
+        for slot, tool_type, durability in state.get('tools', ()):
+            tool = create_tool(tool_type)
+            if tool is None or slot >= len(self.tool_slots):
+                continue
+            tool.durability = durability
+            tool.broken = durability <= 0
+            self.tool_slots[slot] = tool
+
+        for weapon_type, durability, current_ammo, total_ammo, fire_mode, *attachment_ids in state.get('weapons', ()):
+            weapon = self.weapons.get(weapon_type)
+            if weapon is None:
+                continue
+            for slot, attachment_id in zip(ATTACHMENT_SLOTS, attachment_ids):
+                weapon.attachments[slot] = Attachment(attachment_id) if attachment_id else None
+            weapon._recalculate_stats()
+            weapon.durability = durability
+            weapon.broken = durability <= 0
+            weapon.current_ammo = min(current_ammo, weapon.magazine_size)
+            weapon.total_ammo = total_ammo
+            if fire_mode in weapon.fire_modes:
+                weapon.current_fire_mode = fire_mode
+
+        # 장착 상태 복원 (저장된 슬롯이 비었으면 해제)
+        if 'player' in state:
+            self.current_tool = self.get_tool_at_slot(tool_index)
+            self.current_tool_index = tool_index if self.current_tool else -1
+            if 0 <= weapon_index < len(WEAPON_TYPES):
+                self.current_weapon_index = weapon_index
+                self.current_weapon = self.weapons[WEAPON_TYPES[weapon_index]]
+                self.zoom_fov_reduction = self.current_weapon.zoom_fov_reduction
+                self.gun_recoil_zoom_multiplier = self.current_weapon.recoil_zoom_multiplier
+
+        self._notify_inventory('resources', set(self.inventory))
+        self._notify_inventory('tools', set(range(len(self.tool_slots))))
+        self.game.update_weapon_ui()
+
+    def add_inventory_listener(self, listener):
+        """인벤토리 변경 리스너 등록"""
+        if listener not in self.inventory_listeners:
+            self.inventory_listeners.append(listener)
+
+    def remove_inventory_listener(self, listener):
+        """인벤토리 변경 리스너 해제"""
+        if listener in self.inventory_listeners:
+            self.inventory_listeners.remove(listener)
+
+    def _notify_inventory(self, kind, changed):
+        """인벤토리 변경 이벤트 발생"""
+        if kind == 'resources':
+            bits = 0
+            for resource_type in changed:
+                bits |= recipes.RESOURCE_BITS.get(resource_type, 0)
+            if bits:
+                self.craft_mask = (self.craft_mask & ~bits) | recipes.compute_mask(self.inventory, bits)
+
+        for listener in self.inventory_listeners:
+            listener(kind, changed)
+
+    def notify_tool_changed(self, slot_index):
+        """도구 상태(내구도 등)가 바뀌었음을 알림"""
+        if 0 <= slot_index < len(self.tool_slots):
+            self._notify_inventory('tools', {slot_index})
+
     def add_resource(self, resource_type, amount):
         """인벤토리에 리소스 추가"""
         if resource_type in self.inventory:
             self.inventory[resource_type] += amount
-            print(f"[Player] {resource_type} +{amount} (총: {self.inventory[resource_type]})")
+            log.debug("%s +%s (총: %s)", resource_type, amount, self.inventory[resource_type])
+            self._notify_inventory('resources', {resource_type})
             return True
         return False
 
@@ -632,32 +836,65 @@ class Player:
         for resource_type, amount in recipe.items():
             self.inventory[resource_type] -= amount
 
+        self._notify_inventory('resources', set(recipe))
         return True
 
-    def craft_item(self, item_type):
-        """아이템 조합"""
-        # 조합 레시피
-        recipes = {
-            'ladder': {'wood': 10},           # 사다리: 나무 10개
-            'wall': {'wood': 15, 'stone': 5}, # 벽: 나무 15개 + 돌 5개
-            'furnace': {'stone': 20},         # 화로: 돌 20개
-            'campfire': {'wood': 5, 'stone': 3}, # 모닥불: 나무 5개 + 돌 3개
-        }
-
-        if item_type not in recipes:
+    def can_craft(self, item_type, count=1):
+        """조합/수리 가능 여부 (1개는 비트마스크로 바로 확인)"""
+        if count == 1:
+            return bool(self.craft_mask & recipes.RECIPE_BITS.get(item_type, 0))
+        cost = recipes.get_cost(item_type, count)
+        return cost is not None and recipes.can_afford(self.inventory, cost)
+
+    def craft(self, item_type, count=1):
+        """레시피 count회 실행 (검증 후 리소스를 한 번에 차감)"""
+        recipe = recipes.get_recipe(item_type)
+        if recipe is None:
             print(f"[Player] 알 수 없는 조합 아이템: {item_type}")
             return False
+        if count < 1:
+            print(f"[Player] 잘못된 조합 개수: {count}")
+            return False
 
-        recipe = recipes[item_type]
+        kind = recipe['kind']
+        if item_type == 'repair_tool':
+            return self.repair_tool_at(self.current_tool_index)
+        if kind == 'repair':
+            count = 1  # 수리는 한 번씩
 
-        # 리소스 확인 및 소모
-        if self.use_resources(recipe):
-            print(f"[Player] 조합 성공: {item_type}")
-            return True
-        else:
+        # 결과물을 받을 수 있는지 먼저 확인 (실패 시 되돌릴 필요 없게)
+        if kind == 'tool' and count > self.tool_slots.count(None):
+            print("[Player] 인벤토리가 가득 찼습니다!")
+            return False
+        placements = None
+        if kind == 'structure':
+            placements = self.game.structures.find_placements(item_type, count)
+            if placements is None:
+                print(f"[Player] 설치할 공간이 없습니다 ({item_type})")
+                return False
+
+        if not self.use_resources(recipes.get_cost(item_type, count)):
             print(f"[Player] 조합 실패: 리소스 부족 ({item_type})")
             return False
 
+        if kind == 'tool':
+            for _ in range(count):
+                self.add_tool(create_tool(item_type))
+        elif kind == 'structure':
+            self.game.structures.place(item_type, placements)
+        elif item_type == 'repair_weapon':
+            self.repair_weapon()
+
+        pos = self.node.getPos()
+        self.game.telemetry.record('craft', item_type, pos.x, pos.y, count)
+
+        print(f"[Player] 조합 성공: {item_type} x{count}")
+        return True
+
+    def craft_item(self, item_type):
+        """아이템 조합"""
+        return self.craft(item_type)
+
     # ===== 도구 시스템 =====
 
     def add_tool(self, tool):
@@ -666,6 +903,7 @@ class Player:
             if self.tool_slots[i] is None:
                 self.tool_slots[i] = tool
                 print(f"[Player] 도구 추가: {tool.name} -> 슬롯 {i}")
+                self._notify_inventory('tools', {i})
                 return True
         print("[Player] 인벤토리가 가득 찼습니다!")
         return False
@@ -680,9 +918,11 @@ class Player:
         """슬롯에서 도구 장착"""
         tool = self.get_tool_at_slot(slot_index)
         if tool and not tool.broken:
+            old_index = self.current_tool_index
             self.current_tool = tool
             self.current_tool_index = slot_index
             print(f"[Player] 도구 장착: {tool.name}")
+            self._notify_inventory('tools', {slot_index, old_index} - {-1})
             return True
         elif tool and tool.broken:
             print("[Player] 고장난 도구는 장착할 수 없습니다!")
@@ -712,9 +952,11 @@ class Player:
             )
 
             # 인벤토리에서 제거
-            self.tool_slots[self.current_tool_index] = None
+            dropped_index = self.current_tool_index
+            self.tool_slots[dropped_index] = None
             self.current_tool = None
             self.current_tool_index = -1
+            self._notify_inventory('tools', {dropped_index})
 
             print("[Player] 도구 드롭 완료!")
             return True
@@ -729,6 +971,7 @@ class Player:
         """현재 도구 사용 (채광)"""
         if self.current_tool and not self.current_tool.broken:
             success = self.current_tool.use()
+            self.notify_tool_changed(self.current_tool_index)
             if success:
                 bonus = self.current_tool.get_gather_bonus(resource_type)
                 return bonus
@@ -736,31 +979,35 @@ class Player:
                 print("[Player] 도구가 고장났습니다!")
         return {'speed': 1.0, 'amount': 1.0}
 
+    def repair_tool_at(self, slot_index):
+        """슬롯의 도구 수리 (리소스 사용)"""
+        tool = self.get_tool_at_slot(slot_index)
+        if not tool:
+            print("[Player] 수리할 도구가 없습니다.")
+            return False
+
+        if not self.use_resources(recipes.get_cost('repair_tool')):
+            print("[Player] 도구 수리에 리소스가 부족합니다!")
+            return False
+
+        old_durability = tool.get_durability_percentage()
+        new_durability = tool.repair()
+        print(f"[Player] 도구 수리: {old_durability}% -> {new_durability}%")
+        self.notify_tool_changed(slot_index)
+        return True
+
     def repair_current_tool(self):
         """현재 도구 수리 (리소스 사용)"""
-        if self.current_tool:
-            wood_cost = 3
-            stone_cost = 2
-
-            if (self.get_resource_count('wood') >= wood_cost and
-                self.get_resource_count('stone') >= stone_cost):
-                self.use_resources({'wood': wood_cost, 'stone': stone_cost})
-                old_durability = self.current_tool.get_durability_percentage()
-                new_durability = self.current_tool.repair()
-                print(f"[Player] 도구 수리: {old_durability}% -> {new_durability}%")
-                return True
-            else:
-                print("[Player] 도구 수리에 리소스가 부족합니다!")
-        else:
-            print("[Player] 수리할 도구가 없습니다.")
-        return False
+        return self.craft('repair_tool')
 
     def unequip_current_tool(self):
         """현재 도구 장착 해제"""
         if self.current_tool:
             print(f"[Player] 도구 장착 해제: {self.current_tool.name}")
+            old_index = self.current_tool_index
             self.current_tool = None
             self.current_tool_index = -1
+            self.notify_tool_changed(old_index)
             return True
         return False
 
@@ -0,0 +1,180 @@
+"""
+포아송 디스크 샘플링
+Bridson 알고리즘과 배경 격자로 최소 간격이 보장된 배치 위치 생성
+"""
+import math
+import random
+
+
+# Bridson 채움 결과의 평균 밀도 계수 (점 개수 ~= 면적 * 계수 / 최소거리^2)
+FILL_DENSITY = 0.7
+
+
+class PoissonDiskSampler:
+    """Bridson 포아송 디스크 샘플러 (배경 격자 가속)"""
+
+    def __init__(self, min_x, min_y, max_x, max_y, min_distance, rng=None, attempts=16):
+        self.min_x = min_x
+        self.min_y = min_y
+        self.max_x = max_x
+        self.max_y = max_y
+        self.min_distance = min_distance
+        self.rng = rng or random
+        self.attempts = attempts  # 활성 점마다 후보 시도 횟수 (Bridson k)
+
+        # 셀 대각선이 최소 거리 이하 -> 셀당 최대 1개의 점
+        self.cell_size = min_distance / math.sqrt(2)
+        self.cols = max(1, int(math.ceil((max_x - min_x) / self.cell_size)))
+        self.rows = max(1, int(math.ceil((max_y - min_y) / self.cell_size)))
+        self.grid = [None] * (self.cols * self.rows)
+        self.count = 0
+
+    def _cell_index(self, x, y):
+        """좌표 -> 격자 인덱스"""
+        gx = min(self.cols - 1, int((x - self.min_x) / self.cell_size))
+        gy = min(self.rows - 1, int((y - self.min_y) / self.cell_size))
+        return gx, gy
+
+    def _in_bounds(self, x, y):
+        """영역 안에 있는지"""
+        return self.min_x <= x <= self.max_x and self.min_y <= y <= self.max_y
+
+    def is_valid(self, x, y):
+        """영역 안이고 기존 점과 최소 거리 이상 떨어져 있는지 (주변 5x5 셀만 검사)"""
+        if not self._in_bounds(x, y):
+            return False
+
+        gx, gy = self._cell_index(x, y)
+        min_dist_sq = self.min_distance * self.min_distance
+        for ny in range(max(0, gy - 2), min(self.rows, gy + 3)):
+            row = ny * self.cols
+            for nx in range(max(0, gx - 2), min(self.cols, gx + 3)):
+                point = self.grid[row + nx]
+                if point is not None:
+                    dx = point[0] - x
+                    dy = point[1] - y
+                    if dx * dx + dy * dy < min_dist_sq:
+                        return False
+        return True
+
+    def add_point(self, x, y):
+        """점 등록 (간격 검사 없이 격자에 기록, 영역 밖이면 무시)"""
+        if not self._in_bounds(x, y):
+            return False
+        gx, gy = self._cell_index(x, y)
+        index = gy * self.cols + gx
+        if self.grid[index] is None:
+            self.count += 1
+        self.grid[index] = (x, y)
+        return True
+
+    def remove_point(self, x, y):
+        """점 해제 (해당 셀이 비워짐)"""
+        if not self._in_bounds(x, y):
+            return False
+        gx, gy = self._cell_index(x, y)
+        index = gy * self.cols + gx
+        if self.grid[index] is None:
+            return False
+        self.grid[index] = None
+        self.count -= 1
+        return True
+
+    def clear(self):
+        """모든 점 해제"""
+        self.grid = [None] * (self.cols * self.rows)
+        self.count = 0
+
+    def points(self):
+        """등록된 모든 점"""
+        return [point for point in self.grid if point is not None]
+
+    def _fill(self):
+        """Bridson 알고리즘으로 영역을 가득 채움 (기존 점은 유지)"""
+        rng = self.rng
+        dist = self.min_distance * (1 + 1e-6)
+        added = []
+
+        # 기존 점이 있으면 그 점들에서 확장, 없으면 임의의 시작점
+        active = self.points()
+        if not active:
+            x = rng.uniform(self.min_x, self.max_x)
+            y = rng.uniform(self.min_y, self.max_y)
+            self.add_point(x, y)
+            added.append((x, y))
+            active = [(x, y)]
+
+        while active:
+            i = rng.randrange(len(active))
+            px, py = active[i]
+
+            # 반경 r 바로 바깥 원주를 일정 각도로 훑으며 후보 생성
+            # (고리 영역 무작위 후보보다 기각이 적고 더 촘촘하게 채워짐)
+            seed = rng.random()
+            for j in range(self.attempts):
+                angle = 2 * math.pi * (seed + j / self.attempts)
+                x = px + math.cos(angle) * dist
+                y = py + math.sin(angle) * dist
+                if self.is_valid(x, y):
+                    self.add_point(x, y)
+                    added.append((x, y))
+                    active.append((x, y))
+                    break
+            else:
+                # 후보를 찾지 못하면 비활성화 (swap-pop)
+                active[i] = active[-1]
+                active.pop()
+
+        return added
+
+    def sample(self, count=None):
+        """
+        새 점 생성
+        count: 필요한 점 개수 (None이면 영역을 가득 채움)
+        개수가 적으면 간격을 넓혀 채운 뒤 count개를 골라 영역 전체에 고르게 분포시킴
+        """
+        if count is None:
+            return self._fill()
+
+        # 개수에 맞춰 간격을 넓힌 샘플러로 채움
+        area = (self.max_x - self.min_x) * (self.max_y - self.min_y)
+        spread = math.sqrt(area * FILL_DENSITY / max(1, count))
+        if spread > self.min_distance:
+            sparse = PoissonDiskSampler(
+                self.min_x, self.min_y, self.max_x, self.max_y,
+                spread, self.rng, self.attempts
+            )
+            candidates = [point for point in sparse._fill() if self.is_valid(*point)]
+        else:
+            candidates = self._fill()
+            for x, y in candidates:
+                self.remove_point(x, y)
+
+        # 무작위 순서로 count개 선택 (채움 순서는 공간적으로 몰려 있음)
+        candidates = self.rng.sample(candidates, min(count, len(candidates)))
+
+        added = []
+        for x, y in candidates:
+            if self.is_valid(x, y):
+                self.add_point(x, y)
+                added.append((x, y))
+
+        # 부족하면 격자 검사로 빈자리 채움
+        while len(added) < count:
+            point = self.find_free_point()
+            if point is None:
+                break
+            added.append(point)
+
+        return added
+
+    def find_free_point(self, max_tries=None):
+        """간격 조건을 만족하는 빈 위치를 찾아 등록 (실패 시 None)"""
+        tries = max_tries if max_tries is not None else self.attempts * 4
+        for _ in range(tries):
+            x = self.rng.uniform(self.min_x, self.max_x)
+            y = self.rng.uniform(self.min_y, self.max_y)
+            if self.is_valid(x, y):
+                self.add_point(x, y)
+                return x, y
+        return None
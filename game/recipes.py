@@ -0,0 +1,122 @@
+"""
+조합 레시피 레지스트리
+모든 조합/수리 비용을 한 곳에서 정의하고, 리소스 -> 레시피 역색인을 미리 만들어 둠
+"""
+
+
+# 레시피 정의 (kind: tool = 도구 생성, structure = 구조물, repair = 수리)
+RECIPES = {
+    'axe': {
+        'name': 'Axe',
+        'kind': 'tool',
+        'cost': {'wood': 15, 'stone': 5},
+        'description': '나무 채집 도구'
+    },
+    'pickaxe': {
+        'name': 'Pickaxe',
+        'kind': 'tool',
+        'cost': {'wood': 10, 'stone': 15},
+        'description': '돌 채집 도구'
+    },
+    'campfire': {
+        'name': 'Campfire',
+        'kind': 'structure',
+        'cost': {'wood': 5, 'stone': 3},
+        'description': '모닥불'
+    },
+    'wall': {
+        'name': 'Wall',
+        'kind': 'structure',
+        'cost': {'wood': 15, 'stone': 5},
+        'description': '방어벽'
+    },
+    'ladder': {
+        'name': 'Ladder',
+        'kind': 'structure',
+        'cost': {'wood': 10},
+        'description': '사다리'
+    },
+    'furnace': {
+        'name': 'Furnace',
+        'kind': 'structure',
+        'cost': {'stone': 20},
+        'description': '화로'
+    },
+    'repair_weapon': {
+        'name': 'Weapon Repair',
+        'kind': 'repair',
+        'cost': {'wood': 5, 'stone': 3},
+        'description': '현재 무기 수리'
+    },
+    'repair_tool': {
+        'name': 'Tool Repair',
+        'kind': 'repair',
+        'cost': {'wood': 3, 'stone': 2},
+        'description': '도구 수리'
+    },
+}
+
+# 조합 가능한 아이템 (도구 + 구조물, 정의 순서 유지)
+CRAFTABLE_ITEMS = tuple(
+    item_id for item_id, recipe in RECIPES.items() if recipe['kind'] != 'repair'
+)
+
+# 레시피별 비트 (조합 가능 여부를 비트마스크 하나로 관리)
+RECIPE_BITS = {item_id: 1 << i for i, item_id in enumerate(RECIPES)}
+ALL_BITS = (1 << len(RECIPES)) - 1
+
+# 리소스 -> 그 리소스를 쓰는 레시피 (역색인)
+RESOURCE_INDEX = {}
+for _item_id, _recipe in RECIPES.items():
+    for _res_type in _recipe['cost']:
+        RESOURCE_INDEX.setdefault(_res_type, []).append(_item_id)
+
+# 리소스 -> 그 리소스를 쓰는 레시피 비트 (리소스가 바뀌면 이 비트만 다시 계산)
+RESOURCE_BITS = {
+    res_type: sum(RECIPE_BITS[item_id] for item_id in item_ids)
+    for res_type, item_ids in RESOURCE_INDEX.items()
+}
+
+
+def get_recipe(item_id):
+    """레시피 반환 (없으면 None)"""
+    return RECIPES.get(item_id)
+
+
+def get_cost(item_id, count=1):
+    """count개 만드는 데 필요한 비용 (없는 레시피면 None)"""
+    recipe = RECIPES.get(item_id)
+    if recipe is None:
+        return None
+    return {res_type: amount * count for res_type, amount in recipe['cost'].items()}
+
+
+def format_cost(cost):
+    """비용 표시 문자열 (Wood: 15, Stone: 5)"""
+    return ", ".join(f"{res_type.capitalize()}: {amount}" for res_type, amount in cost.items())
+
+
+def can_afford(inventory, cost):
+    """비용을 낼 수 있는지 확인"""
+    for res_type, amount in cost.items():
+        if inventory.get(res_type, 0) < amount:
+            return False
+    return True
+
+
+def missing_resources(inventory, cost):
+    """부족한 리소스 {리소스: 부족량}"""
+    return {
+        res_type: amount - inventory.get(res_type, 0)
+        for res_type, amount in cost.items()
+        if inventory.get(res_type, 0) < amount
+    }
+
+
+def compute_mask(inventory, bits=ALL_BITS):
+    """bits에 해당하는 레시피의 조합 가능 비트 계산"""
+    mask = 0
+    for item_id, bit in RECIPE_BITS.items():
+        if bits & bit and can_afford(inventory, RECIPES[item_id]['cost']):
+            mask |= bit
+    return mask
@@ -1,9 +1,16 @@
 from panda3d.core import Point3, Vec3, BitMask32, TransparencyAttrib, CardMaker
 from direct.task import Task
+from game.spatial import LAYER_RESOURCE
+from game.poisson import PoissonDiskSampler
+from game.log import get_logger
 import random
 import math
 
 
+# 채집/생성 로그
+log = get_logger('resource', hot=True)
+
+
 class ResourceNode:
     """리소스 노드 기본 클래스 (나무, 돌 등)"""
     def __init__(self, game, position, resource_type):
@@ -16,19 +23,26 @@ class ResourceNode:
         self.gather_amount = 10  # 채집 시 얻는 양
         self.gather_time = 1.0  # 채집 시간 (초)
         self.is_being_gathered = False
+        self.on_depleted = None  # 고갈 이벤트 콜백 (resource) -> None
+        self.chunk = None  # 소속 월드 청크
 
     def create_visual(self):
         """시각적 표현 생성 (하위 클래스에서 구현)"""
         pass
 
     def gather(self, amount=10):
-        """채집 - 체력 감소"""
+        """채집 - 체력 감소 (고갈되는 순간 한 번만 고갈 이벤트 발생)"""
+        if self.is_depleted():
+            return 0
+
         self.health -= amount
 
         # 채집 효과
         self._create_gather_effect()
 
         if self.health <= 0:
+            if self.on_depleted:
+                self.on_depleted(self)
             return self.gather_amount  # 채집 완료 시 리소스 반환
         return 0  # 아직 채집 중
 
@@ -90,32 +104,11 @@ class Tree(ResourceNode):
         self.node.setTag('resource_type', 'wood')
         self.node.setTag('resource_node', str(id(self)))
 
-        print(f"[Resource] 나무 생성 at {self.position}")
+        log.debug("나무 생성 at %s", self.position)
 
     def _create_gather_effect(self):
         """채집 효과 - 나무 조각"""
-        effect_cm = CardMaker('wood_chip')
-        effect_cm.setFrame(-0.2, 0.2, -0.2, 0.2)
-
-        for _ in range(3):
-            chip = self.game.render.attachNewNode(effect_cm.generate())
-            chip.setPos(self.position)
-            chip.setZ(random.uniform(1.0, 3.0))
-
-            # 랜덤 방향으로 튀어나감
-            offset_x = random.uniform(-2, 2)
-            offset_y = random.uniform(-2, 2)
-            offset_z = random.uniform(2, 4)
-
-            chip.setTransparency(TransparencyAttrib.MAlpha)
-            chip.setColor(0.5, 0.4, 0.3, 1.0)
-
-            # 애니메이션 (나중에 구현)
-            self.game.taskMgr.doMethodLater(
-                0.5,
-                lambda task: chip.removeNode(),
-                f'remove_wood_chip_{id(chip)}'
-            )
+        self.game.particles.emit('wood_chip', self.position)
 
 
 class Rock(ResourceNode):
@@ -153,32 +146,15 @@ class Rock(ResourceNode):
         self.node.setTag('resource_type', 'stone')
         self.node.setTag('resource_node', str(id(self)))
 
-        print(f"[Resource] 돌 생성 at {self.position}")
+        log.debug("돌 생성 at %s", self.position)
 
     def _create_gather_effect(self):
         """채집 효과 - 돌가루"""
-        effect_cm = CardMaker('stone_dust')
-        effect_cm.setFrame(-0.15, 0.15, -0.15, 0.15)
-
-        for _ in range(5):
-            dust = self.game.render.attachNewNode(effect_cm.generate())
-            dust.setPos(self.position)
-            dust.setZ(random.uniform(0.5, 1.5))
-
-            # 랜덤 방향으로 퍼짐
-            dust.setTransparency(TransparencyAttrib.MAlpha)
-            dust.setColor(0.6, 0.6, 0.6, 0.7)
-
-            # 애니메이션
-            self.game.taskMgr.doMethodLater(
-                0.3,
-                lambda task: dust.removeNode(),
-                f'remove_stone_dust_{id(dust)}'
-            )
+        self.game.particles.emit('stone_dust', self.position)
 
 
 class ResourceSystem:
-    """리소스 시스템 관리자"""
+    """리소스 시스템 관리자 (청크별 리소스 필드)"""
     def __init__(self, game):
         self.game = game
         self.resources = []
@@ -186,78 +162,113 @@ class ResourceSystem:
         self.gather_cooldown = 0.0
         self.gather_cooldown_time = 0.5  # 채집 쿨다운
 
-        # 초기 리소스 생성
-        self._spawn_initial_resources()
+        # 청크당 배치 설정 (64x64 청크 기준)
+        self.chunk_tree_count = 6
+        self.chunk_rock_count = 4
+        self.min_spacing = 5.0  # 리소스 간 최소 거리
+        self.spawn_clearance = 6.0  # 플레이어 시작 지점 주변 빈 공간
+
+        # 세이브에서 불러온 청크별 리소스 (청크 키 -> [(타입, x, y, 체력)]) - 청크가 생성될 때 적용
+        self.saved_chunks = {}
+
+        print("[Resource] 리소스 시스템 초기화 (청크 단위 생성)")
+
+    def spawn_chunk(self, chunk, rng):
+        """청크 리소스 필드 생성 (청크 시드 rng로 결정론적 배치)"""
+        # 청크 가장자리에서 간격의 절반만큼 안쪽에 배치 -> 이웃 청크 리소스와도 간격 보장
+        margin = self.min_spacing / 2
+        chunk.placement = PoissonDiskSampler(
+            chunk.min_x + margin, chunk.min_y + margin,
+            chunk.max_x - margin, chunk.max_y - margin,
+            self.min_spacing, rng
+        )
+        self._reserve_occupied(chunk)
 
-    def _spawn_initial_resources(self):
-        """초기 리소스 스폰"""
-        # 맵 크기: -100 ~ 100 (200x200)
+        total = self.chunk_tree_count + self.chunk_rock_count
+        points = chunk.placement.sample(total)
 
-        # 나무 스폰 (30개)
-        for _ in range(30):
-            x = random.uniform(-80, 80)
-            y = random.uniform(-80, 80)
-            pos = Point3(x, y, 0)
-
-            # 다른 리소스와 너무 가까우면 스킵
-            if self._is_too_close_to_other_resources(pos, min_distance=5.0):
+        for i, (x, y) in enumerate(points):
+            # 플레이어 시작 지점 주변은 비워 둠
+            if x * x + y * y < self.spawn_clearance * self.spawn_clearance:
+                chunk.placement.remove_point(x, y)
                 continue
 
-            tree = Tree(self.game, pos)
-            self.resources.append(tree)
-
-        # 돌 스폰 (20개)
-        for _ in range(20):
-            x = random.uniform(-80, 80)
-            y = random.uniform(-80, 80)
             pos = Point3(x, y, 0)
-
-            # 다른 리소스와 너무 가까우면 스킵
-            if self._is_too_close_to_other_resources(pos, min_distance=5.0):
-                continue
-
-            rock = Rock(self.game, pos)
-            self.resources.append(rock)
-
-        print(f"[Resource] 초기 리소스 생성 완료: 나무 {sum(1 for r in self.resources if isinstance(r, Tree))}개, 돌 {sum(1 for r in self.resources if isinstance(r, Rock))}개")
-
-    def _is_too_close_to_other_resources(self, pos, min_distance=5.0):
-        """다른 리소스와 거리 체크"""
-        for resource in self.resources:
-            distance = (resource.position - pos).length()
-            if distance < min_distance:
-                return True
-        return False
+            if i < self.chunk_tree_count:
+                self._register(Tree(self.game, pos), chunk)
+            else:
+                self._register(Rock(self.game, pos), chunk)
+
+    def _reserve_occupied(self, chunk):
+        """기존 장애물 자리를 배치 격자에 미리 점유"""
+        for obstacle in self.game.obstacles.obstacles:
+            pos = obstacle.position
+            if chunk.contains(pos.x, pos.y):
+                chunk.placement.add_point(pos.x, pos.y)
+
+    def despawn_chunk(self, chunk):
+        """청크 리소스 해제 (청크 언로드 시)"""
+        for resource in chunk.resources:
+            resource.on_depleted = None
+            resource.cleanup()
+            self.resources.remove(resource)
+            self.game.spatial.remove(LAYER_RESOURCE, resource)
+        chunk.resources.clear()
+        chunk.placement = None
+
+    def _create(self, resource_type, pos):
+        """리소스 타입에 맞는 노드 생성"""
+        if resource_type == "wood":
+            return Tree(self.game, pos)
+        return Rock(self.game, pos)
+
+    def _register(self, resource, chunk):
+        """리소스 목록과 공간 인덱스에 등록"""
+        resource.chunk = chunk
+        resource.on_depleted = self._on_resource_depleted
+        chunk.resources.append(resource)
+        self.resources.append(resource)
+        self.game.spatial.insert(LAYER_RESOURCE, resource, resource.position)
+
+    def _on_resource_depleted(self, resource):
+        """고갈 이벤트 처리 - 정리, 인덱스 제거, 재스폰 예약"""
+        chunk = resource.chunk
+        chunk.resources_changed = True
+        resource.cleanup()
+        self.resources.remove(resource)
+        chunk.resources.remove(resource)
+        self.game.spatial.remove(LAYER_RESOURCE, resource)
+        if chunk.placement:
+            chunk.placement.remove_point(resource.position.x, resource.position.y)
+
+        # 리소스 재스폰
+        self._respawn_resource(resource)
 
     def update(self, dt):
-        """리소스 시스템 업데이트"""
+        """리소스 시스템 업데이트 (고갈 처리는 이벤트로 수행)"""
         # 쿨다운 감소
         if self.gather_cooldown > 0:
             self.gather_cooldown -= dt
 
-        # 고갈된 리소스 제거
-        for resource in self.resources[:]:
-            if resource.is_depleted():
-                resource.cleanup()
-                self.resources.remove(resource)
-
-                # 리소스 재스폰 (나중에 구현 가능)
-                self._respawn_resource(resource)
-
     def _respawn_resource(self, depleted_resource):
-        """리소스 재스폰"""
+        """리소스 재스폰 (같은 청크 안에서)"""
+        chunk = depleted_resource.chunk
+
         # 일정 시간 후에 리소스 재스폰
         def spawn():
-            x = random.uniform(-80, 80)
-            y = random.uniform(-80, 80)
-            pos = Point3(x, y, 0)
-
-            if depleted_resource.resource_type == "wood":
-                new_resource = Tree(self.game, pos)
-            else:
-                new_resource = Rock(self.game, pos)
-
-            self.resources.append(new_resource)
+            # 그 사이 청크가 언로드되었으면 재스폰하지 않음 (다시 로드되면 시드로 재생성)
+            if chunk.placement is None:
+                return
+
+            # 배치 격자에서 간격 조건을 만족하는 빈자리 찾기
+            point = chunk.placement.find_free_point()
+            if point is None:
+                print(f"[Resource] 재스폰 위치 없음: {depleted_resource.resource_type}")
+                return
+            pos = Point3(point[0], point[1], 0)
+
+            new_resource = self._create(depleted_resource.resource_type, pos)
+            self._register(new_resource, chunk)
             print(f"[Resource] 리소스 재스폰: {new_resource.resource_type} at {pos}")
 
         self.game.taskMgr.doMethodLater(
@@ -271,18 +282,12 @@ class ResourceSystem:
         if self.gather_cooldown > 0:
             return None, None
 
-        # 가장 가까운 리소스 찾기
-        closest_resource = None
-        closest_distance = float('inf')
-
-        for resource in self.resources:
-            distance = (resource.position - player_pos).length()
-            if distance < closest_distance:
-                closest_distance = distance
-                closest_resource = resource
+        # 사정거리 내 가장 가까운 리소스 찾기
+        closest_resource, _ = self.game.spatial.nearest(
+            LAYER_RESOURCE, player_pos, self.gather_range
+        )
 
-        # 사정거리 내에 있는지 확인
-        if closest_resource and closest_distance <= self.gather_range:
+        if closest_resource:
             # 도구 보너스 적용
             speed_bonus = 1.0
             amount_bonus = 1.0
@@ -303,6 +308,7 @@ class ResourceSystem:
             # 도구 내구도 사용 (실제로 채집했을 때만)
             if current_tool and actual_gathered > 0:
                 current_tool.use()
+                self.game.player.notify_tool_changed(self.game.player.current_tool_index)
 
             # 쿨다운 적용 (속도 보너스로 감소)
             self.gather_cooldown = self.gather_cooldown_time / speed_bonus
@@ -310,27 +316,82 @@ class ResourceSystem:
             if actual_gathered > 0:
                 # 채집 완료
                 resource_type = closest_resource.resource_type
-                bonus_text = f" (x{amount_bonus:.1f} bonus!)" if amount_bonus > 1.0 else ""
-                print(f"[Resource] 채집 완료: {resource_type} +{actual_gathered}{bonus_text}")
+                self.game.telemetry.record('gather', resource_type, player_pos.x, player_pos.y, actual_gathered)
+                log.debug("채집 완료: %s +%s%s", resource_type, actual_gathered,
+                          f" (x{amount_bonus:.1f} bonus!)" if amount_bonus > 1.0 else "")
                 return resource_type, actual_gathered
             else:
                 # 채집 중
                 resource_type = closest_resource.resource_type
-                print(f"[Resource] 채집 중: {resource_type} ({closest_resource.health}/{closest_resource.max_health})")
+                log.debug("채집 중: %s (%s/%s)", resource_type, closest_resource.health, closest_resource.max_health)
                 return resource_type, 0
 
         return None, None
 
     def get_nearby_resource(self, player_pos, max_distance=10.0):
-        """근처의 리소스 반환 (UI 표시용)"""
+        """가장 가까운 리소스 반환 (UI 표시용)"""
+        return self.game.spatial.nearest(LAYER_RESOURCE, player_pos, max_distance)
+
+    def reset(self):
+        """재시작 - 재스폰 예약 취소, 남은 리소스 체력 회복 (고갈된 청크는 World.reset이 다시 생성)"""
+        self.game.taskMgr.removeTasksMatching('respawn_*')
+        self.saved_chunks.clear()
+        self.gather_cooldown = 0.0
         for resource in self.resources:
-            distance = (resource.position - player_pos).length()
-            if distance <= max_distance:
-                return resource, distance
-        return None, None
+            resource.health = resource.max_health
+
+    def save_state(self):
+        """세이브용 상태 (생성된 청크의 리소스만 - 나머지 청크는 시드로 다시 생성)"""
+        chunks = [chunk for chunk in self.game.world.chunks.values() if chunk.loaded]
+        resources = [
+            (resource.resource_type, resource.position.x, resource.position.y, resource.health)
+            for chunk in chunks for resource in chunk.resources
+        ]
+        return {'resources': resources, 'chunks': [chunk.key for chunk in chunks]}
+
+    def load_state(self, state):
+        """세이브 상태 적용 (이미 생성된 청크는 바로, 나머지는 생성될 때 교체)"""
+        self.game.taskMgr.removeTasksMatching('respawn_*')
+
+        world = self.game.world
+        self.saved_chunks = {tuple(key): [] for key in state.get('chunks', ())}
+        for record in state.get('resources', ()):
+            records = self.saved_chunks.get(world.chunk_key(record[1], record[2]))
+            if records is not None:
+                records.append(record)
+
+        for chunk in list(world.chunks.values()):
+            if chunk.loaded:
+                self.restore_chunk(chunk)
+
+    def restore_chunk(self, chunk):
+        """저장된 리소스가 있는 청크면 시드로 만든 리소스를 저장된 것으로 교체"""
+        records = self.saved_chunks.pop(chunk.key, None)
+        if records is None:
+            return
+        chunk.resources_changed = True
+
+        for resource in chunk.resources:
+            resource.on_depleted = None
+            resource.cleanup()
+            self.resources.remove(resource)
+            self.game.spatial.remove(LAYER_RESOURCE, resource)
+            if chunk.placement:
+                chunk.placement.remove_point(resource.position.x, resource.position.y)
+        chunk.resources.clear()
+
+        for resource_type, x, y, health in records:
+            resource = self._create(resource_type, Point3(x, y, 0))
+            resource.health = health
+            self._register(resource, chunk)
+            if chunk.placement:
+                chunk.placement.add_point(x, y)
 
     def cleanup(self):
         """정리"""
         for resource in self.resources:
+            resource.on_depleted = None
             resource.cleanup()
+            resource.chunk.resources.clear()
         self.resources.clear()
+        self.game.spatial.clear(LAYER_RESOURCE)
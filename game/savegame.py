@@ -0,0 +1,247 @@
+"""
+세이브/로드
+각 시스템의 save_state()가 돌려주는 레코드 목록을 섹션별 고정 struct 배열로 묶고 zlib으로 압축
+자동 저장은 메인 스레드에서 상태를 튜플로 복사만 하고, 직렬화/압축/파일 쓰기는 백그라운드 스레드에서
+
+파일 구조:
+    헤더  <4sHI  매직, 버전, 압축 전 크기
+    본문  zlib(문자열 표 + 섹션들)
+    섹션  <4sI   태그, 레코드 수  + 레코드 배열 (형식은 SECTIONS 참고)
+"""
+import os
+import struct
+import threading
+import time
+import zlib
+
+from game.config import SAVE_PATH, AUTOSAVE_INTERVAL
+
+
+SAVE_MAGIC = b'APSV'
+SAVE_VERSION = 1
+
+_HEADER = struct.Struct('<4sHI')
+_SECTION = struct.Struct('<4sI')
+_STRING = struct.Struct('<H')
+
+# 섹션 (키 -> (태그, 레코드 형식)) - 형식의 'S'는 문자열 표 번호(H)로 저장
+SECTIONS = {
+    # x, y, z, heading, pitch, health, defense, stamina, hunger, 무기 번호, 도구 슬롯
+    'player': (b'PLYR', 'fffffffffbb'),
+    # 리소스, 개수
+    'inventory': (b'INVT', 'Si'),
+    # 슬롯, 도구 타입, 내구도
+    'tools': (b'TOOL', 'BSf'),
+    # 무기 타입, 내구도, 탄창, 예비 탄약, 발사 모드, 부착물 (scope, grip, muzzle, magazine)
+    'weapons': (b'WEAP', 'SfiiSSSSS'),
+    # 적 타입, x, y, z, 체력, 최대 체력, 공격력
+    'enemies': (b'ENMY', 'Sffffff'),
+    # 웨이브, 웨이브 타이머, 스폰 타이머, 웨이브 스폰 수, 점수, 처치 수
+    'wave': (b'WAVE', 'IffIII'),
+    # 리소스 타입, x, y, 체력
+    'resources': (b'NODE', 'Sfff'),
+    # 리소스를 저장한 (생성되어 있던) 청크 키
+    'chunks': (b'CHNK', 'ii'),
+    # 아이템 종류 (tool/resource), 세부 타입, 내구도 또는 개수, x, y, z, 경과 시간
+    'ground_items': (b'ITEM', 'SSfffff'),
+    # 구조물 타입, x, y, z, 가로, 높이, 깊이
+    'structures': (b'STRC', 'Sffffff'),
+    # 게임 시간 (분), 누적 하늘 시간
+    'time': (b'TIME', 'dd'),
+}
+
+
+def _record_struct(fmt):
+    """레코드 형식 -> (Struct, 문자열 필드 위치)"""
+    string_fields = tuple(i for i, c in enumerate(fmt) if c == 'S')
+    return struct.Struct('<' + fmt.replace('S', 'H')), string_fields
+
+
+_RECORDS = {key: _record_struct(fmt) for key, (_, fmt) in SECTIONS.items()}
+_TAGS = {tag: key for key, (tag, _) in SECTIONS.items()}
+
+
+def pack_snapshot(state):
+    """상태 {섹션: [레코드 튜플]} -> 압축된 바이트"""
+    strings = []
+    string_ids = {}
+
+    def intern(text):
+        string_id = string_ids.get(text)
+        if string_id is None:
+            string_id = string_ids[text] = len(strings)
+            strings.append(text)
+        return string_id
+
+    sections = []
+    for key, records in state.items():
+        tag = SECTIONS[key][0]
+        record, string_fields = _RECORDS[key]
+        parts = [_SECTION.pack(tag, len(records))]
+        for values in records:
+            if string_fields:
+                values = list(values)
+                for i in string_fields:
+                    values[i] = intern(values[i])
+            parts.append(record.pack(*values))
+        sections.append(b''.join(parts))
+
+    # 문자열 표 (개수, 그 뒤로 길이 + UTF-8)
+    table = [_STRING.pack(len(strings))]
+    for text in strings:
+        encoded = text.encode('utf-8')
+        table.append(_STRING.pack(len(encoded)) + encoded)
+
+    body = b''.join(table) + b''.join(sections)
+    return _HEADER.pack(SAVE_MAGIC, SAVE_VERSION, len(body)) + zlib.compress(body, 6)
+
+
+def unpack_snapshot(data):
+    """압축된 바이트 -> 상태 {섹션: [레코드 튜플]} (형식이 다르면 ValueError)"""
+    magic, version, size = _HEADER.unpack_from(data, 0)
+    if magic != SAVE_MAGIC:
+        raise ValueError("세이브 파일이 아닙니다")
+    if version != SAVE_VERSION:
+        raise ValueError(f"지원하지 않는 세이브 버전: {version}")
+
+    body = zlib.decompress(data[_HEADER.size:])
+    if len(body) != size:
+        raise ValueError("세이브 파일이 손상되었습니다")
+
+    offset = 0
+    (count,) = _STRING.unpack_from(body, offset)
+    offset += _STRING.size
+    strings = []
+    for _ in range(count):
+        (length,) = _STRING.unpack_from(body, offset)
+        offset += _STRING.size
+        strings.append(body[offset:offset + length].decode('utf-8'))
+        offset += length
+
+    state = {}
+    while offset < len(body):
+        tag, count = _SECTION.unpack_from(body, offset)
+        offset += _SECTION.size
+        key = _TAGS.get(tag)
+        if key is None:
+            raise ValueError(f"알 수 없는 섹션: {tag!r}")
+        record, string_fields = _RECORDS[key]
+        end = offset + record.size * count
+        records = list(record.iter_unpack(body[offset:end]))
+        if string_fields:
+            for n, values in enumerate(records):
+                values = list(values)
+                for i in string_fields:
+                    values[i] = strings[values[i]]
+                records[n] = tuple(values)
+        state[key] = records
+        offset = end
+
+    return state
+
+
+class SaveSystem:
+    """스냅샷 저장/불러오기 + 자동 저장"""
+
+    def __init__(self, game):
+        self.game = game
+        self.path = SAVE_PATH
+        self.saving = False       # 백그라운드 저장 진행 중
+        self.last_save = None     # (크기 bytes, 직렬화 ms, 캡처 ms)
+        self._thread = None
+
+        if AUTOSAVE_INTERVAL > 0:
+            game.taskMgr.doMethodLater(AUTOSAVE_INTERVAL, self._autosave_task, 'autosave')
+
+        print(f"[Save] 세이브 시스템 초기화 (자동 저장 {AUTOSAVE_INTERVAL:.0f}초)")
+
+    def capture(self):
+        """모든 시스템 상태를 튜플로 복사 (메인 스레드, 이후 게임이 바뀌어도 스냅샷은 그대로)"""
+        game = self.game
+        state = {}
+        state.update(game.player.save_state())
+        state.update(game.enemies.save_state())
+        state.update(game.resources.save_state())
+        state.update(game.ground_items.save_state())
+        state.update(game.structures.save_state())
+        state.update(game.daynight.save_state())
+        return state
+
+    def save(self, blocking=False):
+        """스냅샷 저장 (기본은 백그라운드, 이미 저장 중이면 건너뜀)"""
+        if self.saving:
+            return False
+
+        start = time.perf_counter()
+        state = self.capture()
+        capture_ms = (time.perf_counter() - start) * 1000.0
+
+        self.saving = True
+        if blocking:
+            self._write(state, capture_ms)
+        else:
+            self._thread = threading.Thread(
+                target=self._write, args=(state, capture_ms), name="autosave", daemon=True
+            )
+            self._thread.start()
+        return True
+
+    def _write(self, state, capture_ms):
+        """직렬화 + 압축 + 파일 쓰기 (임시 파일에 쓰고 교체 - 중간에 꺼져도 이전 세이브 유지)"""
+        try:
+            start = time.perf_counter()
+            data = pack_snapshot(state)
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            temp_path = self.path + ".tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, self.path)
+            self.last_save = (len(data), (time.perf_counter() - start) * 1000.0, capture_ms)
+            print(f"[Save] 저장 완료: {len(data)} bytes "
+                  f"(캡처 {capture_ms:.1f}ms, 직렬화 {self.last_save[1]:.1f}ms)")
+        except (OSError, struct.error) as e:
+            print(f"[Save] 저장 실패: {e}")
+        finally:
+            self.saving = False
+
+    def load(self):
+        """세이브 파일을 읽어 모든 시스템에 적용 (없거나 손상되면 False)"""
+        if not os.path.exists(self.path):
+            print("[Save] 세이브 파일 없음")
+            return False
+
+        # 저장 중이던 파일을 읽지 않도록 대기
+        if self._thread is not None:
+            self._thread.join()
+
+        start = time.perf_counter()
+        try:
+            with open(self.path, 'rb') as f:
+                state = unpack_snapshot(f.read())
+        except (OSError, ValueError, struct.error, zlib.error) as e:
+            print(f"[Save] 불러오기 실패: {e}")
+            return False
+
+        game = self.game
+        game.player.load_state(state)
+        game.world.load_around(game.player.node.getPos())
+        game.resources.load_state(state)
+        game.structures.load_state(state)
+        game.enemies.load_state(state)
+        game.ground_items.load_state(state)
+        game.daynight.load_state(state)
+
+        print(f"[Save] 불러오기 완료 ({(time.perf_counter() - start) * 1000.0:.1f}ms)")
+        return True
+
+    def _autosave_task(self, task):
+        """주기적 자동 저장 (게임 오버/일시정지 중에는 건너뜀)"""
+        if not self.game.game_over and not self.game.controls.is_paused():
+            self.save()
+        return task.again
+
+    def cleanup(self):
+        """자동 저장 중지 (진행 중인 저장은 끝까지 기다림)"""
+        self.game.taskMgr.remove('autosave')
+        if self._thread is not None:
+            self._thread.join()
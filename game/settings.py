@@ -0,0 +1,109 @@
+"""
+설정 캐시
+시작 시 DB 설정을 타입에 맞게 한 번 읽어 두고, 읽기는 dict 조회로 처리
+값이 바뀌면 리스너에 알리고, DB 쓰기는 모아 두었다가 주기적으로 한 번에 내보냄
+"""
+
+
+# 설정 정의 (키 -> (타입, 기본값, (최소, 최대) 또는 None))
+SETTINGS_SCHEMA = {
+    'mouse_sensitivity': (float, 100.0, (10.0, 500.0)),
+    'master_volume': (float, 1.0, (0.0, 1.0)),
+    'sfx_volume': (float, 1.0, (0.0, 1.0)),
+    'fov': (float, 60.0, (40.0, 110.0)),
+}
+
+# 바뀐 설정을 DB로 내보내는 간격 (초)
+SETTINGS_FLUSH_INTERVAL = 2.0
+
+
+def _parse(value_type, text):
+    """DB 문자열 -> 타입 값"""
+    if value_type is bool:
+        return text.lower() in ('1', 'true', 'on', 'yes')
+    return value_type(text)
+
+
+class Settings:
+    """타입이 있는 설정 캐시 (변경 알림 + 쓰기 모아서 내보내기)"""
+
+    def __init__(self, game):
+        self.game = game
+        self.values = {}      # 키 -> 현재 값 (타입 변환 완료)
+        self.listeners = {}   # 키 -> [콜백(키, 값)]
+        self.dirty = set()    # DB에 아직 쓰지 않은 키
+        self.writes = 0
+
+        for key, (value_type, default, _) in SETTINGS_SCHEMA.items():
+            text = game.db.get_setting(key)
+            if text is None:
+                self.values[key] = default
+                continue
+            try:
+                self.values[key] = self._clamp(key, _parse(value_type, text))
+            except ValueError:
+                print(f"[Settings] 잘못된 값 무시: {key}={text!r} (기본값 {default})")
+                self.values[key] = default
+
+        game.taskMgr.doMethodLater(SETTINGS_FLUSH_INTERVAL, self._flush_task, 'settings_flush')
+
+        print(f"[Settings] 설정 {len(self.values)}개 로드")
+
+    def _clamp(self, key, value):
+        """범위가 있는 설정은 범위 안으로"""
+        value_range = SETTINGS_SCHEMA[key][2]
+        if value_range is None:
+            return value
+        return max(value_range[0], min(value_range[1], value))
+
+    def get(self, key):
+        """설정 값 (dict 조회)"""
+        return self.values[key]
+
+    def set(self, key, value):
+        """설정 변경 (타입 변환/범위 제한, 값이 같으면 무시) - 바뀌었으면 True"""
+        if key not in SETTINGS_SCHEMA:
+            raise KeyError(key)
+        value_type = SETTINGS_SCHEMA[key][0]
+        if isinstance(value, str):
+            value = _parse(value_type, value)
+        value = self._clamp(key, value_type(value))
+
+        if self.values[key] == value:
+            return False
+        self.values[key] = value
+        self.dirty.add(key)
+
+        for callback in self.listeners.get(key, ()):
+            callback(key, value)
+        return True
+
+    def add_listener(self, key, callback, notify=True):
+        """설정 변경 리스너 등록 (notify면 현재 값으로 한 번 바로 호출)"""
+        self.listeners.setdefault(key, []).append(callback)
+        if notify:
+            callback(key, self.values[key])
+
+    def remove_listener(self, key, callback):
+        """설정 변경 리스너 해제"""
+        if callback in self.listeners.get(key, ()):
+            self.listeners[key].remove(callback)
+
+    def flush(self):
+        """바뀐 설정을 DB 쓰기 스레드로 넘김 (키마다 마지막 값 한 번만)"""
+        for key in self.dirty:
+            self.game.db.set_setting(key, str(self.values[key]))
+            self.writes += 1
+        self.dirty.clear()
+
+    def _flush_task(self, task):
+        """주기적으로 바뀐 설정 내보내기"""
+        if self.dirty:
+            self.flush()
+        return task.again
+
+    def cleanup(self):
+        """남은 변경 내보내고 정리 (DB를 닫기 전에 호출)"""
+        self.game.taskMgr.remove('settings_flush')
+        self.flush()
+        self.listeners.clear()
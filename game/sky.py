@@ -0,0 +1,176 @@
+"""
+하늘 돔
+시간 값 하나(uniform)로 그라데이션, 태양/달, 흘러가는 구름을 GPU에서 그림
+"""
+from panda3d.core import (
+    Geom, GeomNode, GeomTriangles, GeomVertexData, GeomVertexFormat,
+    GeomVertexWriter, Shader
+)
+import math
+
+
+# 돔 반경과 분할 수 (배경 빈에 깊이 없이 그리므로 반경은 카메라 far 안쪽이면 됨)
+SKY_RADIUS = 500.0
+SKY_RINGS = 12
+SKY_SEGMENTS = 24
+
+SKY_VERTEX_SHADER = """
+#version 120
+
+uniform mat4 p3d_ModelViewProjectionMatrix;
+attribute vec4 p3d_Vertex;
+varying vec3 v_dir;
+
+void main() {
+    v_dir = p3d_Vertex.xyz;
+    gl_Position = p3d_ModelViewProjectionMatrix * p3d_Vertex;
+}
+"""
+
+SKY_FRAGMENT_SHADER = """
+#version 120
+
+// 누적 게임 시간 (분, 1440분 = 하루)
+uniform float u_time;
+varying vec3 v_dir;
+
+const float PI = 3.14159265;
+
+float hash(vec2 p) {
+    return fract(sin(dot(p, vec2(127.1, 311.7))) * 43758.5453);
+}
+
+float noise(vec2 p) {
+    vec2 i = floor(p);
+    vec2 f = fract(p);
+    f = f * f * (3.0 - 2.0 * f);
+    return mix(mix(hash(i), hash(i + vec2(1.0, 0.0)), f.x),
+               mix(hash(i + vec2(0.0, 1.0)), hash(i + vec2(1.0, 1.0)), f.x), f.y);
+}
+
+float fbm(vec2 p) {
+    float value = 0.0;
+    float amplitude = 0.5;
+    for (int i = 0; i < 4; i++) {
+        value += amplitude * noise(p);
+        p *= 2.0;
+        amplitude *= 0.5;
+    }
+    return value;
+}
+
+void main() {
+    vec3 dir = normalize(v_dir);
+    float minute = mod(u_time, 1440.0);
+
+    // 태양 강도 (6시~18시, 정오 최대) - DayNightCycle 조명 곡선과 동일
+    float sun_intensity = clamp(1.0 - abs(minute - 720.0) / 360.0, 0.0, 1.0);
+
+    // 하늘 그라데이션 (낮: 하늘색, 밤: 어두운 남색)
+    vec3 zenith = sun_intensity > 0.0
+        ? vec3(0.5, 0.7, 0.9) * sun_intensity + 0.05
+        : vec3(0.05, 0.05, 0.1);
+    vec3 horizon = sun_intensity > 0.0
+        ? vec3(0.75, 0.85, 0.95) * sun_intensity + 0.08
+        : vec3(0.08, 0.08, 0.14);
+
+    // 새벽/해질녘 지평선 붉은 기미
+    float dawn = max(0.0, 1.0 - abs(minute - 360.0) / 90.0);
+    float dusk = max(0.0, 1.0 - abs(minute - 1080.0) / 90.0);
+    horizon += vec3(0.6, 0.25, 0.05) * (dawn + dusk);
+
+    vec3 color = mix(horizon, zenith, smoothstep(0.0, 0.6, dir.z));
+    color = mix(color, horizon * 0.5, smoothstep(0.0, -0.3, dir.z));
+
+    // 태양: 동쪽(6시)에서 떠서 서쪽(18시)으로 지는 반원 궤적
+    float sun_angle = (minute - 360.0) / 720.0 * PI;
+    vec3 sun_dir = normalize(vec3(cos(sun_angle), sin(sun_angle) * 0.3, sin(sun_angle)));
+    float sun_dot = dot(dir, sun_dir);
+    float sun_visible = step(360.0, minute) * step(minute, 1080.0);
+    float sun_disc = smoothstep(0.9985, 0.9990, sun_dot);
+    float sun_glow = pow(max(sun_dot, 0.0), 64.0) * 0.3;
+    color += vec3(1.0, 0.9, 0.3) * (sun_disc + sun_glow) * sun_visible;
+
+    // 달: 태양과 정반대 궤적
+    float moon_progress = minute > 1080.0 ? (minute - 1080.0) / 720.0 : (minute + 360.0) / 720.0;
+    float moon_angle = moon_progress * PI;
+    vec3 moon_dir = normalize(vec3(-cos(moon_angle), sin(moon_angle) * 0.3, sin(moon_angle)));
+    float moon_disc = smoothstep(0.9994, 0.99965, dot(dir, moon_dir));
+    color = mix(color, vec3(0.8, 0.8, 0.9), moon_disc * (1.0 - sun_visible));
+
+    // 구름 (지평선 위 평면에 투영한 fbm 노이즈, 시간에 따라 흘러감)
+    if (dir.z > 0.0) {
+        vec2 uv = dir.xy / max(dir.z, 0.05) * 0.5;
+        uv += vec2(u_time * 0.02, u_time * 0.005);
+        float cloud = smoothstep(0.5, 0.8, fbm(uv * 1.5));
+        cloud *= smoothstep(0.0, 0.2, dir.z);
+        vec3 cloud_color = mix(vec3(0.15, 0.15, 0.2), vec3(1.0), sun_intensity * 0.9 + 0.1);
+        color = mix(color, cloud_color, cloud * 0.8);
+    }
+
+    gl_FragColor = vec4(color, 1.0);
+}
+"""
+
+
+class SkyDome:
+    """카메라를 따라다니는 하늘 돔 (시간 uniform 하나만 갱신)"""
+
+    def __init__(self, game):
+        self.game = game
+        self.time = -1.0
+
+        self.node = self.game.camera.attachNewNode(self._create_dome())
+        self.node.setCompass()  # 위치만 카메라를 따르고 방향은 월드 기준
+        self.node.setBin('background', 0)
+        self.node.setDepthWrite(False)
+        self.node.setDepthTest(False)
+        self.node.setLightOff()
+        self.node.setTwoSided(True)
+
+        self.node.setShader(Shader.make(Shader.SL_GLSL, SKY_VERTEX_SHADER, SKY_FRAGMENT_SHADER))
+        self.node.setShaderInput('u_time', 0.0)
+
+        print("[Sky] 하늘 돔 생성 완료")
+
+    def _create_dome(self):
+        """위경도 구 메시 생성"""
+        vdata = GeomVertexData('sky_dome', GeomVertexFormat.getV3(), Geom.UH_static)
+        vdata.setNumRows((SKY_RINGS + 1) * (SKY_SEGMENTS + 1))
+        vertex = GeomVertexWriter(vdata, 'vertex')
+
+        for ring in range(SKY_RINGS + 1):
+            # 아래(-90도)에서 위(+90도)까지
+            elevation = math.pi * (ring / SKY_RINGS - 0.5)
+            z = math.sin(elevation) * SKY_RADIUS
+            r = math.cos(elevation) * SKY_RADIUS
+            for segment in range(SKY_SEGMENTS + 1):
+                azimuth = 2 * math.pi * segment / SKY_SEGMENTS
+                vertex.addData3(r * math.cos(azimuth), r * math.sin(azimuth), z)
+
+        triangles = GeomTriangles(Geom.UH_static)
+        row = SKY_SEGMENTS + 1
+        for ring in range(SKY_RINGS):
+            for segment in range(SKY_SEGMENTS):
+                a = ring * row + segment
+                b = a + row
+                triangles.addVertices(a, b, a + 1)
+                triangles.addVertices(a + 1, b, b + 1)
+
+        geom = Geom(vdata)
+        geom.addPrimitive(triangles)
+        geom_node = GeomNode('sky_dome')
+        geom_node.addGeom(geom)
+        return geom_node
+
+    def set_time(self, minutes):
+        """누적 게임 시간(분) 반영 - 프레임당 float 하나"""
+        if minutes != self.time:
+            self.time = minutes
+            self.node.setShaderInput('u_time', minutes)
+
+    def cleanup(self):
+        """정리"""
+        if self.node:
+            self.node.removeNode()
+            self.node = None
@@ -2,11 +2,85 @@
 사운드 매니저 - ArenaPulse 게임의 모든 사운드 효과를 관리
 """
 from direct.showbase.ShowBase import ShowBase
-from panda3d.core import AudioSound
+from direct.showbase.Audio3DManager import Audio3DManager
+from panda3d.core import ClockObject
 import os
+from game.log import get_logger
+from game.assets import ASSET_MANIFEST
+
+
+# 재생 로그 (사운드마다 호출, production 프로필에서는 no-op)
+log = get_logger('sound', hot=True)
+
+
+# 사운드 정의: 이름 -> (카테고리, 미리 만들어 둘 보이스 수, 3D 위치 재생 여부)
+# 파일 경로는 에셋 매니페스트 (game.assets.ASSET_MANIFEST['sounds'])
+SOUND_FILES = {
+    'gun_shot': ('weapon', 8, False),
+    'gun_reload': ('weapon', 2, False),
+    'empty_click': ('ui', 2, False),
+    'target_hit': ('impact', 6, True),
+}
+
+# 카테고리별 동시 재생 상한 (넘으면 그 카테고리에서 가장 오래된 보이스를 뺏음)
+CATEGORY_LIMITS = {
+    'weapon': 10,
+    'impact': 6,
+    'ui': 2,
+}
+
+# 3D 사운드 거리 감쇠 (OpenAL inverse distance clamped 모델과 같은 식)
+SOUND_MIN_DISTANCE = 8.0      # 이 거리까지는 감쇠 없음
+SOUND_DROP_OFF = 1.0          # 감쇠 계수
+AUDIBLE_THRESHOLD = 0.05      # 감쇠 후 볼륨이 이보다 작으면 보이스를 잡지 않고 버림
+MAX_3D_EMITTERS = 8           # 동시에 들리는 3D 음원 수 (가까운 순)
+
+
+def attenuate(distance):
+    """거리에 따른 볼륨 배율"""
+    if distance <= SOUND_MIN_DISTANCE:
+        return 1.0
+    return SOUND_MIN_DISTANCE / (SOUND_MIN_DISTANCE + SOUND_DROP_OFF * (distance - SOUND_MIN_DISTANCE))
+
+
+class SoundVoice:
+    """미리 로드한 AudioSound 인스턴스 하나 (재생 상태는 시작 시각과 길이로 추적)"""
+
+    def __init__(self, sound, name, category, emitter=None):
+        self.sound = sound
+        self.name = name
+        self.category = category
+        self.emitter = emitter    # 3D 보이스의 음원 위치 노드 (2D면 None, 재생 중에는 음원 노드에 붙음)
+        self.distance = 0.0       # 3D 재생 시작 시 청자와의 거리
+        self.length = sound.length()
+        self.start_time = -1.0
+        self.end_time = -1.0      # 이 시각 이후면 재생이 끝난 것으로 봄
+        self.volume = -1.0        # 마지막으로 적용한 볼륨
+        self.looping = False
+
+    def is_playing(self, now):
+        """재생 중인지 (status() 질의 없이 시간으로 판단)"""
+        return self.looping or now < self.end_time
+
+    def start(self, volume, now):
+        """재생 시작 (볼륨은 바뀐 경우에만 적용)"""
+        if self.volume != volume:
+            self.volume = volume
+            self.sound.setVolume(volume)
+        self.start_time = now
+        self.end_time = now + self.length
+        self.sound.play()
+
+    def stop(self):
+        """재생 중지"""
+        if self.end_time >= 0.0 or self.looping:
+            self.sound.stop()
+        self.looping = False
+        self.end_time = -1.0
+
 
 class SoundManager:
-    """게임의 모든 사운드를 관리하는 클래스"""
+    """게임의 모든 사운드를 관리하는 클래스 (사운드별 보이스 풀, 카테고리별 동시 재생 상한)"""
 
     def __init__(self, base: ShowBase):
         """
@@ -16,8 +90,20 @@ class SoundManager:
             base: Panda3D ShowBase 인스턴스
         """
         self.base = base
-        self.sounds = {}
-        self.sounds_dir = "sounds"
+        self.pools = {}        # 이름 -> [SoundVoice]
+        self.next_voice = {}   # 이름 -> 다음에 확인할 보이스 인덱스 (라운드 로빈)
+        self.active = {category: [] for category in CATEGORY_LIMITS}  # 카테고리 -> 시작 순 보이스
+        self.clock = ClockObject.getGlobalClock()
+        self.emitters = []     # 재생 중인 3D 보이스 (가까운 MAX_3D_EMITTERS개만 유지)
+        self.culled = 0        # 들리지 않아 버린 3D 재생 수
+
+        # 3D 오디오 (청자 = 카메라, 오디오 매니저가 없으면 2D로만 재생)
+        self.audio3d = None
+        self.emitter_root = None
+        if getattr(self.base, 'sfxManagerList', None):
+            self.audio3d = Audio3DManager(self.base.sfxManagerList[0], self.base.camera)
+            self.audio3d.setDropOffFactor(SOUND_DROP_OFF)
+            self.emitter_root = self.base.render.attachNewNode('sound_emitters')
 
         # 오디오 시스템 확인
         audio_active = hasattr(self.base, 'sfxManager') and self.base.sfxManager is not None
@@ -26,37 +112,46 @@ class SoundManager:
         # 현재 작업 디렉토리 확인
         print(f"[사운드] 현재 작업 디렉토리: {os.getcwd()}")
 
+        # 마스터 볼륨 설정 (0.0 ~ 1.0, 설정 캐시 값을 따름)
+        self.master_volume = 1.0
+        self.sfx_volume = 1.0
+        self.base_volume = 1.0    # master * sfx (볼륨이 바뀔 때만 다시 계산)
+        self._set_volumes()
+
         # 사운드 파일 로드
         self._load_sounds()
 
-        # 마스터 볼륨 설정 (0.0 ~ 1.0)
-        self.master_volume = 1.0  # 최대 볼륨으로 변경
-        self.sfx_volume = 1.0     # 최대 볼륨으로 변경
-        self._set_volumes()
+        # 볼륨 설정 변경 반영
+        self.base.settings.add_listener('master_volume', self._on_volume_setting)
+        self.base.settings.add_listener('sfx_volume', self._on_volume_setting)
 
-        print(f"[사운드] 사운드 매니저 초기화 완료 (로드된 사운드: {len(self.sounds)}개)")
+        print(f"[사운드] 사운드 매니저 초기화 완료 (로드된 사운드: {len(self.pools)}개)")
 
     def _load_sounds(self):
-        """sounds 폴더에서 모든 사운드 파일을 로드"""
-        sound_files = {
-            'gun_shot': 'gun_shot.wav',
-            'gun_reload': 'gun_reload.wav',
-            'empty_click': 'empty_click.wav',
-            'target_hit': 'target_hit.wav'
-        }
-
-        for name, filename in sound_files.items():
+        """sounds 폴더에서 모든 사운드 파일을 보이스 수만큼 로드"""
+        for name, (category, voice_count, spatial) in SOUND_FILES.items():
             # 절대 경로로 변환
-            filepath = os.path.abspath(os.path.join(self.sounds_dir, filename))
+            filename = ASSET_MANIFEST['sounds'][name]
+            filepath = os.path.abspath(filename)
 
             # 파일이 존재하는지 확인
             if os.path.exists(filepath):
                 try:
                     print(f"[사운드] 시도: {filepath}")
-                    sound = self.base.loader.loadSfx(filepath)
-                    if sound:
-                        self.sounds[name] = sound
-                        print(f"[사운드] [OK] 로드 성공: {filename}")
+                    voices = []
+                    for _ in range(voice_count):
+                        # 같은 파일은 오디오 데이터를 공유하고 재생 인스턴스만 따로 생김
+                        if spatial and self.audio3d:
+                            voice = self._load_spatial_voice(filepath, name, category)
+                        else:
+                            sound = self.base.loader.loadSfx(filepath)
+                            voice = SoundVoice(sound, name, category) if sound else None
+                        if voice:
+                            voices.append(voice)
+                    if voices:
+                        self.pools[name] = voices
+                        self.next_voice[name] = 0
+                        print(f"[사운드] [OK] 로드 성공: {filename} (보이스 {len(voices)}개)")
                     else:
                         print(f"[사운드] [FAIL] 로드 실패 (None 반환): {filename}")
                 except Exception as e:
@@ -64,16 +159,62 @@ class SoundManager:
             else:
                 print(f"[사운드] [FAIL] 파일 없음: {filepath}")
 
-        print(f"[사운드] 총 {len(self.sounds)}개 사운드 로드됨")
+        print(f"[사운드] 총 {len(self.pools)}개 사운드 로드됨")
+
+    def _load_spatial_voice(self, filepath, name, category):
+        """3D 보이스 로드 (보이스마다 전용 음원 노드에 붙임)"""
+        sound = self.audio3d.loadSfx(filepath)
+        if not sound:
+            return None
+        emitter = self.emitter_root.attachNewNode(f'sound_{name}')
+        self.audio3d.attachSoundToObject(sound, emitter)
+        self.audio3d.setSoundMinDistance(sound, SOUND_MIN_DISTANCE)
+        return SoundVoice(sound, name, category, emitter)
 
     def _set_volumes(self):
-        """모든 사운드의 볼륨 설정"""
-        for sound in self.sounds.values():
-            sound.setVolume(self.master_volume * self.sfx_volume)
+        """기본 볼륨 다시 계산 (각 보이스에는 다음 재생 때 바뀐 경우에만 적용)"""
+        self.base_volume = self.master_volume * self.sfx_volume
+        for voices in self.pools.values():
+            for voice in voices:
+                if voice.looping:
+                    voice.volume = self.base_volume
+                    voice.sound.setVolume(self.base_volume)
+
+    def _acquire(self, name, now):
+        """재생할 보이스 선택 (쉬는 보이스를 라운드 로빈으로, 없으면 가장 오래된 보이스를 뺏음)"""
+        voices = self.pools[name]
+        count = len(voices)
+        start = self.next_voice[name]
+
+        oldest = None
+        for i in range(count):
+            voice = voices[(start + i) % count]
+            if not voice.is_playing(now):
+                self.next_voice[name] = (start + i + 1) % count
+                return voice
+            if not voice.looping and (oldest is None or voice.start_time < oldest.start_time):
+                oldest = voice
+
+        if oldest is not None:
+            oldest.stop()
+        return oldest
+
+    def _reserve_category(self, voice, now):
+        """카테고리 동시 재생 상한 적용 (넘으면 가장 오래된 보이스 중지)"""
+        active = self.active.setdefault(voice.category, [])
+
+        # 끝났거나 다시 쓰이는 보이스 정리
+        active[:] = [v for v in active if v is not voice and v.is_playing(now)]
+
+        limit = CATEGORY_LIMITS.get(voice.category)
+        if limit is not None:
+            while len(active) >= limit:
+                active.pop(0).stop()
+        active.append(voice)
 
     def play(self, sound_name: str, volume: float = 1.0) -> bool:
         """
-        사운드 재생
+        사운드 재생 (재생 중인 같은 사운드를 끊지 않고 겹쳐서 재생)
 
         Args:
             sound_name: 재생할 사운드 이름 ('gun_shot', 'gun_reload' 등)
@@ -82,24 +223,89 @@ class SoundManager:
         Returns:
             bool: 재생 성공 여부
         """
-        if sound_name in self.sounds:
-            sound = self.sounds[sound_name]
+        if sound_name not in self.pools:
+            log.warning("[FAIL] 사운드 없음: %s", sound_name)
+            return False
 
-            # 이미 재생 중이면 중지하고 다시 재생 (중복 재생 방지)
-            if sound.status() == AudioSound.PLAYING:
-                sound.stop()
+        now = self.clock.getFrameTime()
+        voice = self._acquire(sound_name, now)
+        if voice is None:
+            return False
 
-            final_volume = self.master_volume * self.sfx_volume * volume
-            sound.setVolume(final_volume)
-            sound.play()
+        self._reserve_category(voice, now)
+        final_volume = self.base_volume * volume
+        voice.start(final_volume, now)
 
-            # 디버그: 재생 확인
-            status = sound.status()
-            print(f"[사운드] 재생: {sound_name} (볼륨: {final_volume:.2f}, 상태: {status})")
-            return True
-        else:
-            print(f"[사운드] [FAIL] 사운드 없음: {sound_name}")
+        log.debug("재생: %s (볼륨: %.2f)", sound_name, final_volume)
+        return True
+
+    def play_at(self, sound_name: str, source, volume: float = 1.0) -> bool:
+        """
+        위치 기반 3D 사운드 재생 (들리지 않을 만큼 멀면 보이스를 잡기 전에 버림)
+
+        Args:
+            sound_name: 재생할 사운드 이름
+            source: 음원 NodePath(적, 투사체 등) 또는 월드 좌표
+            volume: 개별 볼륨
+
+        Returns:
+            bool: 재생 여부
+        """
+        voices = self.pools.get(sound_name)
+        if not voices or voices[0].emitter is None:
+            # 3D 보이스가 없으면 일반 재생
+            return self.play(sound_name, volume)
+
+        render = self.base.render
+        follow = hasattr(source, 'getPos')  # NodePath면 재생하는 동안 따라다님
+        position = source.getPos(render) if follow else source
+        distance = (position - self.base.camera.getPos(render)).length()
+
+        # 가청 거리 컬링 (보이스 할당 전)
+        if self.base_volume * volume * attenuate(distance) < AUDIBLE_THRESHOLD:
+            self.culled += 1
+            return False
+
+        # 가까운 N개 음원만 유지 (가득 찼으면 가장 먼 음원보다 가까울 때만 재생)
+        now = self.clock.getFrameTime()
+        for voice in self.emitters:
+            if not voice.is_playing(now):
+                self._release_emitter(voice)
+        self.emitters[:] = [v for v in self.emitters if v.is_playing(now)]
+        if len(self.emitters) >= MAX_3D_EMITTERS:
+            farthest = max(self.emitters, key=lambda v: v.distance)
+            if farthest.distance <= distance:
+                self.culled += 1
+                return False
+            farthest.stop()
+            self._release_emitter(farthest)
+            self.emitters.remove(farthest)
+
+        voice = self._acquire(sound_name, now)
+        if voice is None:
             return False
+        if voice in self.emitters:
+            self.emitters.remove(voice)
+
+        # 음원 노드에 붙여 움직임을 따라가게 함 (좌표면 고정 위치)
+        # 감쇠는 오디오 엔진이 거리로 계산하므로 볼륨은 개별 볼륨만 적용
+        if follow:
+            voice.emitter.reparentTo(source)
+            voice.emitter.setPos(0, 0, 0)
+        else:
+            voice.emitter.reparentTo(self.emitter_root)
+            voice.emitter.setPos(position)
+        voice.distance = distance
+        self._reserve_category(voice, now)
+        voice.start(self.base_volume * volume, now)
+        self.emitters.append(voice)
+
+        log.debug("3D 재생: %s (거리: %.1f)", sound_name, distance)
+        return True
+
+    def _release_emitter(self, voice):
+        """음원 노드를 다시 sound_emitters 아래로 (붙어 있던 적/투사체가 제거되어도 보이스는 유지)"""
+        voice.emitter.reparentTo(self.emitter_root)
 
     def play_looping(self, sound_name: str, volume: float = 1.0) -> bool:
         """
@@ -112,24 +318,50 @@ class SoundManager:
         Returns:
             bool: 재생 성공 여부
         """
-        if sound_name in self.sounds:
-            sound = self.sounds[sound_name]
-            sound.setLoop(True)
-            final_volume = self.master_volume * self.sfx_volume * volume
-            sound.setVolume(final_volume)
-            sound.play()
-            return True
-        return False
+        if sound_name not in self.pools:
+            return False
+
+        voice = self._acquire(sound_name, self.clock.getFrameTime())
+        if voice is None:
+            return False
+
+        voice.sound.setLoop(True)
+        voice.looping = True
+        voice.start(self.base_volume * volume, self.clock.getFrameTime())
+        return True
 
     def stop(self, sound_name: str):
-        """재생 중인 사운드 중지"""
-        if sound_name in self.sounds:
-            self.sounds[sound_name].stop()
+        """재생 중인 사운드 중지 (해당 사운드의 모든 보이스)"""
+        for voice in self.pools.get(sound_name, ()):
+            if voice.looping:
+                voice.sound.setLoop(False)
+            voice.stop()
 
     def stop_all(self):
         """모든 사운드 중지"""
-        for sound in self.sounds.values():
-            sound.stop()
+        for name in self.pools:
+            self.stop(name)
+        for active in self.active.values():
+            active.clear()
+        for voice in self.emitters:
+            self._release_emitter(voice)
+        self.emitters.clear()
+
+    def reset(self):
+        """재시작 - 모든 사운드 중지 (보이스 풀은 유지)"""
+        self.stop_all()
+
+    def get_stats(self):
+        """보이스 사용 현황"""
+        now = self.clock.getFrameTime()
+        return {
+            'voices': sum(len(voices) for voices in self.pools.values()),
+            'playing': sum(
+                1 for voices in self.pools.values() for voice in voices if voice.is_playing(now)
+            ),
+            'emitters': len(self.emitters),
+            'culled': self.culled,
+        }
 
     def set_master_volume(self, volume: float):
         """
@@ -151,8 +383,27 @@ class SoundManager:
         self.sfx_volume = max(0.0, min(1.0, volume))
         self._set_volumes()
 
+    def _on_volume_setting(self, key, value):
+        """설정 캐시의 볼륨 변경 반영"""
+        if key == 'master_volume':
+            self.set_master_volume(value)
+        else:
+            self.set_sfx_volume(value)
+
     def cleanup(self):
         """사운드 매니저 정리"""
         self.stop_all()
-        self.sounds.clear()
+        self.base.settings.remove_listener('master_volume', self._on_volume_setting)
+        self.base.settings.remove_listener('sfx_volume', self._on_volume_setting)
+        if self.audio3d:
+            for voices in self.pools.values():
+                for voice in voices:
+                    if voice.emitter is not None:
+                        self.audio3d.detachSound(voice.sound)
+            self.audio3d.disable()
+            self.audio3d = None
+        if self.emitter_root:
+            self.emitter_root.removeNode()
+            self.emitter_root = None
+        self.pools.clear()
         print("[사운드] 사운드 매니저 정리 완료")
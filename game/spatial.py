@@ -0,0 +1,191 @@
+"""
+공간 인덱스
+레이어별 균일 격자(해시 그리드)로 근접 질의를 처리
+"""
+import heapq
+import math
+
+
+# 레이어 종류
+LAYER_RESOURCE = "resource"        # 나무, 돌
+LAYER_GROUND_ITEM = "ground_item"  # 바닥 아이템
+LAYER_TARGET = "target"            # 표적
+LAYER_ENEMY = "enemy"              # 적
+LAYER_OBSTACLE = "obstacle"        # 장애물, 설치한 구조물
+
+
+class SpatialIndex:
+    """레이어별 균일 격자 공간 인덱스 (XY 평면 격자, 거리 판정은 3D)"""
+
+    def __init__(self, cell_size=8.0):
+        self.cell_size = cell_size
+        # layer -> {(cx, cy): {obj: (x, y, z)}}
+        self._cells = {}
+        # layer -> {obj: ((cx, cy), (x, y, z))}
+        self._entries = {}
+
+    def _cell_of(self, x, y):
+        """좌표가 속한 격자 셀"""
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+
+    def _layer(self, layer):
+        """레이어 저장소 반환 (없으면 생성)"""
+        if layer not in self._cells:
+            self._cells[layer] = {}
+            self._entries[layer] = {}
+        return self._cells[layer], self._entries[layer]
+
+    def insert(self, layer, obj, pos):
+        """객체 등록 (이미 있으면 이동)"""
+        cells, entries = self._layer(layer)
+        if obj in entries:
+            self.move(layer, obj, pos)
+            return
+
+        point = (pos[0], pos[1], pos[2])
+        cell = self._cell_of(point[0], point[1])
+        cells.setdefault(cell, {})[obj] = point
+        entries[obj] = (cell, point)
+
+    def move(self, layer, obj, pos):
+        """객체 위치 갱신 (셀이 바뀔 때만 버킷 이동)"""
+        cells, entries = self._layer(layer)
+        entry = entries.get(obj)
+        if entry is None:
+            self.insert(layer, obj, pos)
+            return
+
+        old_cell = entry[0]
+        point = (pos[0], pos[1], pos[2])
+        cell = self._cell_of(point[0], point[1])
+
+        if cell != old_cell:
+            bucket = cells[old_cell]
+            del bucket[obj]
+            if not bucket:
+                del cells[old_cell]
+            cells.setdefault(cell, {})[obj] = point
+        else:
+            cells[cell][obj] = point
+
+        entries[obj] = (cell, point)
+
+    def remove(self, layer, obj):
+        """객체 제거 (없으면 무시)"""
+        cells, entries = self._layer(layer)
+        entry = entries.pop(obj, None)
+        if entry is None:
+            return False
+
+        bucket = cells[entry[0]]
+        del bucket[obj]
+        if not bucket:
+            del cells[entry[0]]
+        return True
+
+    def clear(self, layer=None):
+        """레이어 비우기 (layer가 None이면 전체)"""
+        if layer is None:
+            self._cells.clear()
+            self._entries.clear()
+        elif layer in self._cells:
+            self._cells[layer].clear()
+            self._entries[layer].clear()
+
+    def contains(self, layer, obj):
+        """등록 여부"""
+        return obj in self._entries.get(layer, ())
+
+    def count(self, layer):
+        """레이어에 등록된 객체 수"""
+        return len(self._entries.get(layer, ()))
+
+    def _ring_cells(self, cx, cy, ring):
+        """(cx, cy) 중심 체비셰프 거리 ring의 셀 좌표"""
+        if ring == 0:
+            yield (cx, cy)
+            return
+        for x in range(cx - ring, cx + ring + 1):
+            yield (x, cy - ring)
+            yield (x, cy + ring)
+        for y in range(cy - ring + 1, cy + ring):
+            yield (cx - ring, y)
+            yield (cx + ring, y)
+
+    def _max_ring(self, cells, cx, cy, max_dist):
+        """탐색할 최대 링 (max_dist가 없으면 레이어 전체를 덮는 범위)"""
+        if max_dist is not None:
+            return int(math.ceil(max_dist / self.cell_size))
+        if not cells:
+            return -1
+        reach = 0
+        for (x, y) in cells:
+            reach = max(reach, abs(x - cx), abs(y - cy))
+        return reach
+
+    def radius(self, layer, pos, r):
+        """반경 r 안의 객체 목록 [(obj, distance)] (가까운 순)"""
+        cells = self._cells.get(layer)
+        if not cells:
+            return []
+
+        px, py, pz = pos[0], pos[1], pos[2]
+        r_sq = r * r
+        min_cx, min_cy = self._cell_of(px - r, py - r)
+        max_cx, max_cy = self._cell_of(px + r, py + r)
+
+        found = []
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = cells.get((cx, cy))
+                if not bucket:
+                    continue
+                for obj, (x, y, z) in bucket.items():
+                    d_sq = (x - px) ** 2 + (y - py) ** 2 + (z - pz) ** 2
+                    if d_sq <= r_sq:
+                        found.append((d_sq, id(obj), obj))
+
+        found.sort()
+        return [(obj, math.sqrt(d_sq)) for d_sq, _, obj in found]
+
+    def nearest(self, layer, pos, max_dist=None):
+        """가장 가까운 객체 (obj, distance), 없으면 (None, None)"""
+        result = self.k_nearest(layer, pos, 1, max_dist)
+        if result:
+            return result[0]
+        return None, None
+
+    def k_nearest(self, layer, pos, k, max_dist=None):
+        """가까운 순 최대 k개 [(obj, distance)]"""
+        cells = self._cells.get(layer)
+        if not cells or k <= 0:
+            return []
+
+        px, py, pz = pos[0], pos[1], pos[2]
+        cx, cy = self._cell_of(px, py)
+        max_ring = self._max_ring(cells, cx, cy, max_dist)
+        max_dist_sq = max_dist * max_dist if max_dist is not None else float('inf')
+
+        # 최대 힙 (음수 거리)으로 상위 k개 유지
+        best = []
+        for ring in range(max_ring + 1):
+            for cell in self._ring_cells(cx, cy, ring):
+                bucket = cells.get(cell)
+                if not bucket:
+                    continue
+                for obj, (x, y, z) in bucket.items():
+                    d_sq = (x - px) ** 2 + (y - py) ** 2 + (z - pz) ** 2
+                    if d_sq > max_dist_sq:
+                        continue
+                    item = (-d_sq, id(obj), obj)
+                    if len(best) < k:
+                        heapq.heappush(best, item)
+                    elif d_sq < -best[0][0]:
+                        heapq.heapreplace(best, item)
+
+            # 다음 링의 셀은 모두 ring * cell_size 이상 떨어져 있음
+            if len(best) == k and -best[0][0] <= (ring * self.cell_size) ** 2:
+                break
+
+        best.sort(reverse=True)
+        return [(obj, math.sqrt(-neg_d_sq)) for neg_d_sq, _, obj in best]
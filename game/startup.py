@@ -0,0 +1,110 @@
+"""
+시작 시간 측정
+서브시스템별 import/생성 시간과 첫 프레임까지 걸린 시간(time-to-first-frame)을 기록
+STARTUP_PROFILE이 켜져 있으면 표로 출력하고 벤치마크 파일에 한 줄씩 남김
+"""
+from contextlib import contextmanager
+import importlib
+import json
+import os
+import time
+
+from game.config import STARTUP_PROFILE, BENCHMARK_PATH
+
+
+# import 시간을 따로 재는 모듈 (main.py의 import 순서와 같게)
+STARTUP_MODULES = (
+    'panda3d.core',
+    'direct.showbase.ShowBase',
+    'direct.gui.DirectGui',
+    'game.database',
+    'game.settings',
+    'game.telemetry',
+    'game.leaderboard',
+    'game.player',
+    'game.controls',
+    'game.chat',
+    'game.target',
+    'game.sound',
+    'game.obstacle',
+    'game.structures',
+    'game.daynight',
+    'game.enemy',
+    'game.resources',
+    'game.ground_items',
+    'game.inventory_ui',
+    'game.spatial',
+    'game.world',
+    'game.particles',
+    'game.hud',
+    'game.glyphs',
+    'game.kill_feed',
+    'game.assets',
+    'game.savegame',
+)
+
+
+def record_metric(name, value, **extra):
+    """벤치마크 결과 한 줄 추가 (JSON Lines)"""
+    os.makedirs(os.path.dirname(BENCHMARK_PATH), exist_ok=True)
+    entry = {'metric': name, 'value': round(value, 3), 'time': time.time()}
+    entry.update(extra)
+    with open(BENCHMARK_PATH, 'a') as f:
+        f.write(json.dumps(entry) + "\n")
+
+
+class StartupProfiler:
+    """시작 단계별 시간 기록"""
+
+    def __init__(self, process_start, enabled=STARTUP_PROFILE):
+        self.process_start = process_start
+        self.enabled = enabled
+        self.imports = {}      # 모듈 이름 -> import 시간 (ms, 처음 import할 때 의존 모듈 포함)
+        self.sections = {}     # 단계 이름 -> 생성 시간 (ms)
+        self.first_frame_ms = None
+
+    def profile_imports(self, modules):
+        """모듈을 순서대로 import하며 시간 측정 (프로필 모드에서만, 이후 import는 캐시)"""
+        if not self.enabled:
+            return
+        for module in modules:
+            start = time.perf_counter()
+            importlib.import_module(module)
+            self.imports[module] = (time.perf_counter() - start) * 1000.0
+
+    @contextmanager
+    def measure(self, name):
+        """with 블록의 실행 시간을 name 단계로 기록"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.sections[name] = self.sections.get(name, 0.0) + (time.perf_counter() - start) * 1000.0
+
+    def record(self, name, elapsed_ms):
+        """직접 잰 시간 기록 (비동기 단계 등)"""
+        self.sections[name] = elapsed_ms
+
+    def mark_first_frame(self):
+        """첫 프레임이 그려진 시점 기록"""
+        if self.first_frame_ms is not None:
+            return
+        self.first_frame_ms = (time.perf_counter() - self.process_start) * 1000.0
+        print(f"[Startup] 첫 프레임까지 {self.first_frame_ms:.0f}ms")
+
+        if self.enabled:
+            self.report()
+            record_metric(
+                'time_to_first_frame_ms', self.first_frame_ms,
+                imports={name: round(ms, 3) for name, ms in self.imports.items()},
+                sections={name: round(ms, 3) for name, ms in self.sections.items()},
+            )
+
+    def report(self):
+        """import/생성 시간 표 출력 (느린 순)"""
+        for title, table in (("import", self.imports), ("생성", self.sections)):
+            if not table:
+                continue
+            print(f"[Startup] {title} 시간 (합계 {sum(table.values()):.1f}ms)")
+            for name, ms in sorted(table.items(), key=lambda item: item[1], reverse=True):
+                print(f"[Startup]   {name:<24} {ms:8.1f}ms")
@@ -0,0 +1,125 @@
+"""
+구조물 설치 시스템
+조합한 구조물을 플레이어 앞 격자에 장애물로 설치 (재질별 정적 배치로 그림)
+"""
+from panda3d.core import Vec3
+import math
+
+
+# 구조물 정의 (size = (가로, 높이, 깊이), 플레이어가 +Y를 볼 때 기준)
+STRUCTURE_TYPES = {
+    'wall': {'size': (4, 3, 0.6), 'material': 'brick'},
+    'campfire': {'size': (1.5, 0.6, 1.5), 'material': 'stone'},
+    'ladder': {'size': (1.2, 4, 0.3), 'material': 'wood'},
+    'furnace': {'size': (2, 2, 2), 'material': 'stone'},
+}
+
+# 설치 격자 간격과 플레이어 앞 거리
+STRUCTURE_GRID = 1.0
+PLACE_DISTANCE = 4.0
+
+
+class StructureSystem:
+    """설치한 구조물 관리"""
+
+    def __init__(self, game):
+        self.game = game
+        self.structures = []  # 설치한 구조물 장애물
+
+        print("[StructureSystem] 구조물 시스템 초기화 완료")
+
+    def _snap(self, value):
+        """격자에 맞춤"""
+        return round(value / STRUCTURE_GRID) * STRUCTURE_GRID
+
+    def find_placements(self, item_type, count=1):
+        """플레이어 앞에 count개를 옆으로 나란히 놓을 위치 [(위치, 크기)] (막히면 None)"""
+        info = STRUCTURE_TYPES.get(item_type)
+        if info is None:
+            return None
+
+        player = self.game.player
+        player_pos = player.node.getPos()
+        heading_rad = math.radians(player.heading)
+        forward = Vec3(-math.sin(heading_rad), math.cos(heading_rad), 0)
+
+        # 방향은 90도 단위로 맞춤 (X축을 보면 가로/깊이 교환)
+        w, h, d = info['size']
+        facing_x = abs(forward.x) > abs(forward.y)
+        if facing_x:
+            w, d = d, w
+            step = Vec3(0, d, 0)
+        else:
+            step = Vec3(w, 0, 0)
+
+        origin = player_pos + forward * (PLACE_DISTANCE + max(w, d) / 2)
+        placements = []
+        for i in range(count):
+            offset = step * (i - (count - 1) / 2)
+            pos = Vec3(self._snap(origin.x + offset.x), self._snap(origin.y + offset.y), 0)
+
+            if self.game.world.is_out_of_bounds(pos):
+                return None
+            if self._overlaps(pos, (w, h, d)):
+                return None
+            placements.append((pos, (w, h, d)))
+
+        return placements
+
+    def _overlaps(self, pos, size):
+        """기존 장애물/플레이어와 겹치는지 (맞닿는 것은 허용)"""
+        if self.game.obstacles.overlaps_box(pos, size):
+            return True
+
+        player_pos = self.game.player.node.getPos()
+        return (abs(player_pos.x - pos.x) < size[0] / 2 + 0.5 and
+                abs(player_pos.y - pos.y) < size[2] / 2 + 0.5)
+
+    def place(self, item_type, placements):
+        """find_placements 결과대로 구조물 설치"""
+        material = STRUCTURE_TYPES[item_type]['material']
+        placed = []
+        for pos, size in placements:
+            obstacle = self.game.obstacles.add_obstacle(pos, size, item_type, material)
+            self.structures.append(obstacle)
+            placed.append(obstacle)
+
+        print(f"[StructureSystem] {item_type} x{len(placed)} 설치 (총 {len(self.structures)}개)")
+        return placed
+
+    def remove(self, obstacle):
+        """구조물 철거"""
+        if obstacle in self.structures:
+            self.structures.remove(obstacle)
+            self.game.obstacles.remove_obstacle(obstacle)
+
+    def clear(self):
+        """모든 구조물 철거"""
+        for obstacle in self.structures:
+            self.game.obstacles.remove_obstacle(obstacle)
+        self.structures.clear()
+
+    def reset(self):
+        """재시작 - 모든 구조물 철거"""
+        self.clear()
+
+    def save_state(self):
+        """세이브용 상태 (설치 위치와 회전이 반영된 크기)"""
+        return {'structures': [
+            (obstacle.type, *obstacle.position, *obstacle.size)
+            for obstacle in self.structures
+        ]}
+
+    def load_state(self, state):
+        """세이브 상태 적용 (현재 구조물은 모두 철거)"""
+        self.clear()
+        for item_type, x, y, z, w, h, d in state.get('structures', ()):
+            info = STRUCTURE_TYPES.get(item_type)
+            if info is None:
+                continue
+            obstacle = self.game.obstacles.add_obstacle(Vec3(x, y, z), (w, h, d), item_type, info['material'])
+            self.structures.append(obstacle)
+
+    def cleanup(self):
+        """정리 (장애물 자체는 ObstacleSystem이 정리)"""
+        self.structures.clear()
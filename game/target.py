@@ -4,6 +4,7 @@ from panda3d.core import (
 )
 from direct.gui.OnscreenText import OnscreenText
 from direct.task import Task
+from game.spatial import LAYER_TARGET
 import random
 import time
 
@@ -111,7 +112,7 @@ class Target:
             print("[Target] Hit!")
 
         # 명중 사운드 재생
-        self.game.sound.play('target_hit')
+        self.game.sound.play_at('target_hit', self.node)
 
         return True
 
@@ -154,6 +155,7 @@ class TargetSystem:
     def __init__(self, game):
         self.game = game
         self.targets = []
+        self.max_target_radius = 0.0  # 충돌 질의 반경 (가장 큰 표적 기준)
 
         # 기본적으로 표적을 생성하지 않음 (꺼진 상태)
         print("[TargetSystem] 표적 시스템 초기화 완료 (꺼진 상태)")
@@ -189,6 +191,8 @@ class TargetSystem:
         # 표적 생성
         target = Target(self.game, target_pos)
         self.targets.append(target)
+        self.game.spatial.insert(LAYER_TARGET, target, target_pos)
+        self.max_target_radius = max(self.max_target_radius, target.scale / 2)
 
         print(f"[TargetSystem] 표적 생성 완료 (위치: {target_pos:.1f}, 총 {len(self.targets)}개)")
 
@@ -197,10 +201,8 @@ class TargetSystem:
         모든 총알 위치에 대해 표적 충돌 체크
         bullet_pos: Point3 - 총알 위치
         """
-        for target in self.targets:
-            # 간단한 거리 체크로 충돌 판정
-            distance = (bullet_pos - target.node.getPos()).length()
-
+        nearby = self.game.spatial.radius(LAYER_TARGET, bullet_pos, self.max_target_radius)
+        for target, distance in nearby:
             if distance < target.scale / 2:
                 # 충돌! 히트 체크
                 hit = target.check_hit(bullet_pos)
@@ -223,10 +225,17 @@ class TargetSystem:
         for target in self.targets:
             target.cleanup()
         self.targets.clear()
+        self.game.spatial.clear(LAYER_TARGET)
+        self.max_target_radius = 0.0
         print("[TargetSystem] 모든 표적 제거")
 
+    def reset(self):
+        """재시작 - 모든 표적 제거"""
+        self.hide_targets()
+
     def cleanup(self):
         """정리"""
         for target in self.targets:
             target.cleanup()
         self.targets.clear()
+        self.game.spatial.clear(LAYER_TARGET)
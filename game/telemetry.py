@@ -0,0 +1,173 @@
+"""
+게임플레이 텔레메트리
+사격/명중/처치/피격/채집/조합/사망 이벤트를 미리 잡아 둔 열(column) 배열에 쌓고,
+몇 초마다 DB 쓰기 스레드로 한 번에 넘김 (행 변환과 INSERT는 쓰기 스레드에서)
+
+사용법:
+    game.telemetry.record('shot', weapon.name, pos.x, pos.y, pellets)
+"""
+from array import array
+import time
+
+from game.config import TELEMETRY_ENABLED, TELEMETRY_BUFFER_SIZE, TELEMETRY_FLUSH_INTERVAL
+
+
+# 이벤트 종류 (value 의미)
+EVENT_NAMES = (
+    'shot',     # 발사한 투사체 수 (subject = 무기)
+    'hit',      # 데미지 (subject = 무기)
+    'kill',     # 스폰부터 처치까지 걸린 시간 초 (subject = 적 타입)
+    'damage',   # 플레이어가 받은 데미지 (subject = 적 타입)
+    'gather',   # 채집량 (subject = 리소스)
+    'craft',    # 조합 개수 (subject = 아이템)
+    'death',    # 도달한 웨이브 (subject = 'player')
+)
+EVENT_CODES = {name: code for code, name in enumerate(EVENT_NAMES)}
+
+SQL_INSERT_EVENT = (
+    "INSERT INTO telemetry_events (session, t, event, subject, x, y, value) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+
+# 사망 위치 히트맵 칸 크기
+HEATMAP_CELL = 16.0
+
+
+class EventBuffer:
+    """고정 크기 열 배열 이벤트 버퍼 (기록 시 할당 없음, subject 문자열은 번호로 바꿔 저장)"""
+
+    def __init__(self, capacity=TELEMETRY_BUFFER_SIZE):
+        self.capacity = capacity
+        self.times = array('d', bytes(8 * capacity))
+        self.events = array('B', bytes(capacity))
+        self.subjects = array('i', bytes(4 * capacity))
+        self.xs = array('f', bytes(4 * capacity))
+        self.ys = array('f', bytes(4 * capacity))
+        self.values = array('f', bytes(4 * capacity))
+        self.count = 0
+
+        self.subject_ids = {}     # 문자열 -> 번호
+        self.subject_names = []   # 번호 -> 문자열 (추가만 하므로 다른 스레드에서 읽어도 안전)
+
+    def record(self, t, event, subject, x, y, value):
+        """이벤트 한 개 기록 (가득 찼으면 False)"""
+        i = self.count
+        if i == self.capacity:
+            return False
+
+        subject_id = self.subject_ids.get(subject)
+        if subject_id is None:
+            subject_id = self.subject_ids[subject] = len(self.subject_names)
+            self.subject_names.append(subject)
+
+        self.times[i] = t
+        self.events[i] = EVENT_CODES[event]
+        self.subjects[i] = subject_id
+        self.xs[i] = x
+        self.ys[i] = y
+        self.values[i] = value
+        self.count = i + 1
+        return True
+
+    def drain(self):
+        """쌓인 열을 복사해 반환하고 비움 (복사는 배열 메모리 복사 한 번씩)"""
+        n = self.count
+        columns = (
+            self.times[:n], self.events[:n], self.subjects[:n],
+            self.xs[:n], self.ys[:n], self.values[:n],
+        )
+        self.count = 0
+        return columns
+
+    def rows(self, session, columns):
+        """drain 결과 -> INSERT 행 (쓰기 스레드에서 순회)"""
+        names = self.subject_names
+        for t, event, subject, x, y, value in zip(*columns):
+            yield (session, t, EVENT_NAMES[event], names[subject], x, y, value)
+
+
+class Telemetry:
+    """게임플레이 이벤트 로그"""
+
+    def __init__(self, game):
+        self.game = game
+        self.enabled = TELEMETRY_ENABLED
+        self.session = int(time.time())
+        self.start = time.perf_counter()
+        self.buffer = EventBuffer()
+        self.recorded = 0
+        self.flushes = 0
+
+        if self.enabled:
+            game.taskMgr.doMethodLater(TELEMETRY_FLUSH_INTERVAL, self._flush_task, 'telemetry_flush')
+
+        print(f"[Telemetry] 이벤트 로그 {'활성화' if self.enabled else '비활성화'} (세션 {self.session})")
+
+    def record(self, event, subject, x=0.0, y=0.0, value=0.0):
+        """이벤트 기록 (버퍼가 가득 차면 바로 내보내고 다시 기록)"""
+        if not self.enabled:
+            return
+        t = time.perf_counter() - self.start
+        if not self.buffer.record(t, event, subject, x, y, value):
+            self.flush()
+            self.buffer.record(t, event, subject, x, y, value)
+        self.recorded += 1
+
+    def flush(self):
+        """쌓인 이벤트를 DB 쓰기 스레드로 넘김"""
+        if self.buffer.count == 0:
+            return
+        columns = self.buffer.drain()
+        self.game.db.writer.submit_many(SQL_INSERT_EVENT, self.buffer.rows(self.session, columns))
+        self.flushes += 1
+
+    def _flush_task(self, task):
+        """주기적으로 내보내기"""
+        self.flush()
+        return task.again
+
+    # ===== 분석 질의 (메뉴/채팅용, 호출 전에 쌓인 이벤트를 디스크에 반영) =====
+
+    def _sync(self):
+        """지금까지의 이벤트를 디스크에 반영 (쓰기 스레드 대기)"""
+        self.flush()
+        self.game.db.flush()
+
+    def accuracy_per_weapon(self):
+        """무기별 [(무기, 발사 수, 명중 수, 명중률)]"""
+        self._sync()
+        rows = self.game.db.query(
+            "SELECT subject, "
+            "SUM(CASE WHEN event = 'shot' THEN value ELSE 0 END), "
+            "SUM(CASE WHEN event = 'hit' THEN 1 ELSE 0 END) "
+            "FROM telemetry_events WHERE event IN ('shot', 'hit') "
+            "GROUP BY subject ORDER BY subject"
+        )
+        return [
+            (weapon, int(shots), hits, hits / shots if shots else 0.0)
+            for weapon, shots, hits in rows
+        ]
+
+    def time_to_kill(self):
+        """적 타입별 [(타입, 처치 수, 평균 처치 시간 초)]"""
+        self._sync()
+        return self.game.db.query(
+            "SELECT subject, COUNT(*), AVG(value) FROM telemetry_events "
+            "WHERE event = 'kill' GROUP BY subject ORDER BY subject"
+        )
+
+    def death_heatmap(self, cell=HEATMAP_CELL, limit=10):
+        """사망 위치 히트맵 [(칸 x, 칸 y, 사망 수)] (많은 순)"""
+        self._sync()
+        return self.game.db.query(
+            "SELECT CAST(ROUND(x / ?) AS INTEGER) AS cx, CAST(ROUND(y / ?) AS INTEGER) AS cy, "
+            "COUNT(*) AS deaths FROM telemetry_events WHERE event = 'death' "
+            "GROUP BY cx, cy ORDER BY deaths DESC LIMIT ?",
+            (cell, cell, limit)
+        )
+
+    def cleanup(self):
+        """남은 이벤트 내보내기 (DB를 닫기 전에 호출)"""
+        self.game.taskMgr.remove('telemetry_flush')
+        self.flush()
+        print(f"[Telemetry] 이벤트 {self.recorded}개 기록 ({self.flushes}회 내보냄)")
@@ -4,7 +4,8 @@
 """
 import math
 import random
-from panda3d.core import Vec3, CardMaker, TransparencyAttrib
+from panda3d.core import Vec3, Point2, CardMaker, TransparencyAttrib
+from game.observable import Observable, Observed
 
 
 # 발사 모드
@@ -115,9 +116,17 @@ class Attachment:
         return f"Attachment({self.name})"
 
 
-class Weapon:
+class Weapon(Observed):
     """무기 기본 클래스"""
 
+    # HUD에 표시되는 값 (바뀌면 관찰자에게 알림)
+    current_fire_mode = Observable()
+    magazine_size = Observable()
+    current_ammo = Observable()
+    total_ammo = Observable()
+    durability = Observable()
+    broken = Observable()
+
     def __init__(self, name, weapon_type):
         self.name = name
         self.weapon_type = weapon_type
@@ -207,23 +216,21 @@ class Weapon:
             self.broken = True
             print(f"[Weapon] {self.name} 내구도 소진! 고장남!")
 
-        # 총알 생성
+        # 총알 생성 (아틀라스가 있으면 UV를 스프라이트 영역으로 - 모든 총알이 같은 텍스처 상태 공유)
+        bullet_texture, (u0, v0, u1, v1) = game.assets.sprite('bullet')
         cm = CardMaker('bullet')
         cm.setFrame(*self.bullet_size)
+        cm.setUvRange(Point2(u0, v0), Point2(u1, v1))
         bullet = game.render.attachNewNode(cm.generate())
 
         # 항상 카메라를 향하도록 (Billboarding)
         bullet.setBillboardPointEye()
         bullet.setTransparency(TransparencyAttrib.MAlpha)
 
-        # 텍스처 적용 시도
-        try:
-            bullet_texture = game.loader.loadTexture("textures/bullet.png")
-            if bullet_texture:
-                bullet.setTexture(bullet_texture)
-            else:
-                bullet.setColor(*self.color, 1.0)
-        except:
+        # 텍스처 적용 (캐시에 없으면 무기 색상)
+        if bullet_texture:
+            bullet.setTexture(bullet_texture)
+        else:
             bullet.setColor(*self.color, 1.0)
 
         bullet.setPos(start_pos)
@@ -255,6 +262,7 @@ class Weapon:
             'speed': self.bullet_speed,
             'lifetime': 3.0,
             'damage': int(damage),
+            'weapon': self.name,
             'is_crit': is_crit,
             'is_headshot': is_headshot
         }
@@ -568,21 +576,19 @@ class Shotgun(Weapon):
         bullets = []
         total_recoil = 0
 
-        # 여러 발의 산탄 발사
+        # 여러 발의 산탄 발사 (카드 모양은 한 번만 설정)
+        bullet_texture, (u0, v0, u1, v1) = game.assets.sprite('bullet')
+        cm = CardMaker('bullet')
+        cm.setFrame(*self.bullet_size)
+        cm.setUvRange(Point2(u0, v0), Point2(u1, v1))
         for _ in range(self.pellet_count):
-            cm = CardMaker('bullet')
-            cm.setFrame(*self.bullet_size)
             bullet = game.render.attachNewNode(cm.generate())
             bullet.setBillboardPointEye()
             bullet.setTransparency(TransparencyAttrib.MAlpha)
 
-            try:
-                bullet_texture = game.loader.loadTexture("textures/bullet.png")
-                if bullet_texture:
-                    bullet.setTexture(bullet_texture)
-                else:
-                    bullet.setColor(*self.color, 1.0)
-            except:
+            if bullet_texture:
+                bullet.setTexture(bullet_texture)
+            else:
                 bullet.setColor(*self.color, 1.0)
 
             bullet.setPos(start_pos)
@@ -612,6 +618,7 @@ class Shotgun(Weapon):
                 'speed': self.bullet_speed,
                 'lifetime': 3.0,
                 'damage': int(damage),
+                'weapon': self.name,
                 'is_crit': is_crit,
                 'is_headshot': is_headshot
             }
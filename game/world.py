@@ -0,0 +1,302 @@
+"""
+청크 월드
+고정 크기 청크를 시드로부터 결정론적으로 생성하고 플레이어 주변만 스트리밍
+"""
+from panda3d.core import CardMaker, Texture, Vec3, Point2
+from collections import deque
+import random
+import math
+import time
+
+from game.config import (
+    WORLD_SEED,
+    CHUNK_SIZE,
+    VIEW_RADIUS_CHUNKS,
+    MAX_LOADED_CHUNKS,
+    CHUNK_BUILD_BUDGET_MS,
+    WORLD_RADIUS_CHUNKS,
+)
+
+
+# 바닥 텍스처 한 장이 덮는 월드 크기 (기존 200x200 바닥에 20x20 타일링과 동일)
+FLOOR_TILE_SIZE = 10.0
+
+# 청크당 장애물 구성 (크기, 타입)
+CHUNK_OBSTACLE_TYPES = [
+    ((2, 2, 2), "crate"),
+    ((3, 3, 3), "crate"),
+    ((2, 6, 2), "pillar"),
+]
+
+
+class Chunk:
+    """월드 청크 하나 (바닥, 리소스, 장애물 소유)"""
+
+    def __init__(self, key, size):
+        self.key = key  # (cx, cy)
+        self.size = size
+        self.min_x = key[0] * size
+        self.min_y = key[1] * size
+        self.max_x = self.min_x + size
+        self.max_y = self.min_y + size
+
+        self.floor = None
+        self.resources = []
+        self.obstacles = []
+        self.placement = None  # 청크 리소스 배치 샘플러 (ResourceSystem이 설정)
+        self.resources_changed = False  # 시드로 만든 배치에서 리소스가 바뀌었는지 (고갈/재스폰/불러오기)
+        self.loaded = False
+
+    def contains(self, x, y):
+        """좌표가 청크 안에 있는지"""
+        return self.min_x <= x < self.max_x and self.min_y <= y < self.max_y
+
+
+class World:
+    """청크 스트리밍 월드 관리자"""
+
+    def __init__(self, game):
+        self.game = game
+        self.seed = WORLD_SEED
+        self.chunk_size = CHUNK_SIZE
+        self.view_radius = VIEW_RADIUS_CHUNKS
+        self.max_loaded = max(MAX_LOADED_CHUNKS, (2 * self.view_radius + 1) ** 2)
+        self.build_budget = CHUNK_BUILD_BUDGET_MS / 1000.0
+        self.world_radius = WORLD_RADIUS_CHUNKS
+
+        # 청크 상태
+        self.chunks = {}          # (cx, cy) -> Chunk (로드 완료 + 생성 중)
+        self.build_queue = deque()  # 생성 대기 (Chunk, 단계별 생성기)
+        self.center = None        # 마지막으로 계산한 플레이어 청크
+
+        # 월드 루트 노드
+        self.root = self.game.render.attachNewNode('world')
+
+        # 청크 바닥 공용 텍스처 (한 번만 로드)
+        self.floor_texture = self.game.assets.texture('stone')
+        if self.floor_texture:
+            self.floor_texture.setWrapU(Texture.WMRepeat)
+            self.floor_texture.setWrapV(Texture.WMRepeat)
+
+        print(f"[World] 청크 월드 초기화 (시드: {self.seed}, 청크 {self.chunk_size:.0f}, 반경 {self.view_radius})")
+
+    # ---- 좌표 / 경계 ----
+
+    def chunk_key(self, x, y):
+        """좌표가 속한 청크 키"""
+        return (math.floor(x / self.chunk_size), math.floor(y / self.chunk_size))
+
+    def chunk_seed(self, key):
+        """청크별 시드 (월드 시드와 청크 좌표로 결정)"""
+        cx, cy = key
+        return (self.seed * 73856093 ^ cx * 19349663 ^ cy * 83492791) & 0xFFFFFFFF
+
+    def get_bounds(self):
+        """월드 경계 (min, max) - 정사각형"""
+        extent = self.world_radius * self.chunk_size
+        return -extent, extent
+
+    def is_out_of_bounds(self, pos):
+        """월드 경계를 벗어났는지"""
+        low, high = self.get_bounds()
+        return pos.x < low or pos.x > high or pos.y < low or pos.y > high
+
+    def clamp_to_bounds(self, x, y, margin=10.0):
+        """좌표를 월드 경계 안으로 제한"""
+        low, high = self.get_bounds()
+        low += margin
+        high -= margin
+        return max(low, min(high, x)), max(low, min(high, y))
+
+    def is_loaded(self, x, y):
+        """좌표의 청크가 생성 완료되었는지"""
+        chunk = self.chunks.get(self.chunk_key(x, y))
+        return chunk is not None and chunk.loaded
+
+    def _in_world(self, key):
+        """청크가 월드 경계 안인지"""
+        return -self.world_radius <= key[0] < self.world_radius and \
+            -self.world_radius <= key[1] < self.world_radius
+
+    # ---- 스트리밍 ----
+
+    def load_around(self, pos):
+        """pos 주변 3x3 청크를 즉시 생성 (시작/재시작 시 발밑이 비지 않도록)"""
+        cx, cy = self.chunk_key(pos.x, pos.y)
+        for key in self._keys_in_radius(cx, cy, 1):
+            chunk = self._request_chunk(key)
+            if chunk and not chunk.loaded:
+                self._finish_build(chunk)
+        self.center = None  # 다음 update에서 나머지 반경 예약
+
+    def update(self, dt):
+        """플레이어 청크가 바뀌면 로드/언로드 갱신, 생성 대기열을 시간 예산만큼 처리"""
+        pos = self.game.player.node.getPos()
+        center = self.chunk_key(pos.x, pos.y)
+
+        if center != self.center:
+            self.center = center
+            self._refresh(center)
+
+        self._process_queue()
+
+    def _keys_in_radius(self, cx, cy, radius):
+        """중심 청크 기준 반경 내 청크 키 (가까운 순)"""
+        keys = [
+            (cx + dx, cy + dy)
+            for dy in range(-radius, radius + 1)
+            for dx in range(-radius, radius + 1)
+        ]
+        keys.sort(key=lambda k: (k[0] - cx) ** 2 + (k[1] - cy) ** 2)
+        return [k for k in keys if self._in_world(k)]
+
+    def _refresh(self, center):
+        """시야 반경 청크 예약 + 멀어진 청크 해제"""
+        cx, cy = center
+
+        # 새로 필요한 청크 예약 (가까운 순)
+        for key in self._keys_in_radius(cx, cy, self.view_radius):
+            self._request_chunk(key)
+
+        # 시야 반경 + 1 밖의 청크 해제 (경계에서 왔다갔다할 때 재생성 방지)
+        keep = self.view_radius + 1
+        for key in list(self.chunks):
+            if max(abs(key[0] - cx), abs(key[1] - cy)) > keep:
+                self._unload_chunk(key)
+
+        # 메모리 예산 초과 시 먼 청크부터 해제
+        if len(self.chunks) > self.max_loaded:
+            far_first = sorted(
+                self.chunks,
+                key=lambda k: (k[0] - cx) ** 2 + (k[1] - cy) ** 2,
+                reverse=True
+            )
+            for key in far_first[:len(self.chunks) - self.max_loaded]:
+                self._unload_chunk(key)
+
+    def _request_chunk(self, key):
+        """청크 생성 예약 (이미 있으면 그대로 반환)"""
+        chunk = self.chunks.get(key)
+        if chunk is not None:
+            return chunk
+        if not self._in_world(key):
+            return None
+
+        chunk = Chunk(key, self.chunk_size)
+        self.chunks[key] = chunk
+        self.build_queue.append((chunk, self._build_steps(chunk)))
+        return chunk
+
+    def _process_queue(self):
+        """대기열의 청크 생성을 프레임 시간 예산 안에서 단계별로 진행"""
+        if not self.build_queue:
+            return
+
+        start = time.perf_counter()
+        while self.build_queue and time.perf_counter() - start < self.build_budget:
+            chunk, steps = self.build_queue[0]
+            if not next(steps, False):
+                self.build_queue.popleft()
+
+    def _finish_build(self, chunk):
+        """예약된 청크를 지금 바로 끝까지 생성"""
+        for i, (queued, steps) in enumerate(self.build_queue):
+            if queued is chunk:
+                for _ in steps:
+                    pass
+                del self.build_queue[i]
+                return
+
+    def _build_steps(self, chunk):
+        """청크 생성 (단계마다 yield - 한 프레임에 몰리지 않도록)"""
+        rng = random.Random(self.chunk_seed(chunk.key))
+
+        self._create_floor(chunk)
+        yield True
+
+        self.game.resources.spawn_chunk(chunk, rng)
+        yield True
+
+        self._spawn_obstacles(chunk, rng)
+        self.game.resources.restore_chunk(chunk)
+        chunk.loaded = True
+        yield True
+
+    def _create_floor(self, chunk):
+        """청크 바닥 (월드 좌표 기준 UV로 청크 경계에서 무늬가 이어짐)"""
+        cm = CardMaker(f'floor_{chunk.key[0]}_{chunk.key[1]}')
+        cm.setFrame(chunk.min_x, chunk.max_x, chunk.min_y, chunk.max_y)
+        cm.setUvRange(
+            Point2(chunk.min_x / FLOOR_TILE_SIZE, chunk.min_y / FLOOR_TILE_SIZE),
+            Point2(chunk.max_x / FLOOR_TILE_SIZE, chunk.max_y / FLOOR_TILE_SIZE)
+        )
+
+        chunk.floor = self.root.attachNewNode(cm.generate())
+        chunk.floor.setP(-90)  # 수평으로 회전
+        chunk.floor.setZ(-0.1)
+
+        if self.floor_texture:
+            chunk.floor.setTexture(self.floor_texture)
+
+    def _spawn_obstacles(self, chunk, rng):
+        """청크 장애물 생성 (리소스 배치 격자에서 자리 확보)"""
+        count = rng.randint(0, 2)
+        for _ in range(count):
+            point = chunk.placement.find_free_point() if chunk.placement else None
+            if point is None:
+                break
+            size, obs_type = CHUNK_OBSTACLE_TYPES[rng.randrange(len(CHUNK_OBSTACLE_TYPES))]
+            obstacle = self.game.obstacles.add_obstacle(Vec3(point[0], point[1], 0), size, obs_type)
+            chunk.obstacles.append(obstacle)
+
+    def _unload_chunk(self, key):
+        """청크 해제 (생성 중이면 대기열에서도 제거)"""
+        chunk = self.chunks.pop(key, None)
+        if chunk is None:
+            return
+
+        for i, (queued, steps) in enumerate(self.build_queue):
+            if queued is chunk:
+                steps.close()
+                del self.build_queue[i]
+                break
+
+        self.game.resources.despawn_chunk(chunk)
+
+        for obstacle in chunk.obstacles:
+            self.game.obstacles.remove_obstacle(obstacle)
+        chunk.obstacles.clear()
+
+        if chunk.floor:
+            chunk.floor.removeNode()
+            chunk.floor = None
+        chunk.loaded = False
+
+    def get_stats(self):
+        """스트리밍 상태"""
+        return {
+            'loaded': sum(1 for c in self.chunks.values() if c.loaded),
+            'pending': len(self.build_queue),
+            'budget': self.max_loaded,
+        }
+
+    def reset(self):
+        """재시작 - 플레이어 주변 3x3 청크만 남김 (리소스가 바뀐 청크만 시드로 다시 생성, 나머지는 그대로 재사용)"""
+        pos = self.game.player.node.getPos()
+        cx, cy = self.chunk_key(pos.x, pos.y)
+        keep = set(self._keys_in_radius(cx, cy, 1))
+        for key, chunk in list(self.chunks.items()):
+            if key not in keep or not chunk.loaded or chunk.resources_changed:
+                self._unload_chunk(key)
+        self.center = None
+        self.load_around(pos)
+
+    def cleanup(self):
+        """정리"""
+        for key in list(self.chunks):
+            self._unload_chunk(key)
+        self.build_queue.clear()
+        if self.root:
+            self.root.removeNode()
+            self.root = None
+        print("[World] 청크 월드 정리 완료")
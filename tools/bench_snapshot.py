@@ -0,0 +1,106 @@
+"""
+세이브 스냅샷 벤치마크
+큰 월드(생성된 청크 수, 적, 바닥 아이템, 구조물)를 흉내 낸 상태로
+직렬화/압축 시간, 불러오기 시간, 파일 크기를 측정해 data/benchmarks.jsonl에 기록
+
+사용법:
+    python tools/bench_snapshot.py [청크 수]
+"""
+import os
+import random
+import sys
+import time
+
+# 프로젝트 루트를 path에 추가
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from game.config import CHUNK_SIZE
+from game.startup import record_metric
+from game.savegame import pack_snapshot, unpack_snapshot
+
+
+RESOURCES_PER_CHUNK = 10
+ENEMIES = 20
+GROUND_ITEMS = 200
+STRUCTURES = 500
+REPEAT = 5
+
+
+def make_state(chunk_count, rng):
+    """청크 chunk_count개가 생성된 월드의 세이브 상태"""
+    side = max(1, int(chunk_count ** 0.5))
+    chunks = [(i % side - side // 2, i // side - side // 2) for i in range(chunk_count)]
+
+    def point_in(key):
+        return (key[0] * CHUNK_SIZE + rng.uniform(0, CHUNK_SIZE),
+                key[1] * CHUNK_SIZE + rng.uniform(0, CHUNK_SIZE))
+
+    resources = []
+    for key in chunks:
+        for _ in range(RESOURCES_PER_CHUNK):
+            x, y = point_in(key)
+            resources.append((rng.choice(('wood', 'stone')), x, y, float(rng.randint(1, 200))))
+
+    return {
+        'player': [(10.0, 20.0, 0.0, 90.0, 10.0, 80.0, 50.0, 75.0, 60.0, 1, 0)],
+        'inventory': [('wood', 120), ('stone', 45)],
+        'tools': [(0, 'axe', 420.0), (1, 'pickaxe', 10.0)],
+        'weapons': [
+            ('pistol', 700.0, 12, 120, 'semi', '', '', '', ''),
+            ('rifle', 950.0, 30, 300, 'auto', 'red_dot', 'foregrip', 'suppressor', 'extended_mag'),
+        ],
+        'enemies': [
+            (rng.choice(('melee', 'ranged', 'tank')), rng.uniform(-50, 50), rng.uniform(-50, 50), 0.0,
+             100.0, 130.0, 13.0)
+            for _ in range(ENEMIES)
+        ],
+        'wave': [(7, 12.5, 3.0, 11, 48200, 312)],
+        'resources': resources,
+        'chunks': chunks,
+        'ground_items': [
+            ('resource', rng.choice(('wood', 'stone')), 10.0, rng.uniform(-50, 50), rng.uniform(-50, 50), 0.0,
+             rng.uniform(0, 300))
+            for _ in range(GROUND_ITEMS)
+        ],
+        'structures': [
+            ('wall', float(rng.randint(-100, 100)), float(rng.randint(-100, 100)), 0.0, 4.0, 3.0, 0.6)
+            for _ in range(STRUCTURES)
+        ],
+        'time': [(815.25, 4055.25)],
+    }
+
+
+def best_of(func, *args):
+    """REPEAT번 실행 중 가장 빠른 시간 (ms)과 마지막 결과"""
+    best = None
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        result = func(*args)
+        elapsed = (time.perf_counter() - start) * 1000.0
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    chunk_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1024
+
+    state = make_state(chunk_count, random.Random(1337))
+    records = sum(len(values) for values in state.values())
+
+    save_ms, data = best_of(pack_snapshot, state)
+    load_ms, loaded = best_of(unpack_snapshot, data)
+    assert len(loaded['resources']) == len(state['resources'])
+
+    print(f"[Bench] 청크 {chunk_count}개, 레코드 {records}개")
+    print(f"[Bench]   직렬화 + 압축 (백그라운드):  {save_ms:8.2f}ms")
+    print(f"[Bench]   압축 해제 + 읽기:            {load_ms:8.2f}ms")
+    print(f"[Bench]   파일 크기:                   {len(data):8d} bytes ({len(data) / records:.1f} bytes / 레코드)")
+
+    record_metric('snapshot_save_ms', save_ms, chunks=chunk_count, records=records)
+    record_metric('snapshot_load_ms', load_ms, chunks=chunk_count, records=records)
+    record_metric('snapshot_bytes', len(data), chunks=chunk_count, records=records)
+
+
+if __name__ == '__main__':
+    main()
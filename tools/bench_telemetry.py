@@ -0,0 +1,73 @@
+"""
+텔레메트리 벤치마크
+이벤트 한 개 기록 비용(게임 스레드)과 행 변환 + INSERT 비용(쓰기 스레드)을 측정해
+data/benchmarks.jsonl에 기록
+
+사용법:
+    python tools/bench_telemetry.py [이벤트 수]
+"""
+import os
+import sqlite3
+import sys
+import time
+
+# 프로젝트 루트를 path에 추가
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from game.startup import record_metric
+from game.telemetry import EventBuffer, EVENT_NAMES, SQL_INSERT_EVENT
+
+
+SUBJECTS = ('Pistol', 'Shotgun', 'melee', 'ranged', 'wood', 'stone', 'axe')
+
+
+def bench_record(count):
+    """EventBuffer.record 한 번당 시간 (ns)"""
+    buffer = EventBuffer(capacity=count)
+    events = [(EVENT_NAMES[i % len(EVENT_NAMES)], SUBJECTS[i % len(SUBJECTS)]) for i in range(count)]
+
+    start = time.perf_counter()
+    for i, (event, subject) in enumerate(events):
+        buffer.record(i * 0.016, event, subject, 1.0, 2.0, 3.0)
+    elapsed = time.perf_counter() - start
+    return buffer, elapsed / count * 1e9
+
+
+def bench_flush(buffer, count):
+    """drain(게임 스레드) 시간, 행 변환 + INSERT(쓰기 스레드) 이벤트당 시간 (ns)"""
+    start = time.perf_counter()
+    columns = buffer.drain()
+    drain_ms = (time.perf_counter() - start) * 1000.0
+
+    conn = sqlite3.connect(":memory:")
+    conn.execute(
+        "CREATE TABLE telemetry_events "
+        "(session INTEGER, t REAL, event TEXT, subject TEXT, x REAL, y REAL, value REAL)"
+    )
+    start = time.perf_counter()
+    conn.executemany(SQL_INSERT_EVENT, buffer.rows(1, columns))
+    conn.commit()
+    insert_ns = (time.perf_counter() - start) / count * 1e9
+    conn.close()
+    return drain_ms, insert_ns
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    buffer, record_ns = bench_record(count)
+    drain_ms, insert_ns = bench_flush(buffer, count)
+
+    print(f"[Bench] 이벤트 {count}개")
+    print(f"[Bench]   기록 (게임 스레드):       {record_ns:8.0f}ns / 이벤트")
+    print(f"[Bench]   drain (게임 스레드):      {drain_ms:8.2f}ms / {count}개")
+    print(f"[Bench]   INSERT (쓰기 스레드):     {insert_ns:8.0f}ns / 이벤트")
+
+    record_metric('telemetry_record_ns', record_ns, events=count)
+    record_metric('telemetry_drain_ms', drain_ms, events=count)
+    record_metric('telemetry_insert_ns', insert_ns, events=count)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+"""
+텍스처 아틀라스 빌드 도구 (오프라인)
+빌보드/HUD 스프라이트를 아틀라스 한 장으로 묶고, 밉맵을 미리 만든 .txo 캐시를 생성
+
+사용법:
+    python tools/build_atlas.py
+
+결과:
+    textures/cache/sprites.txo   - 스프라이트 아틀라스 (밉맵 포함)
+    textures/cache/sprites.json  - 스프라이트 이름 -> UV 사각형 (u0, v0, u1, v1)
+    textures/cache/<이름>.txo    - 반복(타일링) 텍스처 개별 캐시 (밉맵 포함)
+"""
+from panda3d.core import Filename, PNMImage, SamplerState, Texture
+import json
+import os
+import sys
+
+# 프로젝트 루트를 path에 추가
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from game.assets import ASSET_MANIFEST, ATLAS_NAME, ATLAS_SPRITES, CACHE_DIR
+
+
+# 스프라이트 사이 여백 (밉맵에서 이웃 스프라이트가 번지지 않게)
+PADDING = 4
+MAX_ATLAS_SIZE = 4096
+
+
+def next_power_of_two(value):
+    """value 이상인 가장 작은 2의 거듭제곱"""
+    size = 1
+    while size < value:
+        size *= 2
+    return size
+
+
+def pack(images, width):
+    """선반(shelf) 방식 배치 - 높이 순으로 줄을 채움 {이름: (x, y)}, 전체 높이"""
+    placements = {}
+    x = y = shelf_h = 0
+    for name, image in sorted(images.items(), key=lambda item: -item[1].getYSize()):
+        w = image.getXSize() + PADDING * 2
+        h = image.getYSize() + PADDING * 2
+        if x + w > width:
+            x = 0
+            y += shelf_h
+            shelf_h = 0
+        placements[name] = (x + PADDING, y + PADDING)
+        x += w
+        shelf_h = max(shelf_h, h)
+    return placements, y + shelf_h
+
+
+def write_txo(image, path, name, wrap=SamplerState.WM_clamp):
+    """PNMImage -> 밉맵을 미리 만든 .txo"""
+    texture = Texture(name)
+    texture.load(image)
+    texture.setWrapU(wrap)
+    texture.setWrapV(wrap)
+    texture.setMinfilter(SamplerState.FT_linear_mipmap_linear)
+    texture.generateRamMipmapImages()
+    texture.write(Filename.fromOsSpecific(path))
+
+
+def build_atlas(cache_dir):
+    """스프라이트 아틀라스 생성"""
+    images = {}
+    for name in ATLAS_SPRITES:
+        path = os.path.join(ROOT, ASSET_MANIFEST['textures'][name])
+        if not os.path.exists(path):
+            print(f"[Atlas] 파일 없음 (건너뜀): {path}")
+            continue
+        image = PNMImage()
+        image.read(Filename.fromOsSpecific(path))
+        if not image.hasAlpha():
+            image.addAlpha()
+            image.alphaFill(1.0)
+        images[name] = image
+
+    if not images:
+        print("[Atlas] 묶을 스프라이트가 없습니다")
+        return
+
+    # 가장 넓은 스프라이트가 들어가는 폭부터 시작해서 정사각형에 가깝게 맞춤
+    width = next_power_of_two(max(image.getXSize() for image in images.values()) + PADDING * 2)
+    while True:
+        placements, height = pack(images, width)
+        if height <= width or width >= MAX_ATLAS_SIZE:
+            break
+        width *= 2
+    height = next_power_of_two(height)
+
+    atlas = PNMImage(width, height, 4)
+    atlas.fill(0, 0, 0)
+    atlas.alphaFill(0)
+
+    rects = {}
+    for name, (x, y) in placements.items():
+        image = images[name]
+        w, h = image.getXSize(), image.getYSize()
+        atlas.copySubImage(image, x, y)
+        # Panda3D UV는 아래에서 위로 (PNMImage는 위에서 아래로)
+        rects[name] = [
+            x / width,
+            1.0 - (y + h) / height,
+            (x + w) / width,
+            1.0 - y / height,
+        ]
+
+    write_txo(atlas, os.path.join(cache_dir, f"{ATLAS_NAME}.txo"), ATLAS_NAME)
+    with open(os.path.join(cache_dir, f"{ATLAS_NAME}.json"), 'w') as f:
+        json.dump({'size': [width, height], 'sprites': rects}, f, indent=2)
+
+    print(f"[Atlas] {ATLAS_NAME}: {len(rects)}개 스프라이트 -> {width}x{height}")
+
+
+def build_texture_caches(cache_dir):
+    """아틀라스에 넣지 않는(반복 타일링) 텍스처의 개별 .txo 캐시 생성"""
+    for name, rel_path in ASSET_MANIFEST['textures'].items():
+        if name in ATLAS_SPRITES:
+            continue
+        path = os.path.join(ROOT, rel_path)
+        if not os.path.exists(path):
+            continue
+        image = PNMImage()
+        image.read(Filename.fromOsSpecific(path))
+        write_txo(image, os.path.join(cache_dir, f"{name}.txo"), name, SamplerState.WM_repeat)
+        print(f"[Atlas] 캐시: {name}.txo ({image.getXSize()}x{image.getYSize()})")
+
+
+def main():
+    cache_dir = os.path.join(ROOT, CACHE_DIR)
+    os.makedirs(cache_dir, exist_ok=True)
+    build_atlas(cache_dir)
+    build_texture_caches(cache_dir)
+
+
+if __name__ == '__main__':
+    main()